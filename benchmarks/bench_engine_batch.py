@@ -0,0 +1,91 @@
+import argparse
+import random
+import time
+
+from eight_characters.engine import (
+    ALLOWED_ENGINE_PRECISIONS,
+    PRECISION_AUTO,
+    compute_engine_payload,
+    compute_engine_payloads,
+    resolve_engine_sections,
+)
+from eight_characters.time_convert import BirthInput
+
+
+ZONES = (
+    ('Asia/Shanghai', 116.4074, 39.9042),
+    ('Asia/Hong_Kong', 114.1694, 22.3193),
+    ('Europe/Helsinki', 24.9384, 60.1699),
+    ('America/New_York', -74.006, 40.7128),
+    ('Australia/Sydney', 151.2093, -33.8688),
+)
+
+
+def synthetic_births(count: int, seed: int, first_year: int, last_year: int) -> list[BirthInput]:
+    rng = random.Random(seed)
+    births = []
+    for _ in range(count):
+        timezone_name, longitude, latitude = rng.choice(ZONES)
+        births.append(
+            BirthInput(
+                year=rng.randint(first_year, last_year),
+                month=rng.randint(1, 12),
+                day=rng.randint(1, 28),
+                hour=rng.randint(0, 23),
+                minute=rng.randint(0, 59),
+                second=rng.randint(0, 59),
+                timezone_name=timezone_name,
+                longitude=longitude,
+                latitude=latitude,
+                fold=0,
+            )
+        )
+    return births
+
+
+def _serial(births: list[BirthInput], precision: str, sections: frozenset[str]) -> list[dict]:
+    results = []
+    for birth in births:
+        try:
+            results.append(compute_engine_payload(birth, precision, sections))
+        except ValueError as exc:
+            results.append({'error': {'type': type(exc).__name__, 'message': str(exc)}})
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Throughput of compute_engine_payloads against a per-row loop.')
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=20240204)
+    parser.add_argument('--first-year', type=int, default=1950)
+    parser.add_argument('--last-year', type=int, default=2099)
+    parser.add_argument('--precision', choices=ALLOWED_ENGINE_PRECISIONS, default=PRECISION_AUTO)
+    parser.add_argument('--sections', default=None, help='Comma-separated payload sections; all by default.')
+    args = parser.parse_args(argv)
+    sections = resolve_engine_sections(args.sections.split(',') if args.sections else None)
+
+    births = synthetic_births(args.rows, args.seed, args.first_year, args.last_year)
+    # Warm the shared caches so both paths are timed in the same state.
+    compute_engine_payloads(births, args.precision, sections)
+
+    print(f'rows: {args.rows}, years: {args.first_year}-{args.last_year}, precision: {args.precision}')
+    print(f'sections: {",".join(sorted(sections))}')
+    timings = {}
+    outputs = {}
+    for label, func in (
+        ('per-row loop', _serial),
+        ('batch', compute_engine_payloads),
+    ):
+        started = time.perf_counter()
+        outputs[label] = func(births, args.precision, sections)
+        timings[label] = time.perf_counter() - started
+        print(f'{label:>12}: {args.rows / timings[label]:10.0f} rows/s')
+    if outputs['per-row loop'] != outputs['batch']:
+        print('batch output differs from the per-row loop')
+        return 1
+    print(f'speedup: {timings["per-row loop"] / timings["batch"]:.2f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
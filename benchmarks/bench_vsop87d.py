@@ -0,0 +1,86 @@
+import argparse
+import timeit
+from dataclasses import dataclass
+from math import cos
+
+from eight_characters.vsop87d import (
+    ALLOWED_PRECISION_TIERS,
+    PRECISION_REFERENCE,
+    VSOP87D_EARTH_PATH,
+    SeriesCoefficients,
+    earth_heliocentric_lbr,
+    get_earth_series,
+    load_earth_series,
+)
+
+
+@dataclass(frozen=True)
+class VsopTerm:
+    amplitude: float
+    phase: float
+    frequency: float
+
+
+def _unpack_terms(series: SeriesCoefficients) -> tuple[tuple[VsopTerm, ...], ...]:
+    return tuple(
+        tuple(VsopTerm(*coefficients[index:index + 3]) for index in range(0, len(coefficients), 3))
+        for coefficients in series
+    )
+
+
+def _evaluate_terms(series: tuple[tuple[VsopTerm, ...], ...], tau: float) -> float:
+    # Pre-array evaluator: per-term attribute lookups and an explicit tau ** power.
+    total = 0.0
+    for power, terms in enumerate(series):
+        partial = 0.0
+        for term in terms:
+            partial += term.amplitude * cos(term.phase + term.frequency * tau)
+        total += partial * (tau ** power)
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Per-call timing of earth_heliocentric_lbr.')
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--tau', type=float, default=0.0263)
+    parser.add_argument('--precision', choices=ALLOWED_PRECISION_TIERS, default=PRECISION_REFERENCE)
+    args = parser.parse_args(argv)
+
+    earth = get_earth_series(args.precision)
+    packed_series = (earth.longitude, earth.latitude, earth.radius)
+    term_series = tuple(_unpack_terms(series) for series in packed_series)
+    term_count = sum(len(coefficients) // 3 for series in packed_series for coefficients in series)
+
+    def legacy_lbr() -> tuple[float, ...]:
+        return tuple(_evaluate_terms(series, args.tau) for series in term_series)
+
+    def packed_lbr() -> tuple[float, float, float]:
+        return earth_heliocentric_lbr(args.tau, args.precision)
+
+    print(f'precision: {args.precision}')
+    print(f'terms: {term_count}')
+    timings = {}
+    for label, func in (('dataclass terms', legacy_lbr), ('packed arrays', packed_lbr)):
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+        timings[label] = best
+        print(f'{label:>16}: {best * 1e6:8.2f} us/call')
+    print(f'per-call ratio: {timings["dataclass terms"] / timings["packed arrays"]:.2f}x')
+
+    # What each process pays before its first call: mapping the pack, or mapping it and boxing every term.
+    def load_packed() -> None:
+        load_earth_series(VSOP87D_EARTH_PATH)
+
+    def load_terms() -> None:
+        loaded = load_earth_series(VSOP87D_EARTH_PATH)
+        for series in (loaded.longitude, loaded.latitude, loaded.radius):
+            _unpack_terms(series)
+
+    for label, func in (('load dataclass', load_terms), ('load packed', load_packed)):
+        best = min(timeit.repeat(func, number=5, repeat=args.repeat)) / 5
+        print(f'{label:>16}: {best * 1e3:8.2f} ms')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
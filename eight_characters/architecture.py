@@ -22,41 +22,86 @@ MODULE_CONTRACTS: dict[str, ModuleContract] = {
     'time_convert': ModuleContract(
         name='time_convert',
         responsibility='Civil time to UTC and UTC to TT routing pipeline.',
-        dependencies=('policy',),
+        dependencies=('policy', 'conventions', 'embedded_data', 'timezone_index'),
+    ),
+    'timezone_index': ModuleContract(
+        name='timezone_index',
+        responsibility='Per-zone UTC transition index parsed once from TZif data for local-time resolution.',
+        dependencies=('caching', 'policy'),
     ),
     'vsop87d': ModuleContract(
         name='vsop87d',
-        responsibility='VSOP87D Earth series evaluation.',
-        dependencies=(),
+        responsibility='VSOP87D Earth series evaluation over the memory-mapped full data pack.',
+        dependencies=('packed_data',),
     ),
     'nutation': ModuleContract(
         name='nutation',
-        responsibility='IAU 2000A nutation calculations.',
-        dependencies=(),
+        responsibility='Packed IAU 2000A nutation series with daily Hermite-interpolated nodes.',
+        dependencies=('packed_data', 'caching'),
     ),
     'obliquity': ModuleContract(
         name='obliquity',
         responsibility='IAU 2006 mean and true obliquity.',
-        dependencies=('nutation',),
+        dependencies=(),
     ),
     'solar_position': ModuleContract(
         name='solar_position',
         responsibility='Solar longitude, equation of time, and true solar time.',
-        dependencies=('vsop87d', 'nutation', 'obliquity'),
+        dependencies=('vsop87d', 'nutation', 'obliquity', 'time_convert'),
+    ),
+    'solar_batch': ModuleContract(
+        name='solar_batch',
+        responsibility='Columnar solar position and true solar time over many instants.',
+        dependencies=('solar_position', 'equation_of_time_table', 'obliquity', 'vsop87d', 'time_convert'),
+    ),
+    'equation_of_time_table': ModuleContract(
+        name='equation_of_time_table',
+        responsibility='Daily equation-of-time nodes with cubic interpolation for true solar time.',
+        dependencies=('solar_position', 'time_convert', 'packed_data', 'embedded_data', 'policy', 'sexagenary'),
+    ),
+    'solar_ephemeris': ModuleContract(
+        name='solar_ephemeris',
+        responsibility='Interchangeable apparent-Sun backends: direct series or packed Chebyshev segments.',
+        dependencies=('solar_position', 'vsop87d', 'packed_data', 'embedded_data', 'policy', 'sexagenary'),
     ),
     'root_finding': ModuleContract(
         name='root_finding',
-        responsibility='Pure-Python bracketing and Brent solver.',
+        responsibility='Pure-Python bracketing, Brent, and Brent-safeguarded Newton/Halley solvers.',
+        dependencies=(),
+    ),
+    'caching': ModuleContract(
+        name='caching',
+        responsibility='Bounded thread-safe caches with hit/miss/eviction counters.',
+        dependencies=(),
+    ),
+    'embedded_data': ModuleContract(
+        name='embedded_data',
+        responsibility='Shipped leap-second, delta-T and model-id tables and the per-process engine metadata.',
+        dependencies=(),
+    ),
+    'packed_data': ModuleContract(
+        name='packed_data',
+        responsibility='Versioned binary container for shipped data tables.',
         dependencies=(),
     ),
+    'solar_term_table': ModuleContract(
+        name='solar_term_table',
+        responsibility='Precomputed solar-term instants for the supported range.',
+        dependencies=('policy', 'packed_data', 'embedded_data', 'solar_position'),
+    ),
     'solar_term_solver': ModuleContract(
         name='solar_term_solver',
-        responsibility='Solar-term boundary solving.',
-        dependencies=('solar_position', 'root_finding'),
+        responsibility='Solar-term boundary lookup and solving.',
+        dependencies=('solar_position', 'root_finding', 'solar_term_table', 'sexagenary', 'caching'),
     ),
     'sexagenary': ModuleContract(
         name='sexagenary',
         responsibility='Year, month, day, and hour pillar arithmetic.',
+        dependencies=('conventions', 'policy'),
+    ),
+    'integrity': ModuleContract(
+        name='integrity',
+        responsibility='Boundary ambiguity flags and alternative zi conventions.',
         dependencies=('conventions',),
     ),
     'output': ModuleContract(
@@ -69,12 +114,31 @@ MODULE_CONTRACTS: dict[str, ModuleContract] = {
         responsibility='Main orchestration of full pipeline.',
         dependencies=(
             'conventions',
-            'policy',
+            'embedded_data',
+            'integrity',
             'time_convert',
             'solar_position',
             'solar_term_solver',
+            'solar_term_table',
             'sexagenary',
             'output',
+            'vsop87d',
+        ),
+    ),
+    'bulk': ModuleContract(
+        name='bulk',
+        responsibility='Multi-process and streaming batch engine runs with input-ordered deterministic output.',
+        dependencies=(
+            'engine',
+            'embedded_data',
+            'output',
+            'solar_term_solver',
+            'nutation',
+            'vsop87d',
+            'policy',
+            'sexagenary',
+            'time_convert',
+            'conventions',
         ),
     ),
     'geocoding': ModuleContract(
@@ -0,0 +1,95 @@
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from eight_characters.equation_of_time_table import (
+    EQUATION_OF_TIME_FIRST_JD_TT,
+    EQUATION_OF_TIME_LAST_JD_TT,
+    EQUATION_OF_TIME_NODE_DAYS,
+    EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES,
+    EQUATION_OF_TIME_TABLE_PATH,
+    EquationOfTimeTable,
+    load_equation_of_time_table,
+    write_equation_of_time_table,
+)
+from eight_characters.solar_position import compute_equation_of_time_minutes
+
+
+# Interval midpoints are where the four-point cubic is least accurate; every interval is probed.
+PROBE_POSITION = 0.5
+CHUNK_NODES = 512
+
+
+def _node_values(node_indexes: range, first_jd_tt: float, node_days: float) -> list[float]:
+    return [compute_equation_of_time_minutes(first_jd_tt + index * node_days) for index in node_indexes]
+
+
+def _probe_errors(table: EquationOfTimeTable, node_indexes: range) -> float:
+    worst = 0.0
+    for index in node_indexes:
+        jd_tt = table.first_jd_tt + (index + PROBE_POSITION) * table.node_days
+        if table.covers(jd_tt):
+            worst = max(worst, abs(table.equation_of_time_minutes(jd_tt) - compute_equation_of_time_minutes(jd_tt)))
+    return worst
+
+
+def _map_chunks(function, count: int, workers: int | None) -> list:
+    chunks = [range(start, min(start + CHUNK_NODES, count)) for start in range(0, count, CHUNK_NODES)]
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count == 1:
+        return [function(chunk) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        return list(executor.map(function, chunks))
+
+
+def measure_table_error(table: EquationOfTimeTable, workers: int | None = None) -> float:
+    return max(_map_chunks(partial(_probe_errors, table), len(table.values), workers))
+
+
+def build_equation_of_time_table(
+    target_file: str = str(EQUATION_OF_TIME_TABLE_PATH),
+    first_jd_tt: float = EQUATION_OF_TIME_FIRST_JD_TT,
+    last_jd_tt: float = EQUATION_OF_TIME_LAST_JD_TT,
+    node_days: float = EQUATION_OF_TIME_NODE_DAYS,
+    workers: int | None = None,
+) -> float:
+    node_count = round((last_jd_tt - first_jd_tt) / node_days) + 1
+    values: list[float] = []
+    for chunk_values in _map_chunks(partial(_node_values, first_jd_tt=first_jd_tt, node_days=node_days), node_count, workers):
+        values.extend(chunk_values)
+
+    max_error_minutes = measure_table_error(EquationOfTimeTable(first_jd_tt, node_days, values), workers)
+    write_equation_of_time_table(target_file, first_jd_tt, node_days, values, max_error_minutes)
+    return max_error_minutes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m eight_characters.build_eot',
+        description='Regenerate or verify the daily equation-of-time table.',
+    )
+    parser.add_argument('--output', default=str(EQUATION_OF_TIME_TABLE_PATH))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Validate checksum and model ids, then compare every interval midpoint with the direct pipeline.',
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        max_error_minutes = measure_table_error(load_equation_of_time_table(args.output), args.workers)
+    else:
+        max_error_minutes = build_equation_of_time_table(target_file=args.output, workers=args.workers)
+        print(f'wrote {args.output}')
+    print(f'max error: {max_error_minutes:.3e} min (bound {EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES:.0e})')
+    if max_error_minutes > EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES:
+        print('equation-of-time table exceeds its documented error bound.', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
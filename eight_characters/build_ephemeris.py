@@ -0,0 +1,157 @@
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil
+
+from eight_characters.solar_ephemeris import (
+    DEFAULT_COEFFICIENT_COUNTS,
+    DEFAULT_SEGMENT_DAYS,
+    EPHEMERIS_ERROR_BOUNDS,
+    EPHEMERIS_FIRST_JD_TT,
+    EPHEMERIS_LAST_JD_TT,
+    EPHEMERIS_QUANTITIES,
+    SOLAR_EPHEMERIS_PATH,
+    ChebyshevSolarEphemeris,
+    fit_segment,
+    load_solar_ephemeris,
+    write_solar_ephemeris,
+)
+from eight_characters.solar_position import compute_apparent_solar_longitude
+
+
+# Probe points per segment, in the segment's [-1, 1] coordinate and away from the fit nodes.
+PROBE_POSITIONS = (-0.97, -0.41, 0.13, 0.58, 0.93)
+
+
+def _fit_segments(
+    segment_indexes: range,
+    first_jd_tt: float,
+    segment_days: float,
+    coefficient_counts: tuple[int, ...],
+) -> list[float]:
+    coefficients: list[float] = []
+    for segment in segment_indexes:
+        coefficients.extend(fit_segment(first_jd_tt + segment * segment_days, segment_days, coefficient_counts))
+    return coefficients
+
+
+def _chunks(count: int, chunk_size: int) -> list[range]:
+    return [range(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+
+
+def _probe_errors(ephemeris: ChebyshevSolarEphemeris, segment_indexes: range) -> list[float]:
+    worst = [0.0] * len(EPHEMERIS_QUANTITIES)
+    for segment in segment_indexes:
+        segment_start = ephemeris.first_jd_tt + segment * ephemeris.segment_days
+        for position in PROBE_POSITIONS:
+            jd_tt = segment_start + 0.5 * ephemeris.segment_days * (position + 1.0)
+            fitted = ephemeris.apparent_position(jd_tt)
+            direct = compute_apparent_solar_longitude(jd_tt)
+            errors = [abs((fitted[0] - direct[0] + 180.0) % 360.0 - 180.0)]
+            errors.extend(abs(fitted[index] - direct[index]) for index in range(1, len(EPHEMERIS_QUANTITIES)))
+            worst = [max(current, error) for current, error in zip(worst, errors)]
+    return worst
+
+
+def measure_ephemeris_errors(ephemeris: ChebyshevSolarEphemeris, workers: int | None = None) -> dict[str, float]:
+    chunks = _chunks(ephemeris.segment_count, 64)
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count == 1:
+        per_chunk = [_probe_errors(ephemeris, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            per_chunk = list(executor.map(partial(_probe_errors, ephemeris), chunks))
+    return {
+        quantity: max(chunk_errors[index] for chunk_errors in per_chunk)
+        for index, quantity in enumerate(EPHEMERIS_QUANTITIES)
+    }
+
+
+def build_solar_ephemeris(
+    target_file: str = str(SOLAR_EPHEMERIS_PATH),
+    first_jd_tt: float = EPHEMERIS_FIRST_JD_TT,
+    last_jd_tt: float = EPHEMERIS_LAST_JD_TT,
+    segment_days: float = DEFAULT_SEGMENT_DAYS,
+    coefficient_counts: tuple[int, ...] = DEFAULT_COEFFICIENT_COUNTS,
+    workers: int | None = None,
+) -> dict[str, float]:
+    segment_count = ceil((last_jd_tt - first_jd_tt) / segment_days)
+    chunks = _chunks(segment_count, 64)
+    fit_chunk = partial(
+        _fit_segments,
+        first_jd_tt=first_jd_tt,
+        segment_days=segment_days,
+        coefficient_counts=coefficient_counts,
+    )
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count == 1:
+        per_chunk = [fit_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            per_chunk = list(executor.map(fit_chunk, chunks))
+
+    coefficients = [value for chunk in per_chunk for value in chunk]
+    ephemeris = ChebyshevSolarEphemeris(
+        first_jd_tt=first_jd_tt,
+        segment_days=segment_days,
+        segment_count=segment_count,
+        coefficient_counts=tuple(coefficient_counts),
+        coefficients=coefficients,
+    )
+    max_errors = measure_ephemeris_errors(ephemeris, workers)
+    write_solar_ephemeris(target_file, first_jd_tt, segment_days, tuple(coefficient_counts), coefficients, max_errors)
+    return max_errors
+
+
+def _report(max_errors: dict[str, float]) -> bool:
+    within_bounds = True
+    for quantity in EPHEMERIS_QUANTITIES:
+        bound = EPHEMERIS_ERROR_BOUNDS[quantity]
+        flag = '' if max_errors[quantity] <= bound else '  EXCEEDS BOUND'
+        within_bounds = within_bounds and not flag
+        print(f'{quantity:>26}: {max_errors[quantity]:.3e} (bound {bound:.3e}){flag}')
+    return within_bounds
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m eight_characters.build_ephemeris',
+        description='Regenerate or verify the packed Chebyshev solar ephemeris.',
+    )
+    parser.add_argument('--output', default=str(SOLAR_EPHEMERIS_PATH))
+    parser.add_argument('--segment-days', type=float, default=DEFAULT_SEGMENT_DAYS)
+    parser.add_argument(
+        '--coefficient-counts',
+        type=int,
+        nargs=len(EPHEMERIS_QUANTITIES),
+        default=list(DEFAULT_COEFFICIENT_COUNTS),
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Validate checksum and model ids, then probe every segment against the series pipeline.',
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        max_errors = measure_ephemeris_errors(load_solar_ephemeris(args.output), args.workers)
+    else:
+        max_errors = build_solar_ephemeris(
+            target_file=args.output,
+            segment_days=args.segment_days,
+            coefficient_counts=tuple(args.coefficient_counts),
+            workers=args.workers,
+        )
+        print(f'wrote {args.output}')
+
+    if not _report(max_errors):
+        print('solar ephemeris exceeds its documented error bounds.', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+import argparse
+import ast
+import struct
+import zipfile
+from array import array
+from pathlib import Path
+
+from eight_characters.nutation import (
+    IAU2000A_NUTATION_PATH,
+    LUNISOLAR_ARGUMENT_COUNT,
+    PLANETARY_ARGUMENT_COUNT,
+    write_nutation_series,
+)
+
+
+NPY_MAGIC = b'\x93NUMPY'
+NPY_TYPECODES = {'<i8': 'q', '<f8': 'd'}
+
+# Arrays of the NOVAS/SOFA nut00a coefficient set as shipped in skyfield's nutation.npz.
+LUNISOLAR_MULTIPLIERS = 'nals_t'
+LUNISOLAR_LONGITUDE = 'lunisolar_longitude_coefficients'
+LUNISOLAR_OBLIQUITY = 'lunisolar_obliquity_coefficients'
+PLANETARY_MULTIPLIERS = 'napl_t'
+PLANETARY_LONGITUDE = 'nutation_coefficients_longitude'
+PLANETARY_OBLIQUITY = 'nutation_coefficients_obliquity'
+
+
+def read_npy_rows(archive: zipfile.ZipFile, name: str) -> list[tuple]:
+    raw = archive.read(f'{name}.npy')
+    if not raw.startswith(NPY_MAGIC) or raw[6] != 1:
+        raise ValueError(f'{name}: not a version 1 .npy array.')
+    (header_length,) = struct.unpack('<H', raw[8:10])
+    header = ast.literal_eval(raw[10:10 + header_length].decode('latin1'))
+    if header['fortran_order'] or header['descr'] not in NPY_TYPECODES or len(header['shape']) != 2:
+        raise ValueError(f'{name}: expected a C-ordered two-dimensional int64 or float64 array.')
+    rows, columns = header['shape']
+    values = array(NPY_TYPECODES[header['descr']])
+    values.frombytes(raw[10 + header_length:])
+    if len(values) != rows * columns:
+        raise ValueError(f'{name}: payload does not match shape {header["shape"]}.')
+    return [tuple(values[row * columns:(row + 1) * columns]) for row in range(rows)]
+
+
+def parse_nutation_archive(
+    source_file: str | Path,
+) -> tuple[list[tuple[tuple[int, ...], tuple[float, ...]]], list[tuple[tuple[int, ...], tuple[float, ...]]]]:
+    with zipfile.ZipFile(source_file) as archive:
+        lunisolar_multipliers = read_npy_rows(archive, LUNISOLAR_MULTIPLIERS)
+        lunisolar_longitude = read_npy_rows(archive, LUNISOLAR_LONGITUDE)
+        lunisolar_obliquity = read_npy_rows(archive, LUNISOLAR_OBLIQUITY)
+        planetary_multipliers = read_npy_rows(archive, PLANETARY_MULTIPLIERS)
+        planetary_longitude = read_npy_rows(archive, PLANETARY_LONGITUDE)
+        planetary_obliquity = read_npy_rows(archive, PLANETARY_OBLIQUITY)
+
+    if not len(lunisolar_multipliers) == len(lunisolar_longitude) == len(lunisolar_obliquity):
+        raise ValueError('Lunisolar arrays have different term counts.')
+    if not len(planetary_multipliers) == len(planetary_longitude) == len(planetary_obliquity):
+        raise ValueError('Planetary arrays have different term counts.')
+    if any(len(row) != LUNISOLAR_ARGUMENT_COUNT for row in lunisolar_multipliers):
+        raise ValueError(f'Lunisolar terms need {LUNISOLAR_ARGUMENT_COUNT} multipliers.')
+    if any(len(row) != PLANETARY_ARGUMENT_COUNT for row in planetary_multipliers):
+        raise ValueError(f'Planetary terms need {PLANETARY_ARGUMENT_COUNT} multipliers.')
+
+    lunisolar = [
+        (multipliers, longitude + obliquity)
+        for multipliers, longitude, obliquity in zip(lunisolar_multipliers, lunisolar_longitude, lunisolar_obliquity)
+    ]
+    planetary = [
+        (multipliers, longitude + obliquity)
+        for multipliers, longitude, obliquity in zip(planetary_multipliers, planetary_longitude, planetary_obliquity)
+    ]
+    return lunisolar, planetary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m eight_characters.build_nutation',
+        description='Pack the IAU 2000A nutation series into the engine data pack.',
+    )
+    parser.add_argument('source', help='Path to nutation.npz (NOVAS/SOFA nut00a coefficients as shipped by skyfield).')
+    parser.add_argument('--output', default=str(IAU2000A_NUTATION_PATH))
+    args = parser.parse_args(argv)
+
+    lunisolar, planetary = parse_nutation_archive(args.source)
+    write_nutation_series(args.output, lunisolar, planetary, source=Path(args.source).name)
+    print(f'wrote {args.output} (lunisolar={len(lunisolar)}, planetary={len(planetary)})')
+    print('rebuild the solar-term table: python -m eight_characters.build_terms')
+    print('rebuild the equation-of-time table: python -m eight_characters.build_eot')
+    print('rebuild the solar ephemeris: python -m eight_characters.build_ephemeris')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from eight_characters.solar_term_solver import (
+    ALLOWED_SOLVER_METHODS,
+    METHOD_BRENT,
+    find_solar_term,
+    seed_jd_tt_for_term,
+)
+from eight_characters.solar_term_table import (
+    SOLAR_TERM_TABLE_PATH,
+    TABLE_FIRST_YEAR,
+    TABLE_LAST_YEAR,
+    TERMS_PER_YEAR,
+    load_solar_term_table,
+    term_longitude_for_slot,
+    write_solar_term_table,
+)
+
+
+DEFAULT_TOLERANCE_SECONDS = 1e-4
+DEFAULT_MAX_DEVIATION_SECONDS = 0.01
+
+
+def compute_year_terms(
+    year_value: int,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+    method: str = METHOD_BRENT,
+) -> list[float]:
+    targets = [term_longitude_for_slot(slot) for slot in range(TERMS_PER_YEAR)]
+    return [
+        find_solar_term(
+            target,
+            seed_jd_tt_for_term(year_value, target),
+            tolerance_seconds=tolerance_seconds,
+            use_table=False,
+            method=method,
+        )
+        for target in targets
+    ]
+
+
+def compute_term_values(
+    first_year: int,
+    last_year: int,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+    workers: int | None = None,
+    method: str = METHOD_BRENT,
+) -> list[float]:
+    years = range(first_year, last_year + 1)
+    solve_year = partial(compute_year_terms, tolerance_seconds=tolerance_seconds, method=method)
+    worker_count = workers or os.cpu_count() or 1
+
+    if worker_count == 1:
+        per_year = [solve_year(year_value) for year_value in years]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            per_year = list(executor.map(solve_year, years, chunksize=4))
+
+    values: list[float] = []
+    for year_terms in per_year:
+        values.extend(year_terms)
+    return values
+
+
+def build_solar_term_table(
+    target_file: str = str(SOLAR_TERM_TABLE_PATH),
+    first_year: int = TABLE_FIRST_YEAR,
+    last_year: int = TABLE_LAST_YEAR,
+    tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+    workers: int | None = None,
+    method: str = METHOD_BRENT,
+) -> None:
+    values = compute_term_values(first_year, last_year, tolerance_seconds, workers, method)
+    write_solar_term_table(target_file, first_year, last_year, tolerance_seconds, values)
+
+
+def check_solar_term_table(
+    source_file: str = str(SOLAR_TERM_TABLE_PATH),
+    workers: int | None = None,
+    method: str = METHOD_BRENT,
+) -> float:
+    table = load_solar_term_table(source_file)
+    expected = compute_term_values(
+        table.first_year,
+        table.last_year,
+        table.tolerance_seconds,
+        workers,
+        method,
+    )
+    return max(
+        abs(shipped - solved) * 86400.0
+        for shipped, solved in zip(table.term_jd_tt, expected)
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m eight_characters.build_terms',
+        description='Regenerate or verify the packed solar-term table.',
+    )
+    parser.add_argument('--output', default=str(SOLAR_TERM_TABLE_PATH))
+    parser.add_argument('--first-year', type=int, default=TABLE_FIRST_YEAR)
+    parser.add_argument('--last-year', type=int, default=TABLE_LAST_YEAR)
+    parser.add_argument('--tolerance-seconds', type=float, default=DEFAULT_TOLERANCE_SECONDS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--method', choices=ALLOWED_SOLVER_METHODS, default=METHOD_BRENT)
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Validate checksum and model ids, then re-solve every term and compare.',
+    )
+    parser.add_argument('--max-deviation-seconds', type=float, default=DEFAULT_MAX_DEVIATION_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.check:
+        deviation_seconds = check_solar_term_table(args.output, args.workers, args.method)
+        print(f'max deviation: {deviation_seconds:.6f} s')
+        if deviation_seconds > args.max_deviation_seconds:
+            print('solar-term table is stale; rebuild it.', file=sys.stderr)
+            return 1
+        return 0
+
+    build_solar_term_table(
+        target_file=args.output,
+        first_year=args.first_year,
+        last_year=args.last_year,
+        tolerance_seconds=args.tolerance_seconds,
+        workers=args.workers,
+        method=args.method,
+    )
+    print(f'wrote {args.output} ({args.first_year}-{args.last_year})')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+import argparse
+import re
+from pathlib import Path
+
+from eight_characters.vsop87d import VSOP87D_EARTH_PATH, VSOP_VARIABLES, write_earth_series
+
+
+# Column layout of published VSOP87 term lines: (1x,4i1,i5,12i3,f15.11,2f18.11,f14.11,f20.11).
+AMPLITUDE_COLUMNS = slice(79, 97)
+PHASE_COLUMNS = slice(97, 111)
+FREQUENCY_COLUMNS = slice(111, 131)
+
+HEADER_PATTERN = re.compile(r'VARIABLE\s+(\d)\s+\(LBR\)\s+\*T\*\*(\d)\s+(\d+)\s+TERMS')
+
+
+def parse_vsop87_file(source_file: str | Path) -> dict[str, list[list[tuple[float, float, float]]]]:
+    series: dict[str, list[list[tuple[float, float, float]]]] = {variable: [] for variable in VSOP_VARIABLES}
+    terms: list[tuple[float, float, float]] | None = None
+    expected_count = 0
+
+    for line_number, line in enumerate(Path(source_file).read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        header = HEADER_PATTERN.search(line)
+        if header is not None:
+            if terms is not None and len(terms) != expected_count:
+                raise ValueError(f'Line {line_number}: previous block has {len(terms)} terms, expected {expected_count}.')
+            variable = VSOP_VARIABLES[int(header.group(1)) - 1]
+            power = int(header.group(2))
+            if power != len(series[variable]):
+                raise ValueError(f'Line {line_number}: {variable} power {power} is out of order.')
+            expected_count = int(header.group(3))
+            terms = []
+            series[variable].append(terms)
+            continue
+        if terms is None:
+            raise ValueError(f'Line {line_number}: term line before any block header.')
+        terms.append((
+            float(line[AMPLITUDE_COLUMNS]),
+            float(line[PHASE_COLUMNS]),
+            float(line[FREQUENCY_COLUMNS]),
+        ))
+
+    if terms is not None and len(terms) != expected_count:
+        raise ValueError(f'Last block has {len(terms)} terms, expected {expected_count}.')
+    for variable in VSOP_VARIABLES:
+        if not series[variable]:
+            raise ValueError(f'VSOP87 file has no {variable} series.')
+        for power_terms in series[variable]:
+            # Largest first so any prefix of a block is a valid truncation.
+            power_terms.sort(key=lambda term: -abs(term[0]))
+    return series
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m eight_characters.build_vsop',
+        description='Pack a published VSOP87D Earth file (VSOP87D.ear) into the engine data pack.',
+    )
+    parser.add_argument('source', help='Path to VSOP87D.ear as distributed by IMCCE.')
+    parser.add_argument('--output', default=str(VSOP87D_EARTH_PATH))
+    args = parser.parse_args(argv)
+
+    series = parse_vsop87_file(args.source)
+    write_earth_series(args.output, series, source=Path(args.source).name)
+    counts = ', '.join(
+        f'{variable}{power}={len(terms)}'
+        for variable in VSOP_VARIABLES
+        for power, terms in enumerate(series[variable])
+    )
+    print(f'wrote {args.output} ({counts})')
+    print('rebuild the solar-term table: python -m eight_characters.build_terms')
+    print('rebuild the equation-of-time table: python -m eight_characters.build_eot')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
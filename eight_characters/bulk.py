@@ -0,0 +1,635 @@
+import argparse
+import csv
+import hashlib
+import heapq
+import json
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from functools import partial
+from typing import Callable, Iterable, Iterator, TextIO
+
+from eight_characters.conventions import ConventionSettings
+from eight_characters.embedded_data import get_engine_metadata
+from eight_characters.engine import (
+    ALLOWED_ENGINE_PRECISIONS,
+    PRECISION_AUTO,
+    compute_engine_payloads,
+    validate_engine_precision,
+)
+from eight_characters.nutation import get_nutation_plan
+from eight_characters.output import dumps_deterministic
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.sexagenary import MONTH_BOUNDARY_LONGITUDES
+from eight_characters.solar_term_solver import solar_term_jd_tt
+from eight_characters.time_convert import BirthInput
+from eight_characters.vsop87d import PRECISION_FAST, PRECISION_REFERENCE, get_earth_series
+
+
+BULK_CHUNK_ROWS = 256
+# Chunks buffered between the reader and the pool, and between the pool and the writer.
+BULK_QUEUE_CHUNKS = 4
+
+# Checkpoints are rewritten once at least this many input records have been processed since the last.
+CHECKPOINT_RECORDS = 10_000
+CHECKPOINT_FORMAT_VERSION = 2
+
+SHARD_LINE_PREFIX = '{"record":'
+SHARD_LINE_RESULT = ',"result":'
+# Last line of a completed shard output: {"input_records":R,"records":W,"shard":"i/N"}.
+SHARD_TRAILER_PREFIX = '{"input_records":'
+
+INPUT_FORMAT_NDJSON = 'ndjson'
+INPUT_FORMAT_CSV = 'csv'
+INPUT_FORMATS = (INPUT_FORMAT_NDJSON, INPUT_FORMAT_CSV)
+
+INTEGER_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'fold')
+FLOAT_FIELDS = ('longitude', 'latitude', 'birth_time_uncertainty_seconds')
+STRING_FIELDS = ('timezone_name', 'utc_timestamp')
+CONVENTION_FIELDS = tuple(field.name for field in fields(ConventionSettings))
+
+
+def warm_engine_caches(precision: str = PRECISION_AUTO) -> None:
+    # Everything a fresh process would otherwise load or solve on its first rows, for the
+    # VSOP87D tiers this precision evaluates: auto runs fast and re-runs near boundaries.
+    get_engine_metadata()
+    get_nutation_plan()
+    for tier in (PRECISION_FAST, PRECISION_REFERENCE) if precision == PRECISION_AUTO else (precision,):
+        get_earth_series(tier)
+    for year_value in range(MIN_SUPPORTED_YEAR - 1, MAX_SUPPORTED_YEAR + 2):
+        for target in MONTH_BOUNDARY_LONGITUDES:
+            solar_term_jd_tt(year_value, target)
+
+
+def _year_key(value: BirthInput) -> int:
+    if isinstance(value.year, int):
+        return value.year
+    try:
+        return int(value.utc_timestamp[:4])
+    except (TypeError, ValueError):
+        return 0
+
+
+def _compute_chunk(rows: list[BirthInput], precision: str) -> list[str]:
+    return [dumps_deterministic(payload) for payload in compute_engine_payloads(rows, precision)]
+
+
+def compute_engine_json_lines(
+    values: Iterable[BirthInput],
+    precision: str = PRECISION_AUTO,
+    workers: int | None = None,
+    chunk_rows: int = BULK_CHUNK_ROWS,
+) -> list[str]:
+    # One dumps_deterministic line per input, in input order; identical for any worker count.
+    validate_engine_precision(precision)
+    rows = list(values)
+    # Chunks are consecutive runs of the year-sorted rows, so a worker sees few distinct years.
+    order = sorted(range(len(rows)), key=lambda index: _year_key(rows[index]))
+    chunk_indexes = [order[start:start + chunk_rows] for start in range(0, len(order), chunk_rows)]
+    chunks = [[rows[index] for index in indexes] for indexes in chunk_indexes]
+    compute_chunk = partial(_compute_chunk, precision=precision)
+
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count == 1:
+        chunk_lines = [compute_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count, initializer=warm_engine_caches, initargs=(precision,)) as executor:
+            chunk_lines = list(executor.map(compute_chunk, chunks))
+
+    lines: list[str] = [''] * len(rows)
+    for indexes, chunk in zip(chunk_indexes, chunk_lines):
+        for index, line in zip(indexes, chunk):
+            lines[index] = line
+    return lines
+
+
+def _field_value(name: str, value: object) -> object:
+    if name in INTEGER_FIELDS:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError(f'{name} must be an integer.')
+        return int(value)
+    if name in FLOAT_FIELDS:
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError(f'{name} must be a number.')
+        return float(value)
+    if not isinstance(value, str):
+        raise ValueError(f'{name} must be a string.')
+    return value
+
+
+def birth_input_from_record(record: dict) -> BirthInput:
+    # BirthInput field names; conventions nest under "conventions" or sit flat beside them.
+    # Missing, null and empty CSV values take the BirthInput defaults.
+    values = {}
+    conventions = {}
+    nested_conventions = record.get('conventions')
+    if isinstance(nested_conventions, dict):
+        record = {**nested_conventions, **{key: value for key, value in record.items() if key != 'conventions'}}
+    for name, value in record.items():
+        if value is None or value == '':
+            continue
+        if name in CONVENTION_FIELDS:
+            conventions[name] = _field_value(name, value)
+        elif name in INTEGER_FIELDS or name in FLOAT_FIELDS or name in STRING_FIELDS:
+            values[name] = _field_value(name, value)
+        else:
+            raise ValueError(f'Unknown field: {name}')
+    return BirthInput(**values, conventions=ConventionSettings(**conventions))
+
+
+def _decode_record(record: str | dict) -> BirthInput:
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict):
+            raise ValueError('Record must be a JSON object.')
+    return birth_input_from_record(record)
+
+
+def _record_lines(records: list[str | dict], precision: str) -> list[str]:
+    # NDJSON records arrive as raw lines and CSV records as row dicts; decoding happens here,
+    # in the worker, and a record that cannot be decoded becomes an error line in place.
+    lines: list[str | None] = []
+    births = []
+    for record in records:
+        try:
+            births.append(_decode_record(record))
+            lines.append(None)
+        except ValueError as exc:
+            lines.append(dumps_deterministic({'error': {'type': type(exc).__name__, 'message': str(exc)}}))
+    computed = iter(_compute_chunk(births, precision))
+    return [next(computed) if line is None else line for line in lines]
+
+
+def read_records(stream: TextIO, input_format: str) -> Iterator[str | dict]:
+    if input_format == INPUT_FORMAT_CSV:
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+@dataclass(frozen=True)
+class Shard:
+    index: int
+    count: int
+
+    def owns(self, record: str | dict) -> bool:
+        return shard_hash(record) % self.count == self.index
+
+
+def parse_shard(value: str) -> Shard:
+    index_text, separator, count_text = value.partition('/')
+    try:
+        shard = Shard(index=int(index_text), count=int(count_text))
+    except ValueError as exc:
+        raise ValueError('Shard must be written as i/N.') from exc
+    if not separator or shard.count < 1 or not 0 <= shard.index < shard.count:
+        raise ValueError('Shard must be written as i/N with 0 <= i < N.')
+    return shard
+
+
+def write_shard_trailer(output: TextIO, shard: Shard, input_records: int, records: int) -> None:
+    # Written once the shard has read all input_records input records and written its records
+    # lines; merge_shard_outputs treats a shard output without it as incomplete.
+    trailer = {'input_records': input_records, 'records': records, 'shard': f'{shard.index}/{shard.count}'}
+    output.write(f'{json.dumps(trailer, sort_keys=True, separators=(",", ":"))}\n')
+
+
+def shard_hash(record: str | dict) -> int:
+    # Hash of the canonical BirthInput, so NDJSON and CSV spellings of a birth share a shard
+    # on every machine; records that do not decode hash their raw text instead. CSV rows with
+    # extra columns carry them under a None key, so raw rows are hashed as key-sorted pairs.
+    try:
+        canonical = json.dumps(asdict(_decode_record(record)), sort_keys=True, separators=(',', ':'))
+    except ValueError:
+        if isinstance(record, str):
+            canonical = record.strip()
+        else:
+            canonical = json.dumps(sorted(record.items(), key=str), separators=(',', ':'))
+    return int.from_bytes(hashlib.sha256(canonical.encode('utf-8')).digest()[:8], 'big')
+
+
+@dataclass(frozen=True)
+class _Chunk:
+    # Input record numbers of the rows, and the record number after the last one read.
+    record_numbers: list[int]
+    records: list[str | dict]
+    next_record: int
+
+
+def _chunked(
+    records: Iterable[str | dict],
+    chunk_rows: int,
+    shard: Shard | None,
+    skip_records: int,
+) -> Iterator[_Chunk]:
+    record_numbers: list[int] = []
+    chunk: list[str | dict] = []
+    next_record = 0
+    for next_record, record in enumerate(records, start=1):
+        if next_record <= skip_records or (shard is not None and not shard.owns(record)):
+            continue
+        record_numbers.append(next_record - 1)
+        chunk.append(record)
+        if len(chunk) == chunk_rows:
+            yield _Chunk(record_numbers, chunk, next_record)
+            record_numbers = []
+            chunk = []
+    # Always closes with a chunk, possibly empty, so the writer learns how far input went.
+    yield _Chunk(record_numbers, chunk, max(next_record, skip_records))
+
+
+class _Stage(threading.Thread):
+    # Runs target in a thread and keeps its exception for the pipeline to re-raise.
+    def __init__(self, target) -> None:
+        super().__init__(daemon=True)
+        self._stage_target = target
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            self._stage_target()
+        except BaseException as exc:
+            self.error = exc
+
+
+def run_pipeline(
+    records: Iterable[str | dict],
+    output: TextIO,
+    precision: str = PRECISION_AUTO,
+    workers: int | None = None,
+    chunk_rows: int = BULK_CHUNK_ROWS,
+    queue_chunks: int = BULK_QUEUE_CHUNKS,
+    shard: Shard | None = None,
+    skip_records: int = 0,
+    on_chunk_written: Callable[[int, int], None] | None = None,
+) -> int:
+    # reader -> bounded queue -> compute pool -> bounded queue -> writer. The queues bound the
+    # chunks read ahead and in flight, so memory stays flat however long the input is. Output
+    # lines follow input order. Returns the number of records written.
+    # With a shard, only its records are computed and each line is wrapped as
+    # {"record":<input record number>,"result":<line>} for merge_shard_outputs.
+    # on_chunk_written(next_record, written) runs after each chunk is written.
+    # If the writer fails, the reader stops taking input, queued work is cancelled and the
+    # writer's error is raised.
+    validate_engine_precision(precision)
+    worker_count = workers or os.cpu_count() or 1
+    pending: queue.Queue = queue.Queue(maxsize=queue_chunks)
+    computed: queue.Queue = queue.Queue(maxsize=queue_chunks + worker_count)
+    done = object()
+    stop = threading.Event()
+    written = 0
+
+    def read() -> None:
+        try:
+            for chunk in _chunked(records, chunk_rows, shard, skip_records):
+                if stop.is_set():
+                    break
+                pending.put(chunk)
+        finally:
+            pending.put(done)
+
+    def write() -> None:
+        nonlocal written
+        error = None
+        while (item := computed.get()) is not done:
+            chunk, future = item
+            if error is not None:
+                # Keep draining so the compute stage never blocks on a failed writer.
+                future.cancel()
+                continue
+            try:
+                lines = future.result()
+                if shard is None:
+                    output.write(''.join(f'{line}\n' for line in lines))
+                else:
+                    output.write(''.join(
+                        f'{{"record":{record_number},"result":{line}}}\n'
+                        for record_number, line in zip(chunk.record_numbers, lines)
+                    ))
+                written += len(lines)
+                if on_chunk_written is not None:
+                    on_chunk_written(chunk.next_record, written)
+            except BaseException as exc:
+                error = exc
+                stop.set()
+        if error is not None:
+            raise error
+
+    reader = _Stage(read)
+    writer = _Stage(write)
+    compute_chunk = partial(_record_lines, precision=precision)
+    executor: Executor | None = None
+    if worker_count > 1:
+        executor = ProcessPoolExecutor(max_workers=worker_count, initializer=warm_engine_caches, initargs=(precision,))
+    reader.start()
+    writer.start()
+    try:
+        while True:
+            chunk = pending.get()
+            if chunk is done:
+                break
+            if stop.is_set():
+                # Unblock the reader so it sees the stop; its chunks are dropped.
+                continue
+            if executor is None or not chunk.records:
+                future: Future = Future()
+                future.set_result(compute_chunk(chunk.records))
+            else:
+                future = executor.submit(compute_chunk, chunk.records)
+            computed.put((chunk, future))
+    finally:
+        computed.put(done)
+        writer.join()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    reader.join()
+    for error in (writer.error, reader.error):
+        if error is not None:
+            raise error
+    return written
+
+
+def merge_shard_outputs(sources: Iterable[TextIO], output: TextIO) -> int:
+    # Interleaves shard outputs back into input order and unwraps each line, so the result is
+    # byte-identical to an unsharded run. Every shard i/N must be present once, end with its
+    # trailer and hold the record count the trailer states, and together the shards must cover
+    # every input record; anything short is an error.
+    trailers: list[tuple[str, dict]] = []
+    merged = heapq.merge(*(_shard_lines(source, trailers) for source in sources))
+    expected = 0
+    for record_number, line in merged:
+        if record_number != expected:
+            raise ValueError(f'Shard outputs are missing record {expected}.')
+        output.write(line)
+        expected += 1
+
+    if not trailers:
+        return expected
+    shard_count = int(trailers[0][1]['shard'].partition('/')[2])
+    found = sorted(trailer['shard'] for _, trailer in trailers)
+    wanted = sorted(f'{index}/{shard_count}' for index in range(shard_count))
+    if found != wanted:
+        raise ValueError(f'Shard outputs must be shards 0..{shard_count - 1} of {shard_count} once each, got {found}.')
+    input_records = {trailer['input_records'] for _, trailer in trailers}
+    if len(input_records) != 1:
+        raise ValueError('Shard outputs were computed from inputs of different lengths.')
+    if expected != input_records.pop():
+        raise ValueError(f'Shard outputs hold {expected} of {trailers[0][1]["input_records"]} input records.')
+    return expected
+
+
+def _shard_trailer(line: str, name: str) -> dict:
+    try:
+        trailer = json.loads(line)
+        shard = parse_shard(trailer['shard'])
+        counts = (trailer['input_records'], trailer['records'])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(f'{name}: damaged shard trailer.') from exc
+    if not line.endswith('\n') or not all(isinstance(count, int) and count >= 0 for count in counts):
+        raise ValueError(f'{name}: damaged shard trailer.')
+    return {**trailer, 'shard': f'{shard.index}/{shard.count}'}
+
+
+def _shard_lines(source: TextIO, trailers: list[tuple[str, dict]]) -> Iterator[tuple[int, str]]:
+    name = getattr(source, 'name', 'shard output')
+    trailer = None
+    records = 0
+    for line in source:
+        if trailer is not None:
+            raise ValueError(f'{name}: lines follow the shard trailer.')
+        if line.startswith(SHARD_TRAILER_PREFIX):
+            trailer = _shard_trailer(line, name)
+            continue
+        comma = line.find(',', len(SHARD_LINE_PREFIX))
+        if not line.startswith(SHARD_LINE_PREFIX) or comma < 0 or not line.endswith('}\n'):
+            raise ValueError('Not a sharded bulk output line.')
+        if not line.startswith(SHARD_LINE_RESULT, comma):
+            raise ValueError('Not a sharded bulk output line.')
+        records += 1
+        yield int(line[len(SHARD_LINE_PREFIX):comma]), f'{line[comma + len(SHARD_LINE_RESULT):-2]}\n'
+    if trailer is None:
+        raise ValueError(f'{name}: no shard trailer; the shard did not finish.')
+    if records != trailer['records']:
+        raise ValueError(f'{name}: holds {records} of the {trailer["records"]} records of shard {trailer["shard"]}.')
+    trailers.append((name, trailer))
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    # Every record before next_record is done and its lines end at output_bytes.
+    shard: str | None
+    precision: str
+    next_record: int
+    output_bytes: int
+    records_written: int
+    # Size and SHA-256 of the input file, so a resume against other input is refused.
+    input_bytes: int
+    input_sha256: str
+
+
+def input_fingerprint(path: str) -> tuple[int, str]:
+    with open(path, 'rb') as handle:
+        return os.fstat(handle.fileno()).st_size, hashlib.file_digest(handle, 'sha256').hexdigest()
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    with open(path, encoding='utf-8') as handle:
+        values = json.load(handle)
+    if values.get('format') != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f'{path}: unsupported checkpoint format.')
+    return Checkpoint(**{field.name: values[field.name] for field in fields(Checkpoint)})
+
+
+def write_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    # Written beside the target and renamed over it, so a crash never leaves half a checkpoint.
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        json.dump({'format': CHECKPOINT_FORMAT_VERSION, **asdict(checkpoint)}, handle, sort_keys=True)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def run_bulk(
+    input_path: str,
+    output_path: str,
+    input_format: str,
+    precision: str = PRECISION_AUTO,
+    workers: int | None = None,
+    chunk_rows: int = BULK_CHUNK_ROWS,
+    shard: str | None = None,
+    checkpoint_path: str | None = None,
+    checkpoint_records: int = CHECKPOINT_RECORDS,
+    resume: bool = False,
+) -> int:
+    # File-to-file run with optional shard, periodic checkpoints and resume. On resume the
+    # output is cut back to the checkpointed size and the checkpointed records are skipped.
+    shard_spec = parse_shard(shard) if shard else None
+    input_bytes, input_sha256 = input_fingerprint(input_path) if checkpoint_path else (0, '')
+    start = Checkpoint(
+        shard=shard,
+        precision=precision,
+        next_record=0,
+        output_bytes=0,
+        records_written=0,
+        input_bytes=input_bytes,
+        input_sha256=input_sha256,
+    )
+    if resume and checkpoint_path and os.path.exists(checkpoint_path):
+        saved = read_checkpoint(checkpoint_path)
+        if (saved.shard, saved.precision) != (shard, precision):
+            raise ValueError('Checkpoint was written for a different shard or precision.')
+        if (saved.input_bytes, saved.input_sha256) != (input_bytes, input_sha256):
+            raise ValueError('Checkpoint was written for a different input file.')
+        if not os.path.exists(output_path) or os.path.getsize(output_path) < saved.output_bytes:
+            raise ValueError('Output is shorter than its checkpoint.')
+        start = saved
+    with open(output_path, 'r+b' if start.output_bytes else 'wb') as handle:
+        handle.truncate(start.output_bytes)
+
+    with open(input_path, encoding='utf-8', newline='') as source, open(output_path, 'a', encoding='utf-8') as target:
+        last_checkpoint = next_record_read = start.next_record
+        written_now = 0
+
+        def save(next_record: int, written: int) -> None:
+            nonlocal last_checkpoint
+            target.flush()
+            os.fsync(target.fileno())
+            write_checkpoint(checkpoint_path, Checkpoint(
+                shard=shard,
+                precision=precision,
+                next_record=next_record,
+                output_bytes=os.fstat(target.fileno()).st_size,
+                records_written=start.records_written + written,
+                input_bytes=input_bytes,
+                input_sha256=input_sha256,
+            ))
+            last_checkpoint = next_record
+
+        def on_chunk_written(next_record: int, written: int) -> None:
+            nonlocal next_record_read, written_now
+            next_record_read, written_now = next_record, written
+            if checkpoint_path is not None and next_record - last_checkpoint >= checkpoint_records:
+                save(next_record, written)
+
+        run_pipeline(
+            read_records(source, input_format),
+            target,
+            precision=precision,
+            workers=workers,
+            chunk_rows=chunk_rows,
+            shard=shard_spec,
+            skip_records=start.next_record,
+            on_chunk_written=on_chunk_written,
+        )
+        if checkpoint_path is not None:
+            save(next_record_read, written_now)
+        # After the final checkpoint, so resuming a finished shard rewrites the trailer once.
+        if shard_spec is not None:
+            write_shard_trailer(target, shard_spec, next_record_read, start.records_written + written_now)
+    return start.records_written + written_now
+
+
+def _input_format(path: str, requested: str | None) -> str:
+    if requested:
+        return requested
+    return INPUT_FORMAT_CSV if path.lower().endswith('.csv') else INPUT_FORMAT_NDJSON
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='eight-characters-bulk',
+        description='Stream birth records through the engine as deterministic NDJSON, one line per record.',
+    )
+    parser.add_argument('input', nargs='?', default='-', help='NDJSON or CSV file of BirthInput fields; - for stdin.')
+    parser.add_argument('--output', default='-', help='Output NDJSON file; - for stdout.')
+    parser.add_argument('--format', choices=INPUT_FORMATS, default=None, help='Input format; inferred from the extension.')
+    parser.add_argument('--precision', choices=ALLOWED_ENGINE_PRECISIONS, default=PRECISION_AUTO)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-rows', type=int, default=BULK_CHUNK_ROWS)
+    parser.add_argument('--shard', default=None, help='Compute only shard i of N (i/N), partitioned by input hash.')
+    parser.add_argument('--checkpoint', default=None, help='Checkpoint file for file-to-file runs.')
+    parser.add_argument('--checkpoint-records', type=int, default=CHECKPOINT_RECORDS)
+    parser.add_argument('--resume', action='store_true', help='Continue from --checkpoint if it exists.')
+    parser.add_argument('--merge', nargs='+', default=None, metavar='SHARD_OUTPUT',
+                        help='Merge sharded outputs into --output in input order, then exit.')
+    args = parser.parse_args(argv)
+
+    if args.shard:
+        try:
+            parse_shard(args.shard)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if (args.checkpoint or args.resume) and '-' in (args.input, args.output):
+        parser.error('--checkpoint and --resume need an input file and an --output file.')
+    if args.resume and not args.checkpoint:
+        parser.error('--resume needs --checkpoint.')
+
+    target = sys.stdout if args.output == '-' else None
+    if args.merge:
+        sources = [open(path, encoding='utf-8') for path in args.merge]
+        try:
+            target = target or open(args.output, 'w', encoding='utf-8')
+            written = merge_shard_outputs(sources, target)
+        finally:
+            for source in sources:
+                source.close()
+            if target is not None and target is not sys.stdout:
+                target.close()
+        print(f'merged {written} records', file=sys.stderr)
+        return 0
+
+    input_format = _input_format(args.input, args.format)
+    if '-' not in (args.input, args.output):
+        written = run_bulk(
+            args.input,
+            args.output,
+            input_format,
+            precision=args.precision,
+            workers=args.workers,
+            chunk_rows=args.chunk_rows,
+            shard=args.shard,
+            checkpoint_path=args.checkpoint,
+            checkpoint_records=args.checkpoint_records,
+            resume=args.resume,
+        )
+        print(f'wrote {written} records', file=sys.stderr)
+        return 0
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', newline='')
+    target = target or open(args.output, 'w', encoding='utf-8')
+    shard = parse_shard(args.shard) if args.shard else None
+    input_records = 0
+
+    def count_input(next_record: int, written: int) -> None:
+        nonlocal input_records
+        input_records = next_record
+
+    try:
+        written = run_pipeline(
+            read_records(source, input_format),
+            target,
+            precision=args.precision,
+            workers=args.workers,
+            chunk_rows=args.chunk_rows,
+            shard=shard,
+            on_chunk_written=count_input,
+        )
+        if shard is not None:
+            write_shard_trailer(target, shard, input_records, written)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f'wrote {written} records', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+
+ValueT = TypeVar('ValueT')
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class BoundedLRUCache(Generic[ValueT]):
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, ValueT] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], ValueT]) -> ValueT:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        # Computed outside the lock so slow solves never serialize unrelated keys.
+        value = compute()
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = value
+                if len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+            return self._entries[key]
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -1,10 +1,17 @@
+from array import array
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from importlib import metadata
 from bisect import bisect_right
+from types import MappingProxyType
+from typing import Mapping
+
+from eight_characters import __version__
 
 
 UTC = timezone.utc
+UNIX_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_SECOND = timedelta(seconds=1)
 
 ENGINE_MODEL_IDS = {
     'vsop87_series': 'VSOP87D_full_Earth',
@@ -83,6 +90,7 @@ DELTA_T_SEGMENTS: tuple[DeltaTSegment, ...] = (
     Segment2005to2050(2005.0, 2050.0, 't = y - 2000'),
     Segment2050to2150(2050.0, 2150.0, 'u = (y - 1820) / 100'),
 )
+DELTA_T_SEGMENT_STARTS = tuple(segment.start_year for segment in DELTA_T_SEGMENTS)
 
 
 # Effective TAI-UTC at each UTC threshold moment.
@@ -117,7 +125,9 @@ LEAP_SECOND_OFFSETS: tuple[tuple[datetime, int], ...] = (
     (datetime(2017, 1, 1, tzinfo=UTC), 37),
 )
 
-_LEAP_THRESHOLDS = tuple(item[0] for item in LEAP_SECOND_OFFSETS)
+# The same table keyed by integer POSIX seconds.
+LEAP_SECOND_THRESHOLDS_POSIX = array('q', ((threshold - UNIX_EPOCH_UTC) // ONE_SECOND for threshold, _ in LEAP_SECOND_OFFSETS))
+LEAP_SECOND_TAI_MINUS_UTC = array('b', (offset for _, offset in LEAP_SECOND_OFFSETS))
 
 
 def get_tzdb_version() -> str:
@@ -127,18 +137,66 @@ def get_tzdb_version() -> str:
         return 'system'
 
 
+@dataclass(frozen=True)
+class EngineMetadata:
+    version: str
+    tzdb_version: str
+    leap_second_table: Mapping[str, str]
+    model_ids: Mapping[str, str]
+
+    def engine_section(self, vsop87_precision: str) -> dict:
+        return {
+            'version': self.version,
+            'vsop87_series': self.model_ids['vsop87_series'],
+            'vsop87_precision': vsop87_precision,
+            'nutation_model': self.model_ids['nutation_model'],
+            'mean_obliquity_model': self.model_ids['mean_obliquity_model'],
+            'delta_t_model': self.model_ids['delta_t_model'],
+            'tzdb_version': self.tzdb_version,
+            'leap_second_table': dict(self.leap_second_table),
+        }
+
+
+def build_engine_metadata() -> EngineMetadata:
+    return EngineMetadata(
+        version=__version__,
+        tzdb_version=get_tzdb_version(),
+        leap_second_table=MappingProxyType(dict(LEAP_SECOND_METADATA)),
+        model_ids=MappingProxyType(dict(ENGINE_MODEL_IDS)),
+    )
+
+
+# Distribution metadata lookups scan site-packages, so the snapshot is taken once per process.
+_ENGINE_METADATA = build_engine_metadata()
+
+
+def get_engine_metadata() -> EngineMetadata:
+    return _ENGINE_METADATA
+
+
+def refresh_engine_metadata() -> EngineMetadata:
+    global _ENGINE_METADATA
+    _ENGINE_METADATA = build_engine_metadata()
+    return _ENGINE_METADATA
+
+
 def get_leap_second_offset_seconds(utc_datetime: datetime) -> int:
     if utc_datetime.tzinfo is None:
         raise ValueError('utc_datetime must be timezone-aware UTC.')
 
-    idx = bisect_right(_LEAP_THRESHOLDS, utc_datetime) - 1
+    return leap_second_offset_for_posix_seconds((utc_datetime - UNIX_EPOCH_UTC) // ONE_SECOND)
+
+
+def leap_second_offset_for_posix_seconds(posix_seconds: int) -> int:
+    idx = bisect_right(LEAP_SECOND_THRESHOLDS_POSIX, posix_seconds) - 1
     if idx < 0:
         return 0
-    return LEAP_SECOND_OFFSETS[idx][1]
+    return LEAP_SECOND_TAI_MINUS_UTC[idx]
 
 
 def evaluate_delta_t_seconds(decimal_year_value: float) -> float:
-    for segment in DELTA_T_SEGMENTS:
-        if segment.contains(decimal_year_value):
-            return segment.evaluate(decimal_year_value)
+    # Segments are contiguous, so the last one starting at or before the year is the only candidate.
+    segment = DELTA_T_SEGMENTS[bisect_right(DELTA_T_SEGMENT_STARTS, decimal_year_value) - 1]
+    if segment.contains(decimal_year_value):
+        return segment.evaluate(decimal_year_value)
     raise ValueError('Decimal year outside supported delta-T segments.')
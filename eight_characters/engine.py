@@ -1,19 +1,17 @@
 from dataclasses import asdict
-from datetime import datetime
+from typing import Iterable
 
-from eight_characters import __version__
 from eight_characters.conventions import (
     DAY_BOUNDARY_BASIS_TRUE_SOLAR,
     HOUR_BASIS_TRUE_SOLAR,
     ConventionSettings,
 )
-from eight_characters.embedded_data import ENGINE_MODEL_IDS, get_tzdb_version
+from eight_characters.embedded_data import EngineMetadata, get_engine_metadata
 from eight_characters.integrity import (
     build_alternative_zi_convention,
     hour_boundary_distance_seconds,
     is_zi_hour_window,
     model_uncertainty_seconds_for_year,
-    validate_pillar_set,
 )
 from eight_characters.output import dumps_deterministic
 from eight_characters.sexagenary import (
@@ -25,17 +23,35 @@ from eight_characters.sexagenary import (
     year_pillar,
 )
 from eight_characters.solar_position import (
+    SECONDS_PER_DAY,
+    SolarPositionResult,
     compute_solar_position_and_tst,
-    julian_date_from_datetime_utc,
+    julian_date_from_posix_ns,
 )
 from eight_characters.solar_term_solver import (
-    find_solar_term,
     lichun_jd_tt_for_civil_year,
     nearest_jie_distance_seconds,
+    solar_term_jd_tt,
+)
+from eight_characters.solar_term_table import get_solar_term_table
+from eight_characters.time_convert import (
+    BIRTH_INPUT_ERRORS,
+    BirthInput,
+    NormalizedTimeInput,
+    convert_utc_to_tt,
+    normalize_birth_input,
+    normalize_birth_inputs,
+)
+from eight_characters.vsop87d import (
+    ALLOWED_PRECISION_TIERS,
+    PRECISION_FAST,
+    PRECISION_REFERENCE,
 )
-from eight_characters.time_convert import BirthInput, convert_utc_to_tt, normalize_birth_input
 
 
+# Loaded eagerly so a corrupt table or one built for other models fails at import.
+SOLAR_TERM_TABLE = get_solar_term_table()
+
 TERM_LABEL_BY_TARGET = {
     315.0: 'lichun_315',
     345.0: 'jingzhe_345',
@@ -51,37 +67,62 @@ TERM_LABEL_BY_TARGET = {
     285.0: 'xiaohan_285',
 }
 
-MONTH_BOUNDARIES = (315.0, 345.0, 15.0, 45.0, 75.0, 105.0, 135.0, 165.0, 195.0, 225.0, 255.0, 285.0)
-
-TERM_SEED_MONTH_DAY = {
-    285.0: (1, 5),
-    315.0: (2, 4),
-    345.0: (3, 6),
-    15.0: (4, 5),
-    45.0: (5, 6),
-    75.0: (6, 6),
-    105.0: (7, 7),
-    135.0: (8, 7),
-    165.0: (9, 7),
-    195.0: (10, 8),
-    225.0: (11, 7),
-    255.0: (12, 7),
-}
 
+PRECISION_AUTO = 'auto'
+ALLOWED_ENGINE_PRECISIONS = (PRECISION_AUTO, *ALLOWED_PRECISION_TIERS)
 
-def _seed_jd_for_target(year_value: int, target_longitude: float) -> float:
-    month_value, day_value = TERM_SEED_MONTH_DAY[target_longitude]
-    seed_dt = datetime(year_value, month_value, day_value, 0, 0, 0)
-    return julian_date_from_datetime_utc(seed_dt)
+# Auto precision keeps the fast series unless the result sits within these margins of a
+# month (jie) boundary or a double-hour boundary; both are over 30x the fast-tier error.
+AUTO_PRECISION_GUARD_ARCSECONDS = 36.0
+AUTO_PRECISION_GUARD_SECONDS = 5.0
 
 
-def _nearby_month_term_jds(civil_year: int) -> list[float]:
-    values: list[float] = []
-    for year_value in (civil_year - 1, civil_year, civil_year + 1):
-        for target in MONTH_BOUNDARIES:
-            seed_jd = _seed_jd_for_target(year_value, target)
-            values.append(find_solar_term(target, seed_jd))
-    return values
+ENGINE_SECTIONS = ('engine', 'input', 'intermediate', 'pillars', 'flags', 'meta')
+ALL_ENGINE_SECTIONS = frozenset(ENGINE_SECTIONS)
+# Sections that read the solar position at the engine's precision.
+POSITION_SECTIONS = frozenset(('intermediate', 'pillars', 'flags'))
+
+# Errors a single malformed BirthInput raises, during normalization or payload computation.
+RECORD_ERRORS = BIRTH_INPUT_ERRORS
+
+
+def _nearest_jie_distance_seconds(jd_tt: float, lambda_apparent_deg: float, civil_year: int) -> float:
+    # The nearest jie is one of the two bounding the sun's current 30-degree month, in the
+    # civil year before, of, or after the birth: six lookups give the same minimum as
+    # scanning all 36 jie of those years.
+    previous_jie = (lambda_apparent_deg - 15.0) // 30.0 * 30.0 + 15.0
+    return nearest_jie_distance_seconds(
+        jd_tt,
+        [
+            solar_term_jd_tt(year_value, target % 360.0)
+            for target in (previous_jie, previous_jie + 30.0)
+            for year_value in (civil_year - 1, civil_year, civil_year + 1)
+        ],
+    )
+
+
+def resolve_engine_sections(sections: Iterable[str] | None) -> frozenset[str]:
+    if sections is None:
+        return ALL_ENGINE_SECTIONS
+    selected = frozenset(sections)
+    unknown = sorted(selected - ALL_ENGINE_SECTIONS)
+    if unknown:
+        raise ValueError(f'Unknown payload section: {unknown[0]}')
+    if not selected:
+        raise ValueError('At least one payload section is required.')
+    return selected
+
+
+def _month_boundary_distance_arcseconds(lambda_apparent_deg: float) -> float:
+    # Jie longitudes are the odd multiples of 15 degrees.
+    offset_deg = (lambda_apparent_deg - 15.0) % 30.0
+    return min(offset_deg, 30.0 - offset_deg) * 3600.0
+
+
+def _needs_reference_precision(solar: SolarPositionResult) -> bool:
+    if _month_boundary_distance_arcseconds(solar.lambda_apparent_deg) < AUTO_PRECISION_GUARD_ARCSECONDS:
+        return True
+    return hour_boundary_distance_seconds(solar.true_solar_time) < AUTO_PRECISION_GUARD_SECONDS
 
 
 def _boundary_note(distance_seconds: float, label: str) -> str:
@@ -103,104 +144,105 @@ def _pillar_dict(pillar_obj) -> dict:
     }
 
 
-def compute_engine_payload(value: BirthInput) -> dict:
-    normalized = normalize_birth_input(value)
-    tt_result = convert_utc_to_tt(normalized.utc_datetime)
-
-    solar = compute_solar_position_and_tst(
-        utc_datetime=normalized.utc_datetime,
-        longitude_deg=normalized.longitude,
-        tt_minus_utc_seconds=tt_result.tt_minus_utc_seconds,
-    )
+def validate_engine_precision(precision: str) -> None:
+    if precision not in ALLOWED_ENGINE_PRECISIONS:
+        raise ValueError('Invalid precision tier.')
 
-    lichun_jd = lichun_jd_tt_for_civil_year(normalized.utc_datetime.year)
-    year_result, bazi_year = year_pillar(
-        civil_year=normalized.utc_datetime.year,
-        birth_jd_tt=solar.jd_tt,
-        lichun_jd_tt=lichun_jd,
-    )
-    month_result = month_pillar(
-        lambda_apparent_deg=solar.lambda_apparent_deg,
-        year_stem_idx=year_result.stem_idx,
-    )
 
-    if normalized.civil_datetime_local is None:
-        civil_local_naive = normalized.utc_datetime.replace(tzinfo=None)
-    else:
-        civil_local_naive = normalized.civil_datetime_local
-
-    day_result = day_pillar(
-        civil_dt_local=civil_local_naive,
-        tst_dt=solar.true_solar_time,
-        conventions=value.conventions,
-    )
-    hour_result = hour_pillar(
-        day_stem_idx=day_result.pillar.stem_idx,
-        civil_dt_local=civil_local_naive,
-        tst_dt=solar.true_solar_time,
-        conventions=value.conventions,
+def compute_engine_payload(
+    value: BirthInput,
+    precision: str = PRECISION_AUTO,
+    sections: Iterable[str] | None = None,
+) -> dict:
+    validate_engine_precision(precision)
+    selected = resolve_engine_sections(sections)
+    engine_metadata = get_engine_metadata()
+    normalized = normalize_birth_input(value)
+    return _payload_from_normalized(
+        value,
+        normalized,
+        precision,
+        engine_metadata,
+        lichun_jd_tt_for_civil_year(normalized.utc_datetime.year),
+        selected,
     )
 
-    pillars = {
-        'year': year_result,
-        'month': month_result,
-        'day': day_result.pillar,
-        'hour': hour_result,
-    }
-    validate_pillar_set(pillars)
 
-    term_jds = _nearby_month_term_jds(normalized.utc_datetime.year)
-    nearest_term_seconds = nearest_jie_distance_seconds(solar.jd_tt, term_jds)
-    model_uncertainty_seconds = model_uncertainty_seconds_for_year(normalized.utc_datetime.year)
-    user_uncertainty = value.birth_time_uncertainty_seconds or 0.0
-    total_uncertainty_seconds = max(model_uncertainty_seconds, user_uncertainty)
-    solar_term_ambiguous = nearest_term_seconds < total_uncertainty_seconds
+def _payload_from_normalized(
+    value: BirthInput,
+    normalized: NormalizedTimeInput,
+    precision: str,
+    engine_metadata: EngineMetadata,
+    lichun_jd: float,
+    sections: frozenset[str],
+) -> dict:
+    # Only the work the requested sections need: 'input' needs neither the solar position nor a
+    # pillar, 'engine' alone needs just the auto-precision check and 'meta' just the year pillar.
+    position_needed = not sections.isdisjoint(POSITION_SECTIONS)
+    tt_result = None
+    if sections != {'input'}:
+        tt_result = convert_utc_to_tt(normalized.utc_datetime, normalized.utc_posix_ns)
 
-    if value.conventions.hour_basis == HOUR_BASIS_TRUE_SOLAR:
-        hour_basis_dt = solar.true_solar_time
-    else:
-        hour_basis_dt = civil_local_naive
-    hour_boundary_seconds = hour_boundary_distance_seconds(hour_basis_dt)
+    solar = None
+    if position_needed or 'engine' in sections:
+        solar = compute_solar_position_and_tst(
+            utc_datetime=normalized.utc_datetime,
+            longitude_deg=normalized.longitude,
+            tt_minus_utc_seconds=tt_result.tt_minus_utc_seconds,
+            precision=PRECISION_FAST if precision == PRECISION_AUTO else precision,
+            utc_posix_ns=normalized.utc_posix_ns,
+        )
+        solar_precision = solar.precision
+        if precision == PRECISION_AUTO and _needs_reference_precision(solar):
+            solar_precision = PRECISION_REFERENCE
+            if position_needed:
+                solar = compute_solar_position_and_tst(
+                    utc_datetime=normalized.utc_datetime,
+                    longitude_deg=normalized.longitude,
+                    tt_minus_utc_seconds=tt_result.tt_minus_utc_seconds,
+                    precision=PRECISION_REFERENCE,
+                    utc_posix_ns=normalized.utc_posix_ns,
+                )
 
-    if value.conventions.day_boundary_basis == DAY_BOUNDARY_BASIS_TRUE_SOLAR:
-        zi_basis_dt = solar.true_solar_time
+    if normalized.civil_datetime_local is None:
+        civil_local_naive = normalized.utc_datetime.replace(tzinfo=None)
     else:
-        zi_basis_dt = civil_local_naive
-    zi_window = is_zi_hour_window(zi_basis_dt)
+        civil_local_naive = normalized.civil_datetime_local
 
-    alternative_pillars = None
-    if zi_window:
-        alternative_conventions = build_alternative_zi_convention(value.conventions)
-        alt_day = day_pillar(
+    if 'pillars' in sections or 'meta' in sections:
+        if solar is None:
+            jd_utc = julian_date_from_posix_ns(normalized.utc_posix_ns)
+            birth_jd_tt = jd_utc + tt_result.tt_minus_utc_seconds / SECONDS_PER_DAY
+        else:
+            birth_jd_tt = solar.jd_tt
+        year_result, bazi_year = year_pillar(
+            civil_year=normalized.utc_datetime.year,
+            birth_jd_tt=birth_jd_tt,
+            lichun_jd_tt=lichun_jd,
+        )
+    if 'intermediate' in sections or 'pillars' in sections:
+        day_result = day_pillar(
             civil_dt_local=civil_local_naive,
             tst_dt=solar.true_solar_time,
-            conventions=alternative_conventions,
+            conventions=value.conventions,
+        )
+    if 'pillars' in sections:
+        month_result = month_pillar(
+            lambda_apparent_deg=solar.lambda_apparent_deg,
+            year_stem_idx=year_result.stem_idx,
         )
-        alt_hour = hour_pillar(
-            day_stem_idx=alt_day.pillar.stem_idx,
+        hour_result = hour_pillar(
+            day_stem_idx=day_result.pillar.stem_idx,
             civil_dt_local=civil_local_naive,
             tst_dt=solar.true_solar_time,
-            conventions=alternative_conventions,
+            conventions=value.conventions,
         )
-        alternative_pillars = {
-            'day': _pillar_dict(alt_day.pillar),
-            'hour': _pillar_dict(alt_hour),
-            'conventions': asdict(alternative_conventions),
-        }
 
-    lichun_distance_seconds = (solar.jd_tt - lichun_jd) * 86400.0
-
-    payload = {
-        'engine': {
-            'version': __version__,
-            'vsop87_series': ENGINE_MODEL_IDS['vsop87_series'],
-            'nutation_model': ENGINE_MODEL_IDS['nutation_model'],
-            'mean_obliquity_model': ENGINE_MODEL_IDS['mean_obliquity_model'],
-            'delta_t_model': ENGINE_MODEL_IDS['delta_t_model'],
-            'tzdb_version': get_tzdb_version(),
-            'leap_second_table': tt_result.leap_second_metadata,
-        },
-        'input': {
+    payload = {}
+    if 'engine' in sections:
+        payload['engine'] = engine_metadata.engine_section(solar_precision)
+    if 'input' in sections:
+        payload['input'] = {
             'date': civil_local_naive.strftime('%Y-%m-%d'),
             'time': civil_local_naive.strftime('%H:%M:%S'),
             'timezone': normalized.timezone_name,
@@ -209,8 +251,9 @@ def compute_engine_payload(value: BirthInput) -> dict:
             'latitude': normalized.latitude,
             'birth_time_uncertainty_seconds': value.birth_time_uncertainty_seconds,
             'conventions': asdict(value.conventions),
-        },
-        'intermediate': {
+        }
+    if 'intermediate' in sections:
+        payload['intermediate'] = {
             'utc_time': normalized.utc_datetime.strftime('%Y-%m-%dT%H:%M:%SZ'),
             'delta_t_seconds': tt_result.delta_t_seconds,
             'tt_conversion_method': tt_result.conversion_method,
@@ -222,8 +265,18 @@ def compute_engine_payload(value: BirthInput) -> dict:
             'effective_day_date': day_result.effective_date.isoformat(),
             'julian_day_number': day_result.jdn,
             'sexagenary_day_index': day_result.idx0,
-        },
-        'pillars': {
+        }
+
+    if 'pillars' in sections or 'flags' in sections:
+        nearest_term_seconds = _nearest_jie_distance_seconds(
+            solar.jd_tt,
+            solar.lambda_apparent_deg,
+            normalized.utc_datetime.year,
+        )
+
+    if 'pillars' in sections:
+        lichun_distance_seconds = (solar.jd_tt - lichun_jd) * 86400.0
+        payload['pillars'] = {
             'year': {
                 **_pillar_dict(year_result),
                 'boundary': {
@@ -242,22 +295,104 @@ def compute_engine_payload(value: BirthInput) -> dict:
             },
             'day': _pillar_dict(day_result.pillar),
             'hour': _pillar_dict(hour_result),
-        },
-        'flags': {
+        }
+
+    if 'flags' in sections:
+        model_uncertainty_seconds = model_uncertainty_seconds_for_year(normalized.utc_datetime.year)
+        user_uncertainty = value.birth_time_uncertainty_seconds or 0.0
+        total_uncertainty_seconds = max(model_uncertainty_seconds, user_uncertainty)
+        solar_term_ambiguous = nearest_term_seconds < total_uncertainty_seconds
+
+        if value.conventions.hour_basis == HOUR_BASIS_TRUE_SOLAR:
+            hour_basis_dt = solar.true_solar_time
+        else:
+            hour_basis_dt = civil_local_naive
+        hour_boundary_seconds = hour_boundary_distance_seconds(hour_basis_dt)
+
+        if value.conventions.day_boundary_basis == DAY_BOUNDARY_BASIS_TRUE_SOLAR:
+            zi_basis_dt = solar.true_solar_time
+        else:
+            zi_basis_dt = civil_local_naive
+        zi_window = is_zi_hour_window(zi_basis_dt)
+
+        alternative_pillars = None
+        if zi_window:
+            alternative_conventions = build_alternative_zi_convention(value.conventions)
+            alt_day = day_pillar(
+                civil_dt_local=civil_local_naive,
+                tst_dt=solar.true_solar_time,
+                conventions=alternative_conventions,
+            )
+            alt_hour = hour_pillar(
+                day_stem_idx=alt_day.pillar.stem_idx,
+                civil_dt_local=civil_local_naive,
+                tst_dt=solar.true_solar_time,
+                conventions=alternative_conventions,
+            )
+            alternative_pillars = {
+                'day': _pillar_dict(alt_day.pillar),
+                'hour': _pillar_dict(alt_hour),
+                'conventions': asdict(alternative_conventions),
+            }
+
+        payload['flags'] = {
             'zi_hour_window': zi_window,
             'solar_term_ambiguous': solar_term_ambiguous,
             'hour_boundary_proximity_seconds': hour_boundary_seconds,
             'model_uncertainty_seconds': model_uncertainty_seconds,
             'high_latitude_warning': normalized.high_latitude_warning,
             'alternative_pillars': alternative_pillars,
-        },
-        'meta': {
+        }
+
+    if 'meta' in sections:
+        payload['meta'] = {
             'bazi_year': bazi_year,
-        },
-    }
+        }
     return payload
 
 
-def compute_engine_json(value: BirthInput) -> str:
-    payload = compute_engine_payload(value)
+def _error_payload(exc: Exception) -> dict:
+    return {'error': {'type': type(exc).__name__, 'message': str(exc)}}
+
+
+def compute_engine_payloads(
+    values: Iterable[BirthInput],
+    precision: str = PRECISION_AUTO,
+    sections: Iterable[str] | None = None,
+) -> list[dict]:
+    # Results are in input order; a row that compute_engine_payload would reject with one of
+    # RECORD_ERRORS (including DST gaps and folds) becomes {'error': {'type', 'message'}}.
+    # Local times are resolved zone by zone in one normalize_birth_inputs call; Lichun and the
+    # jie come from the solar-term cache, which holds every supported year.
+    validate_engine_precision(precision)
+    selected = resolve_engine_sections(sections)
+    engine_metadata = get_engine_metadata()
+    rows = list(values)
+    results = []
+    for value, normalized in zip(rows, normalize_birth_inputs(rows)):
+        if isinstance(normalized, Exception):
+            results.append(_error_payload(normalized))
+            continue
+        try:
+            results.append(
+                _payload_from_normalized(
+                    value,
+                    normalized,
+                    precision,
+                    engine_metadata,
+                    lichun_jd_tt_for_civil_year(normalized.utc_datetime.year),
+                    selected,
+                )
+            )
+        except RECORD_ERRORS as exc:
+            results.append(_error_payload(exc))
+    return results
+
+
+def compute_engine_json(
+    value: BirthInput,
+    precision: str = PRECISION_AUTO,
+    sections: Iterable[str] | None = None,
+) -> str:
+    payload = compute_engine_payload(value, precision, sections)
     return dumps_deterministic(payload)
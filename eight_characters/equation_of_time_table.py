@@ -0,0 +1,142 @@
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from math import floor
+from pathlib import Path
+from typing import Sequence
+
+from eight_characters.embedded_data import ENGINE_MODEL_IDS
+from eight_characters.packed_data import PackedDataError, map_packed_file, write_packed_file
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.sexagenary import gregorian_to_jdn
+from eight_characters.solar_position import SECONDS_PER_DAY, julian_date_from_posix_ns, series_data_sha256
+from eight_characters.time_convert import posix_ns_from_datetime_utc
+
+
+EQUATION_OF_TIME_TABLE_KIND = 'equation_of_time'
+EQUATION_OF_TIME_TABLE_FORMAT_VERSION = 1
+EQUATION_OF_TIME_TABLE_PATH = Path(__file__).resolve().parent / 'tables' / 'equation_of_time.bin'
+
+# Daily nodes at 0h TT; two extra nodes on each side keep the four-point stencil in-table.
+EQUATION_OF_TIME_NODE_DAYS = 1.0
+EQUATION_OF_TIME_PADDING_NODES = 2
+EQUATION_OF_TIME_FIRST_JD_TT = gregorian_to_jdn(MIN_SUPPORTED_YEAR, 1, 1) - 0.5 - EQUATION_OF_TIME_PADDING_NODES
+EQUATION_OF_TIME_LAST_JD_TT = gregorian_to_jdn(MAX_SUPPORTED_YEAR + 1, 1, 1) - 0.5 + EQUATION_OF_TIME_PADDING_NODES
+
+# Documented maximum deviation from the reference pipeline; output rounds the equation of
+# time to 0.01 minute and true solar time to whole seconds, so this never shows.
+EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES = 1e-5
+
+
+class EquationOfTimeRangeError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class EquationOfTimeTable:
+    first_jd_tt: float
+    node_days: float
+    values: Sequence[float]
+
+    @property
+    def last_jd_tt(self) -> float:
+        return self.first_jd_tt + (len(self.values) - 1) * self.node_days
+
+    def covers(self, jd_tt: float) -> bool:
+        return self.first_jd_tt + self.node_days <= jd_tt < self.last_jd_tt - self.node_days
+
+    def equation_of_time_minutes(self, jd_tt: float) -> float:
+        if not self.covers(jd_tt):
+            raise EquationOfTimeRangeError(f'JD(TT) {jd_tt} is outside the equation-of-time table.')
+        position = (jd_tt - self.first_jd_tt) / self.node_days
+        index = floor(position)
+        s = position - index
+        values = self.values
+        # Four-point Lagrange cubic through nodes index-1 .. index+2.
+        return (
+            -s * (s - 1.0) * (s - 2.0) / 6.0 * values[index - 1]
+            + (s + 1.0) * (s - 1.0) * (s - 2.0) / 2.0 * values[index]
+            - (s + 1.0) * s * (s - 2.0) / 2.0 * values[index + 1]
+            + (s + 1.0) * s * (s - 1.0) / 6.0 * values[index + 2]
+        )
+
+
+def write_equation_of_time_table(
+    target_file: str | Path,
+    first_jd_tt: float,
+    node_days: float,
+    values: list[float],
+    max_error_minutes: float,
+) -> None:
+    packed = array('d', values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    write_packed_file(
+        target_file,
+        kind=EQUATION_OF_TIME_TABLE_KIND,
+        format_version=EQUATION_OF_TIME_TABLE_FORMAT_VERSION,
+        metadata={
+            'first_jd_tt': first_jd_tt,
+            'max_error_minutes': max_error_minutes,
+            'model_ids': dict(ENGINE_MODEL_IDS),
+            'node_count': len(values),
+            'node_days': node_days,
+            'series_sha256': series_data_sha256(),
+            'time_scale': 'TT',
+            'unit': 'minutes',
+        },
+        payload=packed.tobytes(),
+    )
+
+
+def load_equation_of_time_table(source_file: str | Path) -> EquationOfTimeTable:
+    packed = map_packed_file(
+        source_file,
+        expected_kind=EQUATION_OF_TIME_TABLE_KIND,
+        expected_format_version=EQUATION_OF_TIME_TABLE_FORMAT_VERSION,
+    )
+    metadata = packed.metadata
+    if metadata['model_ids'] != ENGINE_MODEL_IDS:
+        raise PackedDataError(
+            'Equation-of-time table was built with different model ids; '
+            'rebuild it with python -m eight_characters.build_eot.'
+        )
+    if metadata.get('series_sha256') != series_data_sha256():
+        raise PackedDataError(
+            'Equation-of-time table was built from different VSOP87D or nutation data; '
+            'rebuild it with python -m eight_characters.build_eot.'
+        )
+    if sys.byteorder == 'little':
+        values = packed.payload.cast('d')
+    else:
+        values = array('d', bytes(packed.payload))
+        values.byteswap()
+    if len(values) != int(metadata['node_count']):
+        raise PackedDataError('Equation-of-time payload length does not match its node count.')
+    return EquationOfTimeTable(
+        first_jd_tt=float(metadata['first_jd_tt']),
+        node_days=float(metadata['node_days']),
+        values=values,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_equation_of_time_table() -> EquationOfTimeTable:
+    return load_equation_of_time_table(EQUATION_OF_TIME_TABLE_PATH)
+
+
+def true_solar_time_from_table(
+    utc_datetime: datetime,
+    longitude_deg: float,
+    tt_minus_utc_seconds: float,
+    utc_posix_ns: int | None = None,
+) -> tuple[datetime, datetime, float]:
+    # (local mean solar time, true solar time, equation of time) without the VSOP87D series.
+    if utc_posix_ns is None:
+        utc_posix_ns = posix_ns_from_datetime_utc(utc_datetime)
+    jd_tt = julian_date_from_posix_ns(utc_posix_ns) + tt_minus_utc_seconds / SECONDS_PER_DAY
+    equation_of_time_minutes = get_equation_of_time_table().equation_of_time_minutes(jd_tt)
+    lmst_dt = utc_datetime.replace(tzinfo=None) + timedelta(hours=longitude_deg / 15.0)
+    return lmst_dt, lmst_dt + timedelta(minutes=equation_of_time_minutes), equation_of_time_minutes
@@ -0,0 +1,232 @@
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        'eight_characters.extras.numpy_solar needs numpy: pip install eight-characters[numpy]'
+    ) from error
+
+from eight_characters.nutation import (
+    ARCSECONDS_PER_TURN,
+    COEFFICIENT_ARCSECONDS,
+    DAYS_PER_CENTURY,
+    DELAUNAY_POLYNOMIALS,
+    LUNISOLAR_ARGUMENT_COUNT,
+    NUTATION_NODE_DAYS,
+    PLANETARY_ARGUMENT_COUNT,
+    PLANETARY_ARGUMENTS,
+    RADIANS_PER_ARCSECOND,
+    get_nutation_plan,
+)
+from eight_characters.obliquity import true_obliquity_radians
+from eight_characters.solar_batch import (
+    DEGREES_PER_DAY_OF_LONGITUDE,
+    MINUTES_PER_DAY,
+    SolarPositionColumns,
+)
+from eight_characters.solar_position import (
+    ABERRATION_ARCSECONDS,
+    DAYS_PER_MILLENNIUM,
+    J2000_JD,
+    SECONDS_PER_DAY,
+    equation_of_time_from_right_ascension_deg,
+)
+from eight_characters.vsop87d import DEG_PER_RAD, PRECISION_REFERENCE, get_earth_series
+
+if TYPE_CHECKING:
+    from eight_characters.solar_ephemeris import SolarEphemeris
+
+
+# Instants (or nutation nodes) per vectorized block; bounds the terms x instants temporaries.
+CHUNK_SIZE = 2048
+
+
+@lru_cache(maxsize=None)
+def _vsop_blocks(precision: str) -> tuple[tuple[tuple[np.ndarray, np.ndarray, np.ndarray], ...], ...]:
+    earth = get_earth_series(precision)
+    blocks = []
+    for series in (earth.longitude, earth.latitude, earth.radius):
+        series_blocks = []
+        for coefficients in series:
+            terms = np.asarray(coefficients, dtype=np.float64).reshape(-1, 3)
+            series_blocks.append((terms[:, 0].copy(), terms[:, 1:2].copy(), terms[:, 2:3].copy()))
+        blocks.append(tuple(series_blocks))
+    return tuple(blocks)
+
+
+def _evaluate_vsop(series_blocks: tuple, tau: np.ndarray) -> np.ndarray:
+    total = np.zeros_like(tau)
+    for amplitudes, phases, frequencies in reversed(series_blocks):
+        total = total * tau + amplitudes @ np.cos(phases + frequencies * tau)
+    return total
+
+
+@lru_cache(maxsize=1)
+def _nutation_arrays() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Multipliers (terms x 19) and two weight matrices whose rows, applied to the sin and cos
+    # of every term argument, give psi, psi*t, eps, eps*t and the matching rate parts.
+    plan = get_nutation_plan()
+    multipliers = np.zeros((len(plan.terms), LUNISOLAR_ARGUMENT_COUNT + PLANETARY_ARGUMENT_COUNT))
+    for row, term in enumerate(plan.terms):
+        for slot, multiplier in term[0]:
+            multipliers[row, slot] = multiplier
+    rate = np.array([term[1] for term in plan.terms])
+    psi_sin, psi_sin_t, psi_cos, eps_cos, eps_cos_t, eps_sin = np.array([term[2:] for term in plan.terms]).T
+    zero = np.zeros_like(rate)
+    sin_weights = np.array((
+        psi_sin, psi_sin_t, eps_sin, zero,
+        -psi_cos * rate + psi_sin_t, zero, -eps_cos * rate, -eps_cos_t * rate,
+    ))
+    cos_weights = np.array((
+        psi_cos, zero, eps_cos, eps_cos_t,
+        psi_sin * rate, psi_sin_t * rate, eps_sin * rate + eps_cos_t, zero,
+    ))
+    return multipliers, sin_weights, cos_weights
+
+
+def _fundamental_arguments(t_centuries: np.ndarray) -> np.ndarray:
+    arguments = np.empty((LUNISOLAR_ARGUMENT_COUNT + PLANETARY_ARGUMENT_COUNT, len(t_centuries)))
+    for slot, polynomial in enumerate(DELAUNAY_POLYNOMIALS):
+        value = np.zeros_like(t_centuries)
+        for coefficient in reversed(polynomial):
+            value = value * t_centuries + coefficient
+        arguments[slot] = np.fmod(value, ARCSECONDS_PER_TURN) * RADIANS_PER_ARCSECOND
+    for index, (constant, rate) in enumerate(PLANETARY_ARGUMENTS):
+        arguments[LUNISOLAR_ARGUMENT_COUNT + index] = constant + rate * t_centuries
+    arguments[-1] *= t_centuries
+    return arguments
+
+
+def _nutation_nodes(day_indexes: np.ndarray) -> np.ndarray:
+    # Rows (delta_psi, delta_epsilon, delta_psi_rate, delta_epsilon_rate) per node, as in
+    # eight_characters.nutation.nutation_node.
+    multipliers, sin_weights, cos_weights = _nutation_arrays()
+    nodes = np.empty((len(day_indexes), 4))
+    rate_scale = COEFFICIENT_ARCSECONDS * NUTATION_NODE_DAYS / DAYS_PER_CENTURY
+    for start in range(0, len(day_indexes), CHUNK_SIZE):
+        t_centuries = day_indexes[start:start + CHUNK_SIZE] * NUTATION_NODE_DAYS / DAYS_PER_CENTURY
+        arguments = multipliers @ _fundamental_arguments(t_centuries)
+        parts = sin_weights @ np.sin(arguments) + cos_weights @ np.cos(arguments)
+        block = nodes[start:start + CHUNK_SIZE]
+        block[:, 0] = (parts[0] + parts[1] * t_centuries) * COEFFICIENT_ARCSECONDS
+        block[:, 1] = (parts[2] + parts[3] * t_centuries) * COEFFICIENT_ARCSECONDS
+        block[:, 2] = (parts[4] + parts[5] * t_centuries) * rate_scale
+        block[:, 3] = (parts[6] + parts[7] * t_centuries) * rate_scale
+    return nodes
+
+
+def nutation_arcseconds(t_centuries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    position = t_centuries * DAYS_PER_CENTURY / NUTATION_NODE_DAYS
+    day_index = np.floor(position)
+    s = position - day_index
+    node_days = np.unique(np.concatenate((day_index, day_index + 1.0)))
+    nodes = _nutation_nodes(node_days)
+    first = nodes[np.searchsorted(node_days, day_index)]
+    second = nodes[np.searchsorted(node_days, day_index + 1.0)]
+
+    s2 = s * s
+    s3 = s2 * s
+    h00 = 2.0 * s3 - 3.0 * s2 + 1.0
+    h10 = s3 - 2.0 * s2 + s
+    h01 = -2.0 * s3 + 3.0 * s2
+    h11 = s3 - s2
+    return (
+        h00 * first[:, 0] + h10 * first[:, 2] + h01 * second[:, 0] + h11 * second[:, 2],
+        h00 * first[:, 1] + h10 * first[:, 3] + h01 * second[:, 1] + h11 * second[:, 3],
+    )
+
+
+def apparent_solar_positions(jd_tt: np.ndarray, precision: str = PRECISION_REFERENCE) -> tuple[np.ndarray, ...]:
+    # Vectorized compute_apparent_solar_longitude: (lambda, beta, R, dpsi, deps, T) columns.
+    longitude_blocks, latitude_blocks, radius_blocks = _vsop_blocks(precision)
+    count = len(jd_tt)
+    earth_l_rad = np.empty(count)
+    earth_b_rad = np.empty(count)
+    radius_au = np.empty(count)
+    for start in range(0, count, CHUNK_SIZE):
+        tau = (jd_tt[start:start + CHUNK_SIZE] - J2000_JD) / DAYS_PER_MILLENNIUM
+        earth_l_rad[start:start + CHUNK_SIZE] = _evaluate_vsop(longitude_blocks, tau)
+        earth_b_rad[start:start + CHUNK_SIZE] = _evaluate_vsop(latitude_blocks, tau)
+        radius_au[start:start + CHUNK_SIZE] = _evaluate_vsop(radius_blocks, tau)
+
+    t_centuries = (jd_tt - J2000_JD) / DAYS_PER_CENTURY
+    delta_psi, delta_epsilon = nutation_arcseconds(t_centuries)
+    theta_deg = ((earth_l_rad * DEG_PER_RAD) % 360.0 + 180.0) % 360.0
+    aberration_deg = (-ABERRATION_ARCSECONDS / radius_au) / 3600.0
+    lambda_deg = (theta_deg + delta_psi / 3600.0 + aberration_deg) % 360.0
+    return lambda_deg, -earth_b_rad * DEG_PER_RAD, radius_au, delta_psi, delta_epsilon, t_centuries
+
+
+def equation_of_time_minutes(
+    lambda_deg: np.ndarray,
+    beta_deg: np.ndarray,
+    radius_au: np.ndarray,
+    delta_psi_arcseconds: np.ndarray,
+    epsilon_radians: np.ndarray,
+    t_centuries: np.ndarray,
+) -> np.ndarray:
+    lambda_rad = lambda_deg * np.pi / 180.0
+    beta_rad = beta_deg * np.pi / 180.0
+    alpha = np.arctan2(
+        np.sin(lambda_rad) * np.cos(epsilon_radians) - np.tan(beta_rad) * np.sin(epsilon_radians),
+        np.cos(lambda_rad),
+    )
+    alpha_deg = np.where(alpha < 0.0, alpha + 2.0 * np.pi, alpha) * 180.0 / np.pi
+    eot_deg = equation_of_time_from_right_ascension_deg(
+        alpha_deg, delta_psi_arcseconds, np.cos(epsilon_radians), radius_au, t_centuries
+    )
+    eot_deg = np.where(eot_deg > 180.0, eot_deg - 360.0, eot_deg)
+    eot_deg = np.where(eot_deg < -180.0, eot_deg + 360.0, eot_deg)
+    return eot_deg * 4.0
+
+
+def _column(values: np.ndarray) -> array:
+    return array('d', np.ascontiguousarray(values, dtype=np.float64).tobytes())
+
+
+def compute_solar_position_columns(
+    jd_tt_values: Iterable[float],
+    longitude_deg: float | Sequence[float] = 0.0,
+    tt_minus_utc_seconds: float | Sequence[float] = 0.0,
+    precision: str = PRECISION_REFERENCE,
+    ephemeris: 'SolarEphemeris | None' = None,
+) -> SolarPositionColumns:
+    # Same contract as eight_characters.solar_batch.compute_solar_position_columns; values
+    # agree to rounding (summation order differs), not bit for bit.
+    if hasattr(jd_tt_values, '__len__'):
+        jd_tt = np.asarray(jd_tt_values, dtype=np.float64)
+    else:
+        jd_tt = np.fromiter(jd_tt_values, dtype=np.float64)
+    longitude = np.broadcast_to(np.asarray(longitude_deg, dtype=np.float64), jd_tt.shape)
+    tt_minus_utc = np.broadcast_to(np.asarray(tt_minus_utc_seconds, dtype=np.float64), jd_tt.shape)
+
+    if ephemeris is None:
+        apparent = apparent_solar_positions(jd_tt, precision)
+    else:
+        positions = np.array([ephemeris.apparent_position(value) for value in jd_tt.tolist()]).reshape(-1, 6)
+        apparent = tuple(positions.T)
+        precision = ephemeris.precision
+    lambda_deg, beta_deg, radius_au, delta_psi, delta_epsilon, t_centuries = apparent
+
+    epsilon_radians = true_obliquity_radians(t_centuries, delta_epsilon)
+    equation_of_time = equation_of_time_minutes(
+        lambda_deg, beta_deg, radius_au, delta_psi, epsilon_radians, t_centuries
+    )
+    local_mean_jd = jd_tt - tt_minus_utc / SECONDS_PER_DAY + longitude / DEGREES_PER_DAY_OF_LONGITUDE
+
+    return SolarPositionColumns(
+        jd_tt=_column(jd_tt),
+        lambda_apparent_deg=_column(lambda_deg),
+        beta_deg=_column(beta_deg),
+        radius_au=_column(radius_au),
+        delta_psi_arcseconds=_column(delta_psi),
+        delta_epsilon_arcseconds=_column(delta_epsilon),
+        epsilon_radians=_column(epsilon_radians),
+        equation_of_time_minutes=_column(equation_of_time),
+        local_mean_solar_jd=_column(local_mean_jd),
+        true_solar_jd=_column(local_mean_jd + equation_of_time / MINUTES_PER_DAY),
+        precision=precision,
+    )
@@ -6,7 +6,6 @@ from eight_characters.conventions import (
     ZI_CONVENTION_WHOLE_ZI_23,
     ConventionSettings,
 )
-from eight_characters.sexagenary import Pillar
 
 
 @dataclass(frozen=True)
@@ -19,11 +18,6 @@ class IntegrityFlags:
     alternative_pillars: dict | None
 
 
-def validate_pillar_set(pillars: dict[str, Pillar]) -> None:
-    for pillar in pillars.values():
-        pillar.validate_polarity()
-
-
 def model_uncertainty_seconds_for_year(year_value: int) -> float:
     if year_value < 1972:
         return 1.5
@@ -1,10 +1,12 @@
 import csv
+import json
+from collections.abc import Iterator
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
@@ -15,8 +17,30 @@ from eight_characters.data import (
 from eight_characters import __version__
 from eight_characters.conventions import ConventionSettings
 from eight_characters.engine import compute_engine_payload
+from eight_characters.sexagenary import (
+    BRANCHES as SEXAGENARY_BRANCHES,
+    PILLARS,
+    STEMS as SEXAGENARY_STEMS,
+    DayPillarRange,
+    day_pillar_range,
+)
 from eight_characters.time_convert import AmbiguousTimeError, BirthInput, NonexistentTimeError
 
+CALENDAR_STREAM_CHUNK_DAYS = 366
+
+# Engine payload section -> /api/bazi response key.
+BAZI_RESPONSE_KEYS = {
+    'intermediate': 'solar_time',
+    'pillars': 'four_pillars',
+    'flags': 'flags',
+    'engine': 'engine',
+}
+# ?sections= takes the response keys; the engine section names are accepted as aliases.
+BAZI_SECTION_NAMES = {
+    **{section: section for section in BAZI_RESPONSE_KEYS},
+    **{key: section for section, key in BAZI_RESPONSE_KEYS.items()},
+}
+
 BASE_DIR = Path(__file__).resolve().parent
 ROOT_DIR = BASE_DIR.parent
 
@@ -168,6 +192,18 @@ def _city_models_from_result(top_match: dict, city_fallback: str) -> tuple[Locat
     return resolved_location, resolved_city
 
 
+def _parse_bazi_sections(sections: str | None) -> frozenset[str]:
+    if sections is None:
+        return frozenset(BAZI_RESPONSE_KEYS)
+    names = {name.strip() for name in sections.split(',') if name.strip()}
+    unknown = sorted(names - BAZI_SECTION_NAMES.keys())
+    if unknown:
+        raise ValueError(f'Unknown section: {unknown[0]}. Use {", ".join(BAZI_RESPONSE_KEYS.values())}.')
+    if not names:
+        raise ValueError('sections must name at least one section.')
+    return frozenset(BAZI_SECTION_NAMES[name] for name in names)
+
+
 def _build_bazi_result(
     *,
     date_value: str,
@@ -175,6 +211,7 @@ def _build_bazi_result(
     location: LocationInput,
     conventions_input: ConventionInput,
     birth_time_uncertainty_seconds: float | None,
+    sections: frozenset[str] = frozenset(BAZI_RESPONSE_KEYS),
 ) -> dict:
     year, month, day, hour, minute, second = _parse_date_and_time(date_value, time_value)
     conventions = ConventionSettings(
@@ -196,19 +233,20 @@ def _build_bazi_result(
         birth_time_uncertainty_seconds=birth_time_uncertainty_seconds,
         conventions=conventions,
     )
-    engine_payload = compute_engine_payload(birth_input)
+    engine_payload = compute_engine_payload(birth_input, sections=sections)
 
-    return {
-        'solar_time': {
+    result = {}
+    if 'intermediate' in engine_payload:
+        result['solar_time'] = {
             'utc_time': engine_payload['intermediate']['utc_time'],
             'local_mean_solar_time': engine_payload['intermediate']['local_mean_solar_time'],
             'true_solar_time': engine_payload['intermediate']['true_solar_time'],
             'equation_of_time_minutes': engine_payload['intermediate']['equation_of_time_minutes'],
-        },
-        'four_pillars': engine_payload['pillars'],
-        'flags': engine_payload['flags'],
-        'engine': engine_payload['engine'],
-    }
+        }
+    for section in ('pillars', 'flags', 'engine'):
+        if section in engine_payload:
+            result[BAZI_RESPONSE_KEYS[section]] = engine_payload[section]
+    return result
 
 
 def _extract_hidden_stem_char(entry: str) -> str:
@@ -290,6 +328,41 @@ def _build_hidden_stems_result(payload: HiddenStemsRequest) -> dict:
     return result
 
 
+def _parse_calendar_date(value: str, field_name: str) -> date:
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError as exc:
+        raise ValueError(f'{field_name} must be in YYYY-MM-DD format.') from exc
+
+
+def _compact_json(value: dict) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def _calendar_day_lines(day_range: DayPillarRange) -> Iterator[str]:
+    # One _compact_json row per day; the pillar part of each row is built once per cycle index.
+    pillar_rows = [
+        {
+            'branch': {'index': pillar.branch_idx, 'chinese': SEXAGENARY_BRANCHES[pillar.branch_idx]},
+            'cycle_index': pillar.cycle_index,
+            'stem': {'index': pillar.stem_idx, 'chinese': SEXAGENARY_STEMS[pillar.stem_idx]},
+        }
+        for pillar in PILLARS
+    ]
+    start_ordinal = day_range.start.toordinal()
+    cycle_indexes = day_range.cycle_indexes
+    for chunk_start in range(0, len(cycle_indexes), CALENDAR_STREAM_CHUNK_DAYS):
+        lines = []
+        for row in range(chunk_start, min(chunk_start + CALENDAR_STREAM_CHUNK_DAYS, len(cycle_indexes))):
+            lines.append(_compact_json({
+                **pillar_rows[cycle_indexes[row]],
+                'date': date.fromordinal(start_ordinal + row).isoformat(),
+                'jdn': day_range.first_jdn + row,
+            }))
+            lines.append('\n')
+        yield ''.join(lines)
+
+
 # ── Routes ──
 
 @app.get('/', response_class=HTMLResponse)
@@ -334,8 +407,13 @@ async def create_chart(payload: ChartRequest):
 
 
 @app.post('/api/bazi')
-async def calculate_bazi(payload: BaziRequest):
-    '''Calculate true solar time and four pillars from date, time, and location.'''
+async def calculate_bazi(payload: BaziRequest, sections: str | None = None):
+    '''Calculate true solar time and four pillars from date, time, and location.
+
+    ``sections`` is an optional comma-separated list of response keys to return: ``solar_time``,
+    ``four_pillars``, ``flags`` and ``engine``. The engine section names ``intermediate`` and
+    ``pillars`` are accepted as aliases for the first two. Sections left out are not computed.
+    '''
     try:
         result = _build_bazi_result(
             date_value=payload.date,
@@ -343,18 +421,14 @@ async def calculate_bazi(payload: BaziRequest):
             location=payload.location,
             conventions_input=payload.conventions,
             birth_time_uncertainty_seconds=payload.birth_time_uncertainty_seconds,
+            sections=_parse_bazi_sections(sections),
         )
     except (ValueError, AmbiguousTimeError, NonexistentTimeError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail='Internal engine error.') from exc
 
-    return {
-        'solar_time': result['solar_time'],
-        'four_pillars': result['four_pillars'],
-        'flags': result['flags'],
-        'engine': result['engine'],
-    }
+    return result
 
 
 @app.post('/api/four_pillars')
@@ -368,6 +442,7 @@ async def calculate_four_pillars(payload: FourPillarsRequest):
             location=location,
             conventions_input=payload.conventions,
             birth_time_uncertainty_seconds=payload.birth_time_uncertainty_seconds,
+            sections=frozenset(('intermediate', 'pillars')),
         )
     except (ValueError, AmbiguousTimeError, NonexistentTimeError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -385,6 +460,17 @@ async def calculate_four_pillars(payload: FourPillarsRequest):
     }
 
 
+@app.get('/api/calendar/days')
+async def calendar_days(start: str, end: str):
+    '''Stream the day pillar of every date from start to end inclusive as NDJSON.'''
+    try:
+        day_range = day_pillar_range(_parse_calendar_date(start, 'start'), _parse_calendar_date(end, 'end'))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return StreamingResponse(_calendar_day_lines(day_range), media_type='application/x-ndjson')
+
+
 @app.post('/api/location_search')
 async def location_search(payload: LocationSearchRequest):
     '''Resolve a free-text city query and return canonical city metadata.'''
@@ -1,34 +1,319 @@
-from math import cos, radians, sin
+import sys
+from array import array
+from cmath import rect
+from dataclasses import dataclass
+from functools import lru_cache
+from math import floor, fmod, pi
+from pathlib import Path
+from typing import Sequence
 
+from eight_characters.caching import BoundedLRUCache, CacheStats
+from eight_characters.packed_data import (
+    PackedDataError,
+    map_packed_file,
+    read_packed_payload_sha256,
+    write_packed_file,
+)
 
-def _longitude_of_ascending_node_deg(t_centuries: float) -> float:
-    return 125.04452 - 1934.136261 * t_centuries + 0.0020708 * (t_centuries ** 2)
 
+IAU2000A_NUTATION_KIND = 'iau2000a_nutation'
+IAU2000A_NUTATION_FORMAT_VERSION = 1
+IAU2000A_NUTATION_PATH = Path(__file__).resolve().parent / 'tables' / 'iau2000a_nutation.bin'
 
-def _mean_longitude_sun_deg(t_centuries: float) -> float:
-    return 280.4665 + 36000.7698 * t_centuries
+# Series coefficients are stored in units of 0.1 microarcsecond.
+COEFFICIENT_ARCSECONDS = 1e-7
+ARCSECONDS_PER_TURN = 1296000.0
+RADIANS_PER_ARCSECOND = pi / 648000.0
+DAYS_PER_CENTURY = 36525.0
 
+LUNISOLAR_ARGUMENT_COUNT = 5
+PLANETARY_ARGUMENT_COUNT = 14
+# Lunisolar: (psi_sin, psi_sin_t, psi_cos, eps_cos, eps_cos_t, eps_sin).
+# Planetary: (psi_sin, psi_cos, eps_sin, eps_cos).
+LUNISOLAR_COEFFICIENT_WIDTH = 6
+PLANETARY_COEFFICIENT_WIDTH = 4
 
-def _mean_longitude_moon_deg(t_centuries: float) -> float:
-    return 218.3165 + 481267.8813 * t_centuries
+# Delaunay arguments l, l', F, D, Omega (Simon et al. 1994, IERS 2003), arcseconds by power of t.
+DELAUNAY_POLYNOMIALS = (
+    (485868.249036, 1717915923.2178, 31.8792, 0.051635, -0.00024470),
+    (1287104.79305, 129596581.0481, -0.5532, 0.000136, -0.00001149),
+    (335779.526232, 1739527262.8478, -12.7512, -0.001037, 0.00000417),
+    (1072260.70369, 1602961601.2090, -6.3706, 0.006593, -0.00003169),
+    (450160.398036, -6962890.5431, 7.4722, 0.007702, -0.00005939),
+)
 
+# MHB2000 linear arguments for the planetary terms, (radians, radians per century):
+# l, l', F, D, Omega, Mercury..Neptune, then general precession (multiplied by t once more).
+PLANETARY_ARGUMENTS = (
+    (2.35555598, 8328.6914269554),
+    (6.24006013, 628.301955),
+    (1.627905234, 8433.466158131),
+    (5.198466741, 7771.3771468121),
+    (2.18243920, -33.757045),
+    (4.402608842, 2608.7903141574),
+    (3.176146697, 1021.3285546211),
+    (1.753470314, 628.3075849991),
+    (6.203480913, 334.0612426700),
+    (0.599546497, 52.9690962641),
+    (0.874016757, 21.3299104960),
+    (5.481293871, 7.4781598567),
+    (5.321159000, 3.8127774000),
+    (0.02438175, 0.00000538691),
+)
 
-def nutation_arcseconds_seed(t_centuries: float) -> tuple[float, float]:
-    # Compact deterministic seed model in IAU-style quantities.
-    omega = radians(_longitude_of_ascending_node_deg(t_centuries))
-    l_sun = radians(_mean_longitude_sun_deg(t_centuries))
-    l_moon = radians(_mean_longitude_moon_deg(t_centuries))
+# Cubic Hermite nodes one TT day apart keep interpolation error below 1e-4 arcsecond
+# (the 9.1- and 13.7-day terms dominate); nodes are noon TT from J2000.
+NUTATION_NODE_DAYS = 1.0
+NUTATION_NODE_CACHE_MAX_SIZE = 4096
 
-    delta_psi_arcseconds = (
-        -17.20 * sin(omega)
-        - 1.32 * sin(2.0 * l_sun)
-        - 0.23 * sin(2.0 * l_moon)
-        + 0.21 * sin(2.0 * omega)
+NutationNode = tuple[float, float, float, float]
+
+_NUTATION_NODE_CACHE: BoundedLRUCache[NutationNode] = BoundedLRUCache(NUTATION_NODE_CACHE_MAX_SIZE)
+
+
+@dataclass(frozen=True)
+class NutationSeries:
+    lunisolar_coefficients: Sequence[float]
+    planetary_coefficients: Sequence[float]
+    lunisolar_multipliers: Sequence[int]
+    planetary_multipliers: Sequence[int]
+
+    @property
+    def lunisolar_count(self) -> int:
+        return len(self.lunisolar_multipliers) // LUNISOLAR_ARGUMENT_COUNT
+
+    @property
+    def planetary_count(self) -> int:
+        return len(self.planetary_multipliers) // PLANETARY_ARGUMENT_COUNT
+
+
+# One term: nonzero (argument slot, multiplier) pairs, its rate in radians per century,
+# then (psi_sin, psi_sin_t, psi_cos, eps_cos, eps_cos_t, eps_sin).
+NutationTerm = tuple[tuple[tuple[int, int], ...], float, float, float, float, float, float, float]
+
+
+@dataclass(frozen=True)
+class NutationPlan:
+    max_multipliers: tuple[int, ...]
+    terms: tuple[NutationTerm, ...]
+
+
+def write_nutation_series(
+    target_file: str | Path,
+    lunisolar: Sequence[tuple[Sequence[int], Sequence[float]]],
+    planetary: Sequence[tuple[Sequence[int], Sequence[float]]],
+    source: str,
+) -> None:
+    coefficients = array('d')
+    multipliers = array('b')
+    for terms, argument_count, width in (
+        (lunisolar, LUNISOLAR_ARGUMENT_COUNT, LUNISOLAR_COEFFICIENT_WIDTH),
+        (planetary, PLANETARY_ARGUMENT_COUNT, PLANETARY_COEFFICIENT_WIDTH),
+    ):
+        for term_multipliers, term_coefficients in terms:
+            if len(term_multipliers) != argument_count or len(term_coefficients) != width:
+                raise ValueError('Nutation term has the wrong number of multipliers or coefficients.')
+            multipliers.extend(term_multipliers)
+            coefficients.extend(term_coefficients)
+    if sys.byteorder != 'little':
+        coefficients.byteswap()
+    write_packed_file(
+        target_file,
+        kind=IAU2000A_NUTATION_KIND,
+        format_version=IAU2000A_NUTATION_FORMAT_VERSION,
+        metadata={
+            'byte_order': 'little',
+            'coefficient_unit': '0.1_microarcsecond',
+            'layout': 'float64_coefficients_then_int8_multipliers',
+            'lunisolar_terms': len(lunisolar),
+            'planetary_terms': len(planetary),
+            'source': source,
+            'time_argument': 'julian_centuries_tt_from_j2000',
+        },
+        payload=coefficients.tobytes() + multipliers.tobytes(),
+    )
+
+
+def load_nutation_series(source_file: str | Path) -> NutationSeries:
+    packed = map_packed_file(
+        source_file,
+        expected_kind=IAU2000A_NUTATION_KIND,
+        expected_format_version=IAU2000A_NUTATION_FORMAT_VERSION,
+    )
+    lunisolar_count = int(packed.metadata['lunisolar_terms'])
+    planetary_count = int(packed.metadata['planetary_terms'])
+    lunisolar_end = lunisolar_count * LUNISOLAR_COEFFICIENT_WIDTH
+    coefficient_count = lunisolar_end + planetary_count * PLANETARY_COEFFICIENT_WIDTH
+    multiplier_start = coefficient_count * 8
+    multiplier_count = lunisolar_count * LUNISOLAR_ARGUMENT_COUNT + planetary_count * PLANETARY_ARGUMENT_COUNT
+    if len(packed.payload) != multiplier_start + multiplier_count:
+        raise PackedDataError('Nutation payload length does not match its term counts.')
+
+    if sys.byteorder == 'little':
+        coefficients = packed.payload[:multiplier_start].cast('d')
+    else:
+        coefficients = array('d', bytes(packed.payload[:multiplier_start]))
+        coefficients.byteswap()
+    multipliers = packed.payload[multiplier_start:].cast('b')
+    lunisolar_multiplier_end = lunisolar_count * LUNISOLAR_ARGUMENT_COUNT
+    return NutationSeries(
+        lunisolar_coefficients=coefficients[:lunisolar_end],
+        planetary_coefficients=coefficients[lunisolar_end:],
+        lunisolar_multipliers=multipliers[:lunisolar_multiplier_end],
+        planetary_multipliers=multipliers[lunisolar_multiplier_end:],
+    )
+
+
+def _argument_rates() -> tuple[float, ...]:
+    delaunay = tuple(polynomial[1] * RADIANS_PER_ARCSECOND for polynomial in DELAUNAY_POLYNOMIALS)
+    return delaunay + tuple(rate for _, rate in PLANETARY_ARGUMENTS[:-1]) + (PLANETARY_ARGUMENTS[-1][0],)
+
+
+def build_nutation_plan(series: NutationSeries) -> NutationPlan:
+    # Delaunay arguments occupy slots 0-4 and the planetary arguments slots 5-18.
+    rates = _argument_rates()
+    max_multipliers = [0] * (LUNISOLAR_ARGUMENT_COUNT + PLANETARY_ARGUMENT_COUNT)
+    terms: list[NutationTerm] = []
+
+    def factors_and_rate(multipliers: Sequence[int], first_slot: int) -> tuple[tuple[tuple[int, int], ...], float]:
+        factors = tuple(
+            (first_slot + index, multiplier)
+            for index, multiplier in enumerate(multipliers)
+            if multiplier
+        )
+        rate = 0.0
+        for slot, multiplier in factors:
+            max_multipliers[slot] = max(max_multipliers[slot], abs(multiplier))
+            rate += rates[slot] * multiplier
+        return factors, rate
+
+    for index in range(series.lunisolar_count):
+        factors, rate = factors_and_rate(
+            series.lunisolar_multipliers[index * LUNISOLAR_ARGUMENT_COUNT:(index + 1) * LUNISOLAR_ARGUMENT_COUNT],
+            0,
+        )
+        start = index * LUNISOLAR_COEFFICIENT_WIDTH
+        terms.append((factors, rate, *series.lunisolar_coefficients[start:start + LUNISOLAR_COEFFICIENT_WIDTH]))
+
+    for index in range(series.planetary_count):
+        factors, rate = factors_and_rate(
+            series.planetary_multipliers[index * PLANETARY_ARGUMENT_COUNT:(index + 1) * PLANETARY_ARGUMENT_COUNT],
+            LUNISOLAR_ARGUMENT_COUNT,
+        )
+        psi_sin, psi_cos, eps_sin, eps_cos = series.planetary_coefficients[
+            index * PLANETARY_COEFFICIENT_WIDTH:(index + 1) * PLANETARY_COEFFICIENT_WIDTH
+        ]
+        terms.append((factors, rate, psi_sin, 0.0, psi_cos, eps_cos, 0.0, eps_sin))
+
+    return NutationPlan(max_multipliers=tuple(max_multipliers), terms=tuple(terms))
+
+
+@lru_cache(maxsize=1)
+def get_nutation_plan() -> NutationPlan:
+    return build_nutation_plan(load_nutation_series(IAU2000A_NUTATION_PATH))
+
+
+@lru_cache(maxsize=1)
+def nutation_series_sha256() -> str:
+    return read_packed_payload_sha256(IAU2000A_NUTATION_PATH)
+
+
+def fundamental_arguments(t_centuries: float) -> list[float]:
+    arguments = []
+    for polynomial in DELAUNAY_POLYNOMIALS:
+        value = 0.0
+        for coefficient in reversed(polynomial):
+            value = value * t_centuries + coefficient
+        arguments.append(fmod(value, ARCSECONDS_PER_TURN) * RADIANS_PER_ARCSECOND)
+    for constant, rate in PLANETARY_ARGUMENTS:
+        arguments.append(constant + rate * t_centuries)
+    arguments[-1] *= t_centuries
+    return arguments
+
+
+def _argument_powers(arguments: Sequence[float], max_multipliers: Sequence[int]) -> list[list[complex]]:
+    # powers[slot][n] is exp(i * n * argument); negative n index the conjugates at the tail.
+    table = []
+    for argument, max_multiplier in zip(arguments, max_multipliers):
+        base = rect(1.0, argument)
+        powers = [1.0 + 0.0j]
+        for _ in range(max_multiplier):
+            powers.append(powers[-1] * base)
+        powers.extend(power.conjugate() for power in reversed(powers[1:]))
+        table.append(powers)
+    return table
+
+
+def evaluate_nutation(
+    plan: NutationPlan,
+    t_centuries: float,
+) -> tuple[float, float, float, float]:
+    # Returns (delta_psi, delta_epsilon) and their rates per century, in 0.1 microarcsecond.
+    powers = _argument_powers(fundamental_arguments(t_centuries), plan.max_multipliers)
+    delta_psi = 0.0
+    delta_epsilon = 0.0
+    delta_psi_rate = 0.0
+    delta_epsilon_rate = 0.0
+    for factors, rate, psi_sin, psi_sin_t, psi_cos, eps_cos, eps_cos_t, eps_sin in plan.terms:
+        phasor = 1.0 + 0.0j
+        for slot, multiplier in factors:
+            phasor *= powers[slot][multiplier]
+        sin_argument = phasor.imag
+        cos_argument = phasor.real
+        psi_sin += psi_sin_t * t_centuries
+        eps_cos += eps_cos_t * t_centuries
+        delta_psi += psi_sin * sin_argument + psi_cos * cos_argument
+        delta_epsilon += eps_cos * cos_argument + eps_sin * sin_argument
+        delta_psi_rate += (psi_sin * cos_argument - psi_cos * sin_argument) * rate + psi_sin_t * sin_argument
+        delta_epsilon_rate += (eps_sin * cos_argument - eps_cos * sin_argument) * rate + eps_cos_t * cos_argument
+    return delta_psi, delta_epsilon, delta_psi_rate, delta_epsilon_rate
+
+
+def nutation_arcseconds_iau2000a(t_centuries: float) -> tuple[float, float]:
+    delta_psi, delta_epsilon, _, _ = evaluate_nutation(get_nutation_plan(), t_centuries)
+    return delta_psi * COEFFICIENT_ARCSECONDS, delta_epsilon * COEFFICIENT_ARCSECONDS
+
+
+def _nutation_node(day_index: int) -> NutationNode:
+    # (delta_psi, delta_epsilon) in arcseconds and their rates in arcseconds per node interval.
+    t_centuries = day_index * NUTATION_NODE_DAYS / DAYS_PER_CENTURY
+    delta_psi, delta_epsilon, delta_psi_rate, delta_epsilon_rate = evaluate_nutation(get_nutation_plan(), t_centuries)
+    rate_scale = COEFFICIENT_ARCSECONDS * NUTATION_NODE_DAYS / DAYS_PER_CENTURY
+    return (
+        delta_psi * COEFFICIENT_ARCSECONDS,
+        delta_epsilon * COEFFICIENT_ARCSECONDS,
+        delta_psi_rate * rate_scale,
+        delta_epsilon_rate * rate_scale,
     )
-    delta_epsilon_arcseconds = (
-        9.20 * cos(omega)
-        + 0.57 * cos(2.0 * l_sun)
-        + 0.10 * cos(2.0 * l_moon)
-        - 0.09 * cos(2.0 * omega)
+
+
+def nutation_node(day_index: int) -> NutationNode:
+    return _NUTATION_NODE_CACHE.get_or_compute(day_index, lambda: _nutation_node(day_index))
+
+
+def nutation_arcseconds(t_centuries: float) -> tuple[float, float]:
+    # Cubic Hermite interpolation between cached daily nodes of the full series.
+    position = t_centuries * DAYS_PER_CENTURY / NUTATION_NODE_DAYS
+    day_index = floor(position)
+    s = position - day_index
+    psi_0, eps_0, psi_rate_0, eps_rate_0 = nutation_node(day_index)
+    psi_1, eps_1, psi_rate_1, eps_rate_1 = nutation_node(day_index + 1)
+
+    s2 = s * s
+    s3 = s2 * s
+    h00 = 2.0 * s3 - 3.0 * s2 + 1.0
+    h10 = s3 - 2.0 * s2 + s
+    h01 = -2.0 * s3 + 3.0 * s2
+    h11 = s3 - s2
+    return (
+        h00 * psi_0 + h10 * psi_rate_0 + h01 * psi_1 + h11 * psi_rate_1,
+        h00 * eps_0 + h10 * eps_rate_0 + h01 * eps_1 + h11 * eps_rate_1,
     )
-    return delta_psi_arcseconds, delta_epsilon_arcseconds
+
+
+def nutation_cache_stats() -> CacheStats:
+    return _NUTATION_NODE_CACHE.stats()
+
+
+def clear_nutation_cache() -> None:
+    _NUTATION_NODE_CACHE.clear()
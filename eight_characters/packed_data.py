@@ -0,0 +1,120 @@
+import hashlib
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+
+PACKED_MAGIC = b'ECPK'
+PACKED_HEADER_PREFIX = struct.Struct('<4sI')
+
+
+class PackedDataError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PackedFile:
+    kind: str
+    format_version: int
+    metadata: dict
+    payload_sha256: str
+    payload: memoryview
+
+
+def write_packed_file(
+    target_file: str | Path,
+    kind: str,
+    format_version: int,
+    metadata: dict,
+    payload: bytes,
+) -> None:
+    header = {
+        'kind': kind,
+        'format_version': format_version,
+        'metadata': metadata,
+        'payload_sha256': hashlib.sha256(payload).hexdigest(),
+    }
+    header_bytes = json.dumps(header, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-(PACKED_HEADER_PREFIX.size + len(header_bytes)) % 8)
+
+    path = Path(target_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('wb') as handle:
+        handle.write(PACKED_HEADER_PREFIX.pack(PACKED_MAGIC, len(header_bytes)))
+        handle.write(header_bytes)
+        handle.write(payload)
+
+
+def parse_packed_bytes(raw: bytes | memoryview) -> PackedFile:
+    view = memoryview(raw)
+    if len(view) < PACKED_HEADER_PREFIX.size:
+        raise PackedDataError('Packed data file is truncated.')
+    magic, header_length = PACKED_HEADER_PREFIX.unpack_from(view, 0)
+    if magic != PACKED_MAGIC:
+        raise PackedDataError('Packed data file has an unknown signature.')
+
+    payload_offset = PACKED_HEADER_PREFIX.size + header_length
+    if len(view) < payload_offset:
+        raise PackedDataError('Packed data header is truncated.')
+    header = json.loads(bytes(view[PACKED_HEADER_PREFIX.size:payload_offset]).decode('utf-8'))
+    payload = view[payload_offset:]
+    if hashlib.sha256(payload).hexdigest() != header['payload_sha256']:
+        raise PackedDataError(f'Packed {header["kind"]} payload checksum mismatch.')
+    return PackedFile(
+        kind=header['kind'],
+        format_version=header['format_version'],
+        metadata=header['metadata'],
+        payload_sha256=header['payload_sha256'],
+        payload=payload,
+    )
+
+
+def _check_packed_identity(packed: PackedFile, expected_kind: str, expected_format_version: int) -> PackedFile:
+    if packed.kind != expected_kind:
+        raise PackedDataError(
+            f'Packed data kind mismatch: expected {expected_kind}, found {packed.kind}.'
+        )
+    if packed.format_version != expected_format_version:
+        raise PackedDataError(
+            f'Unsupported {expected_kind} format version: {packed.format_version}.'
+        )
+    return packed
+
+
+def read_packed_payload_sha256(source_file: str | Path) -> str:
+    # Header only: the recorded digest identifies the file's contents without hashing the payload.
+    with Path(source_file).open('rb') as handle:
+        prefix = handle.read(PACKED_HEADER_PREFIX.size)
+        if len(prefix) < PACKED_HEADER_PREFIX.size:
+            raise PackedDataError('Packed data file is truncated.')
+        magic, header_length = PACKED_HEADER_PREFIX.unpack(prefix)
+        if magic != PACKED_MAGIC:
+            raise PackedDataError('Packed data file has an unknown signature.')
+        header_bytes = handle.read(header_length)
+    if len(header_bytes) < header_length:
+        raise PackedDataError('Packed data header is truncated.')
+    return json.loads(header_bytes.decode('utf-8'))['payload_sha256']
+
+
+def read_packed_file(
+    source_file: str | Path,
+    expected_kind: str,
+    expected_format_version: int,
+) -> PackedFile:
+    packed = parse_packed_bytes(Path(source_file).read_bytes())
+    return _check_packed_identity(packed, expected_kind, expected_format_version)
+
+
+def map_packed_file(
+    source_file: str | Path,
+    expected_kind: str,
+    expected_format_version: int,
+) -> PackedFile:
+    # Read-only shared mapping: worker processes reuse the page cache instead of private copies.
+    # The returned payload view keeps the mapping alive.
+    with Path(source_file).open('rb') as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    packed = parse_packed_bytes(mapped)
+    return _check_packed_identity(packed, expected_kind, expected_format_version)
@@ -5,6 +5,16 @@ class BracketingError(ValueError):
     pass
 
 
+class EvaluationCounter:
+    def __init__(self, func: Callable[[float], float]) -> None:
+        self.func = func
+        self.count = 0
+
+    def __call__(self, x: float) -> float:
+        self.count += 1
+        return self.func(x)
+
+
 def normalize_longitude_difference(diff_degrees: float) -> float:
     while diff_degrees > 180.0:
         diff_degrees -= 360.0
@@ -44,15 +54,87 @@ def find_bracket(
     )
 
 
+def symmetric_bracket(
+    func: Callable[[float], float],
+    center: float,
+    half_width: float,
+) -> tuple[float, float, float, float] | None:
+    xa = center - half_width
+    xb = center + half_width
+    fa = func(xa)
+    fb = func(xb)
+    if fa * fb > 0.0:
+        return None
+    return (xa, xb, fa, fb)
+
+
+def newton_safeguarded(
+    func_with_derivatives: Callable[[float], tuple[float, float, float]],
+    func: Callable[[float], float],
+    x0: float,
+    xtol: float,
+    bracket_half_width: float,
+    halley: bool = False,
+    max_iter: int = 10,
+) -> float:
+    x = x0
+    x_negative: float | None = None
+    x_positive: float | None = None
+    previous_step = float('inf')
+
+    for _ in range(max_iter):
+        fx, d1, d2 = func_with_derivatives(x)
+        if fx == 0.0:
+            return x
+        if fx < 0.0:
+            x_negative = x
+        else:
+            x_positive = x
+        if d1 == 0.0:
+            break
+
+        step = -fx / d1
+        if halley:
+            denominator = 2.0 * d1 * d1 - fx * d2
+            if denominator != 0.0:
+                step = -2.0 * fx * d1 / denominator
+
+        # Steps that stop shrinking mean the local model is unreliable; hand over to Brent.
+        if abs(step) > 0.5 * abs(previous_step):
+            break
+        x_next = x + step
+        if x_negative is not None and x_positive is not None:
+            low, high = min(x_negative, x_positive), max(x_negative, x_positive)
+            if not low <= x_next <= high:
+                break
+        if abs(step) <= xtol:
+            return x_next
+        previous_step = step
+        x = x_next
+
+    if x_negative is not None and x_positive is not None:
+        return brentq(func, min(x_negative, x_positive), max(x_negative, x_positive), xtol=xtol)
+
+    bracket = symmetric_bracket(func, x, bracket_half_width)
+    if bracket is None:
+        raise BracketingError(f'Could not bracket root within ±{bracket_half_width} of {x}.')
+    xa, xb, fa, fb = bracket
+    return brentq(func, xa, xb, xtol=xtol, fa=fa, fb=fb)
+
+
 def brentq(
     func: Callable[[float], float],
     xa: float,
     xb: float,
     xtol: float = 1e-12,
     max_iter: int = 100,
+    fa: float | None = None,
+    fb: float | None = None,
 ) -> float:
-    fa = func(xa)
-    fb = func(xb)
+    if fa is None:
+        fa = func(xa)
+    if fb is None:
+        fb = func(xb)
 
     if fa == 0.0:
         return xa
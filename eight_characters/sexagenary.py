@@ -1,3 +1,5 @@
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
@@ -7,6 +9,7 @@ from eight_characters.conventions import (
     ZI_CONVENTION_WHOLE_ZI_23,
     ConventionSettings,
 )
+from eight_characters.policy import EnginePolicy
 
 
 STEMS = ('甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸')
@@ -27,6 +30,37 @@ class Pillar:
                 f'Polarity violation: stem={self.stem_idx}, branch={self.branch_idx}'
             )
 
+    @property
+    def cycle_index(self) -> int:
+        # Position in the sexagenary cycle: the unique i with i % 10 == stem and i % 12 == branch.
+        return (6 * self.stem_idx - 5 * self.branch_idx) % 60
+
+
+def _build_pillars() -> tuple[Pillar, ...]:
+    pillars = tuple(Pillar(stem_idx=index % 10, branch_idx=index % 12) for index in range(60))
+    for pillar in pillars:
+        pillar.validate_polarity()
+    return pillars
+
+
+# The 60 valid pillars, validated once and shared; pillar functions return these instances.
+PILLARS = _build_pillars()
+
+# Jie longitudes in ascending order; the number at or below a longitude picks the month branch.
+MONTH_BOUNDARY_LONGITUDES = (15.0, 45.0, 75.0, 105.0, 135.0, 165.0, 195.0, 225.0, 255.0, 285.0, 315.0, 345.0)
+MONTH_BRANCH_BY_BOUNDARY_COUNT = (3, 4, 5, 6, 7, 8, 9, 10, 11, 0, 1, 2, 3)
+HOUR_BRANCH_BY_HOUR = (0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 0)
+
+# [year or day stem % 5][branch] -> month or hour pillar.
+MONTH_PILLAR_BY_YEAR_STEM_MOD5 = tuple(
+    tuple(PILLARS[((first_stem + (branch_idx - 2) % 12) % 10 * 6 - branch_idx * 5) % 60] for branch_idx in range(12))
+    for first_stem in FIRST_MONTH_STEM_BY_YEAR_STEM_MOD5
+)
+HOUR_PILLAR_BY_DAY_STEM_MOD5 = tuple(
+    tuple(PILLARS[((zi_stem + branch_idx) % 10 * 6 - branch_idx * 5) % 60] for branch_idx in range(12))
+    for zi_stem in ZI_HOUR_STEM_BY_DAY_STEM_MOD5
+)
+
 
 @dataclass(frozen=True)
 class DayPillarResult:
@@ -36,6 +70,23 @@ class DayPillarResult:
     idx0: int
 
 
+@dataclass(frozen=True)
+class DayPillarRange:
+    # Row i is the civil date start + i days: JDN first_jdn + i, cycle index cycle_indexes[i].
+    start: date
+    first_jdn: int
+    cycle_indexes: array
+
+    def __len__(self) -> int:
+        return len(self.cycle_indexes)
+
+    def jdn(self, row: int) -> int:
+        return self.first_jdn + range(len(self.cycle_indexes))[row]
+
+    def pillar(self, row: int) -> Pillar:
+        return PILLARS[self.cycle_indexes[row]]
+
+
 def gregorian_to_jdn(year: int, month: int, day: int) -> int:
     a = (14 - month) // 12
     y = year + 4800 - a
@@ -49,49 +100,15 @@ def day_index_from_jdn(jdn: int) -> int:
 
 def year_pillar(civil_year: int, birth_jd_tt: float, lichun_jd_tt: float) -> tuple[Pillar, int]:
     bazi_year = civil_year - 1 if birth_jd_tt < lichun_jd_tt else civil_year
-    pillar = Pillar(
-        stem_idx=(bazi_year - 4) % 10,
-        branch_idx=(bazi_year - 4) % 12,
-    )
-    pillar.validate_polarity()
-    return pillar, bazi_year
+    return PILLARS[(bazi_year - 4) % 60], bazi_year
 
 
 def month_branch_index_from_longitude(lambda_apparent_deg: float) -> int:
-    lam = lambda_apparent_deg % 360.0
-    if 315.0 <= lam < 345.0:
-        return 2
-    if lam >= 345.0 or lam < 15.0:
-        return 3
-    if 15.0 <= lam < 45.0:
-        return 4
-    if 45.0 <= lam < 75.0:
-        return 5
-    if 75.0 <= lam < 105.0:
-        return 6
-    if 105.0 <= lam < 135.0:
-        return 7
-    if 135.0 <= lam < 165.0:
-        return 8
-    if 165.0 <= lam < 195.0:
-        return 9
-    if 195.0 <= lam < 225.0:
-        return 10
-    if 225.0 <= lam < 255.0:
-        return 11
-    if 255.0 <= lam < 285.0:
-        return 0
-    return 1
+    return MONTH_BRANCH_BY_BOUNDARY_COUNT[bisect_right(MONTH_BOUNDARY_LONGITUDES, lambda_apparent_deg % 360.0)]
 
 
 def month_pillar(lambda_apparent_deg: float, year_stem_idx: int) -> Pillar:
-    month_branch_idx = month_branch_index_from_longitude(lambda_apparent_deg)
-    month_num = (month_branch_idx - 2) % 12
-    first_month_stem = FIRST_MONTH_STEM_BY_YEAR_STEM_MOD5[year_stem_idx % 5]
-    month_stem_idx = (first_month_stem + month_num) % 10
-    pillar = Pillar(stem_idx=month_stem_idx, branch_idx=month_branch_idx)
-    pillar.validate_polarity()
-    return pillar
+    return MONTH_PILLAR_BY_YEAR_STEM_MOD5[year_stem_idx % 5][month_branch_index_from_longitude(lambda_apparent_deg)]
 
 
 def effective_day_date(
@@ -119,23 +136,38 @@ def day_pillar(
     day_date = effective_day_date(civil_dt_local, tst_dt, conventions)
     jdn = gregorian_to_jdn(day_date.year, day_date.month, day_date.day)
     idx0 = day_index_from_jdn(jdn)
-    pillar = Pillar(
-        stem_idx=idx0 % 10,
-        branch_idx=idx0 % 12,
-    )
-    pillar.validate_polarity()
     return DayPillarResult(
-        pillar=pillar,
+        pillar=PILLARS[idx0],
         effective_date=day_date,
         jdn=jdn,
         idx0=idx0,
     )
 
 
+def day_pillar_range(start: date, end: date) -> DayPillarRange:
+    # Pillars of the civil dates start..end inclusive. Day-boundary and zi conventions only
+    # decide which date a birth instant falls on (effective_day_date); a date's pillar is fixed.
+    policy = EnginePolicy()
+    policy.validate_year(start.year)
+    policy.validate_year(end.year)
+    if end < start:
+        raise ValueError('end must not be before start.')
+    first_jdn = gregorian_to_jdn(start.year, start.month, start.day)
+    day_count = end.toordinal() - start.toordinal() + 1
+    # Day indexes advance by one per day, so the range is one rotated cycle repeated.
+    first_idx0 = day_index_from_jdn(first_jdn)
+    cycle = array('B', range(first_idx0, 60))
+    cycle.extend(range(first_idx0))
+    full_cycles, remainder = divmod(day_count, 60)
+    cycle_indexes = cycle * full_cycles
+    cycle_indexes.extend(cycle[:remainder])
+    return DayPillarRange(start=start, first_jdn=first_jdn, cycle_indexes=cycle_indexes)
+
+
 def hour_branch_index(hour_value: int) -> int:
-    if hour_value == 23 or hour_value == 0:
-        return 0
-    return ((hour_value + 1) // 2) % 12
+    if not 0 <= hour_value < 24:
+        raise ValueError(f'Hour must be in 0..23, got {hour_value}.')
+    return HOUR_BRANCH_BY_HOUR[hour_value]
 
 
 def hour_pillar(
@@ -149,9 +181,4 @@ def hour_pillar(
     else:
         basis_dt = civil_dt_local
 
-    branch_idx = hour_branch_index(basis_dt.hour)
-    zi_hour_stem_idx = ZI_HOUR_STEM_BY_DAY_STEM_MOD5[day_stem_idx % 5]
-    stem_idx = (zi_hour_stem_idx + branch_idx) % 10
-    pillar = Pillar(stem_idx=stem_idx, branch_idx=branch_idx)
-    pillar.validate_polarity()
-    return pillar
+    return HOUR_PILLAR_BY_DAY_STEM_MOD5[day_stem_idx % 5][HOUR_BRANCH_BY_HOUR[basis_dt.hour]]
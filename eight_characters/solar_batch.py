@@ -0,0 +1,186 @@
+from array import array
+from dataclasses import dataclass
+from functools import partial
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+from eight_characters.equation_of_time_table import get_equation_of_time_table
+from eight_characters.obliquity import true_obliquity_radians
+from eight_characters.solar_position import (
+    NANOSECONDS_PER_DAY,
+    SECONDS_PER_DAY,
+    UNIX_EPOCH_JD,
+    compute_apparent_solar_longitude,
+    equation_of_time_minutes_for_position,
+)
+from eight_characters.time_convert import tt_minus_utc_seconds_for_posix_ns
+from eight_characters.vsop87d import PRECISION_REFERENCE
+
+if TYPE_CHECKING:
+    from eight_characters.solar_ephemeris import SolarEphemeris
+
+
+DEGREES_PER_DAY_OF_LONGITUDE = 360.0
+MINUTES_PER_DAY = 1440.0
+
+SOLAR_POSITION_COLUMNS = (
+    'jd_tt',
+    'lambda_apparent_deg',
+    'beta_deg',
+    'radius_au',
+    'delta_psi_arcseconds',
+    'delta_epsilon_arcseconds',
+    'epsilon_radians',
+    'equation_of_time_minutes',
+    'local_mean_solar_jd',
+    'true_solar_jd',
+)
+
+
+@dataclass(frozen=True)
+class SolarPositionColumns:
+    # One float64 column per field of SolarPositionResult. Local mean and true solar
+    # time are Julian-date style day counts: the UTC JD shifted by longitude (and EoT).
+    jd_tt: array
+    lambda_apparent_deg: array
+    beta_deg: array
+    radius_au: array
+    delta_psi_arcseconds: array
+    delta_epsilon_arcseconds: array
+    epsilon_radians: array
+    equation_of_time_minutes: array
+    local_mean_solar_jd: array
+    true_solar_jd: array
+    precision: str = PRECISION_REFERENCE
+
+    def __len__(self) -> int:
+        return len(self.jd_tt)
+
+    def columns(self) -> dict[str, array]:
+        return {name: getattr(self, name) for name in SOLAR_POSITION_COLUMNS}
+
+
+@dataclass(frozen=True)
+class TrueSolarTimeColumns:
+    # The solar-time subset of SolarPositionColumns, from the equation-of-time table.
+    equation_of_time_minutes: array
+    local_mean_solar_jd: array
+    true_solar_jd: array
+
+    def __len__(self) -> int:
+        return len(self.true_solar_jd)
+
+
+def _per_instant(value: float | Sequence[float], count: int, name: str) -> Iterator[float]:
+    if isinstance(value, (int, float)):
+        return repeat(float(value), count)
+    if len(value) != count:
+        raise ValueError(f'{name} must be a scalar or have one value per instant.')
+    return iter(value)
+
+
+def julian_dates_tt_from_posix_ns(
+    posix_ns_values: Iterable[int],
+    tt_minus_utc_seconds: float | Sequence[float] | None = None,
+) -> array:
+    # Integer UTC nanoseconds straight to a JD(TT) column, without datetime objects.
+    # TT-UTC defaults to the engine's leap-second / delta-T lookup for each instant.
+    posix_ns_values = posix_ns_values if isinstance(posix_ns_values, Sequence) else list(posix_ns_values)
+    if tt_minus_utc_seconds is None:
+        tt_minus_utc_seconds = tt_minus_utc_seconds_for_posix_ns(posix_ns_values)
+    jd_tt_column = array('d')
+    append = jd_tt_column.append
+    for posix_ns, tt_minus_utc in zip(
+        posix_ns_values,
+        _per_instant(tt_minus_utc_seconds, len(posix_ns_values), 'tt_minus_utc_seconds'),
+    ):
+        days, remainder_ns = divmod(posix_ns, NANOSECONDS_PER_DAY)
+        append(UNIX_EPOCH_JD + days + remainder_ns / NANOSECONDS_PER_DAY + tt_minus_utc / SECONDS_PER_DAY)
+    return jd_tt_column
+
+
+def compute_solar_position_columns(
+    jd_tt_values: Iterable[float],
+    longitude_deg: float | Sequence[float] = 0.0,
+    tt_minus_utc_seconds: float | Sequence[float] = 0.0,
+    precision: str = PRECISION_REFERENCE,
+    ephemeris: 'SolarEphemeris | None' = None,
+) -> SolarPositionColumns:
+    jd_tt_column = array('d', jd_tt_values)
+    count = len(jd_tt_column)
+    columns = {name: array('d') for name in SOLAR_POSITION_COLUMNS[1:]}
+    if ephemeris is None:
+        apparent_position = partial(compute_apparent_solar_longitude, precision=precision)
+    else:
+        apparent_position = ephemeris.apparent_position
+        precision = ephemeris.precision
+
+    append_lambda = columns['lambda_apparent_deg'].append
+    append_beta = columns['beta_deg'].append
+    append_radius = columns['radius_au'].append
+    append_delta_psi = columns['delta_psi_arcseconds'].append
+    append_delta_epsilon = columns['delta_epsilon_arcseconds'].append
+    append_epsilon = columns['epsilon_radians'].append
+    append_equation_of_time = columns['equation_of_time_minutes'].append
+    append_local_mean = columns['local_mean_solar_jd'].append
+    append_true_solar = columns['true_solar_jd'].append
+
+    for jd_tt, longitude, tt_minus_utc in zip(
+        jd_tt_column,
+        _per_instant(longitude_deg, count, 'longitude_deg'),
+        _per_instant(tt_minus_utc_seconds, count, 'tt_minus_utc_seconds'),
+    ):
+        lambda_deg, beta_deg, radius_au, delta_psi, delta_epsilon, t_centuries = apparent_position(jd_tt)
+        epsilon_radians = true_obliquity_radians(t_centuries, delta_epsilon)
+        equation_of_time = equation_of_time_minutes_for_position(
+            lambda_deg, beta_deg, radius_au, delta_psi, epsilon_radians, t_centuries
+        )
+        local_mean_jd = jd_tt - tt_minus_utc / SECONDS_PER_DAY + longitude / DEGREES_PER_DAY_OF_LONGITUDE
+
+        append_lambda(lambda_deg)
+        append_beta(beta_deg)
+        append_radius(radius_au)
+        append_delta_psi(delta_psi)
+        append_delta_epsilon(delta_epsilon)
+        append_epsilon(epsilon_radians)
+        append_equation_of_time(equation_of_time)
+        append_local_mean(local_mean_jd)
+        append_true_solar(local_mean_jd + equation_of_time / MINUTES_PER_DAY)
+
+    return SolarPositionColumns(jd_tt=jd_tt_column, precision=precision, **columns)
+
+
+def compute_true_solar_time_columns(
+    jd_tt_values: Iterable[float],
+    longitude_deg: float | Sequence[float] = 0.0,
+    tt_minus_utc_seconds: float | Sequence[float] = 0.0,
+) -> TrueSolarTimeColumns:
+    # For callers that need only solar time: the daily equation-of-time table replaces the
+    # VSOP87D and nutation series, within EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES of
+    # compute_solar_position_columns at the reference tier.
+    jd_tt_column = array('d', jd_tt_values)
+    count = len(jd_tt_column)
+    equation_of_time_at = get_equation_of_time_table().equation_of_time_minutes
+    equation_of_time_column = array('d')
+    local_mean_column = array('d')
+    true_solar_column = array('d')
+    append_equation_of_time = equation_of_time_column.append
+    append_local_mean = local_mean_column.append
+    append_true_solar = true_solar_column.append
+
+    for jd_tt, longitude, tt_minus_utc in zip(
+        jd_tt_column,
+        _per_instant(longitude_deg, count, 'longitude_deg'),
+        _per_instant(tt_minus_utc_seconds, count, 'tt_minus_utc_seconds'),
+    ):
+        equation_of_time = equation_of_time_at(jd_tt)
+        local_mean_jd = jd_tt - tt_minus_utc / SECONDS_PER_DAY + longitude / DEGREES_PER_DAY_OF_LONGITUDE
+        append_equation_of_time(equation_of_time)
+        append_local_mean(local_mean_jd)
+        append_true_solar(local_mean_jd + equation_of_time / MINUTES_PER_DAY)
+
+    return TrueSolarTimeColumns(
+        equation_of_time_minutes=equation_of_time_column,
+        local_mean_solar_jd=local_mean_column,
+        true_solar_jd=true_solar_column,
+    )
@@ -0,0 +1,247 @@
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from math import cos, pi
+from pathlib import Path
+from typing import Protocol, Sequence
+
+from eight_characters.embedded_data import ENGINE_MODEL_IDS
+from eight_characters.packed_data import PackedDataError, map_packed_file, write_packed_file
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.sexagenary import gregorian_to_jdn
+from eight_characters.solar_position import J2000_JD, compute_apparent_solar_longitude, series_data_sha256
+from eight_characters.vsop87d import PRECISION_REFERENCE
+
+
+SOLAR_EPHEMERIS_KIND = 'solar_ephemeris'
+SOLAR_EPHEMERIS_FORMAT_VERSION = 1
+SOLAR_EPHEMERIS_PATH = Path(__file__).resolve().parent / 'tables' / 'solar_ephemeris.bin'
+
+EPHEMERIS_SERIES = 'series'
+EPHEMERIS_CHEBYSHEV = 'chebyshev'
+
+EPHEMERIS_QUANTITIES = (
+    'lambda_apparent_deg',
+    'beta_deg',
+    'radius_au',
+    'delta_psi_arcseconds',
+    'delta_epsilon_arcseconds',
+)
+
+# Chebyshev coefficients per quantity for 16-day segments. Longitude and nutation carry
+# the 5- to 14-day nutation terms; their residual (about half the bound) is set by the
+# daily Hermite nodes in eight_characters.nutation, not by the coefficient counts.
+DEFAULT_SEGMENT_DAYS = 16.0
+DEFAULT_COEFFICIENT_COUNTS = (16, 11, 10, 16, 15)
+
+# Documented maximum deviation from the direct series pipeline (reference precision).
+EPHEMERIS_ERROR_BOUNDS = {
+    'lambda_apparent_deg': 1e-4 / 3600.0,
+    'beta_deg': 1e-4 / 3600.0,
+    'radius_au': 1e-8,
+    'delta_psi_arcseconds': 1e-4,
+    'delta_epsilon_arcseconds': 1e-4,
+}
+
+EPHEMERIS_FIRST_JD_TT = gregorian_to_jdn(MIN_SUPPORTED_YEAR - 1, 1, 1) - 0.5
+EPHEMERIS_LAST_JD_TT = gregorian_to_jdn(MAX_SUPPORTED_YEAR + 2, 1, 1) - 0.5
+
+ApparentSolarPosition = tuple[float, float, float, float, float, float]
+
+
+class EphemerisRangeError(ValueError):
+    pass
+
+
+class SolarEphemeris(Protocol):
+    name: str
+    # Reported as SolarPositionResult.precision (a VSOP87D tier, or the backend name).
+    precision: str
+
+    def apparent_position(self, jd_tt: float) -> ApparentSolarPosition:
+        ...
+
+
+@dataclass(frozen=True)
+class SeriesSolarEphemeris:
+    precision: str = PRECISION_REFERENCE
+    name: str = EPHEMERIS_SERIES
+
+    def apparent_position(self, jd_tt: float) -> ApparentSolarPosition:
+        return compute_apparent_solar_longitude(jd_tt, self.precision)
+
+
+def chebyshev_nodes(count: int) -> list[float]:
+    return [cos(pi * (index + 0.5) / count) for index in range(count)]
+
+
+def fit_chebyshev(values: list[float], coefficient_count: int) -> list[float]:
+    # Interpolation at the len(values) Chebyshev nodes, truncated to coefficient_count terms.
+    node_count = len(values)
+    coefficients = []
+    for order in range(coefficient_count):
+        total = 0.0
+        for index, value in enumerate(values):
+            total += value * cos(pi * order * (index + 0.5) / node_count)
+        coefficients.append(2.0 * total / node_count)
+    coefficients[0] *= 0.5
+    return coefficients
+
+
+def _clenshaw(coefficients: Sequence[float], start: int, count: int, x: float) -> float:
+    b1 = 0.0
+    b2 = 0.0
+    two_x = 2.0 * x
+    for index in range(start + count - 1, start, -1):
+        b1, b2 = two_x * b1 - b2 + coefficients[index], b1
+    return x * b1 - b2 + coefficients[start]
+
+
+@dataclass(frozen=True)
+class ChebyshevSolarEphemeris:
+    first_jd_tt: float
+    segment_days: float
+    segment_count: int
+    coefficient_counts: tuple[int, ...]
+    coefficients: Sequence[float]
+    name: str = EPHEMERIS_CHEBYSHEV
+    precision: str = EPHEMERIS_CHEBYSHEV
+
+    @property
+    def last_jd_tt(self) -> float:
+        return self.first_jd_tt + self.segment_days * self.segment_count
+
+    def covers(self, jd_tt: float) -> bool:
+        return self.first_jd_tt <= jd_tt <= self.last_jd_tt
+
+    def apparent_position(self, jd_tt: float) -> ApparentSolarPosition:
+        if not self.covers(jd_tt):
+            raise EphemerisRangeError(f'JD(TT) {jd_tt} is outside the Chebyshev ephemeris range.')
+        segment = min(int((jd_tt - self.first_jd_tt) // self.segment_days), self.segment_count - 1)
+        segment_start = self.first_jd_tt + segment * self.segment_days
+        x = 2.0 * (jd_tt - segment_start) / self.segment_days - 1.0
+
+        offset = segment * sum(self.coefficient_counts)
+        values = []
+        for count in self.coefficient_counts:
+            values.append(_clenshaw(self.coefficients, offset, count, x))
+            offset += count
+        lambda_deg, beta_deg, radius_au, delta_psi, delta_epsilon = values
+        t_centuries = (jd_tt - J2000_JD) / 36525.0
+        return lambda_deg % 360.0, beta_deg, radius_au, delta_psi, delta_epsilon, t_centuries
+
+
+def segment_node_jds(segment_start_jd_tt: float, segment_days: float, node_count: int) -> list[float]:
+    return [
+        segment_start_jd_tt + 0.5 * segment_days * (node + 1.0)
+        for node in chebyshev_nodes(node_count)
+    ]
+
+
+def fit_segment(
+    segment_start_jd_tt: float,
+    segment_days: float = DEFAULT_SEGMENT_DAYS,
+    coefficient_counts: tuple[int, ...] = DEFAULT_COEFFICIENT_COUNTS,
+) -> list[float]:
+    node_count = max(coefficient_counts) + 1
+    samples = [
+        compute_apparent_solar_longitude(jd_tt, PRECISION_REFERENCE)[:5]
+        for jd_tt in segment_node_jds(segment_start_jd_tt, segment_days, node_count)
+    ]
+    # Unwrap longitude across 0/360 so the fitted function is continuous.
+    first_lambda = samples[0][0]
+    columns = [[(sample[0] - first_lambda + 180.0) % 360.0 - 180.0 + first_lambda for sample in samples]]
+    columns.extend([sample[index] for sample in samples] for index in range(1, len(EPHEMERIS_QUANTITIES)))
+
+    coefficients: list[float] = []
+    for column, count in zip(columns, coefficient_counts):
+        coefficients.extend(fit_chebyshev(column, count))
+    return coefficients
+
+
+def write_solar_ephemeris(
+    target_file: str | Path,
+    first_jd_tt: float,
+    segment_days: float,
+    coefficient_counts: tuple[int, ...],
+    coefficients: list[float],
+    max_errors: dict[str, float],
+) -> None:
+    stride = sum(coefficient_counts)
+    if len(coefficient_counts) != len(EPHEMERIS_QUANTITIES):
+        raise ValueError('One coefficient count is required per ephemeris quantity.')
+    if len(coefficients) % stride:
+        raise ValueError('Coefficient payload is not a whole number of segments.')
+    packed = array('d', coefficients)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    write_packed_file(
+        target_file,
+        kind=SOLAR_EPHEMERIS_KIND,
+        format_version=SOLAR_EPHEMERIS_FORMAT_VERSION,
+        metadata={
+            'coefficient_counts': list(coefficient_counts),
+            'first_jd_tt': first_jd_tt,
+            'max_errors': max_errors,
+            'model_ids': dict(ENGINE_MODEL_IDS),
+            'quantities': list(EPHEMERIS_QUANTITIES),
+            'segment_count': len(coefficients) // stride,
+            'segment_days': segment_days,
+            'series_sha256': series_data_sha256(),
+            'time_scale': 'TT',
+        },
+        payload=packed.tobytes(),
+    )
+
+
+def load_solar_ephemeris(source_file: str | Path) -> ChebyshevSolarEphemeris:
+    packed = map_packed_file(
+        source_file,
+        expected_kind=SOLAR_EPHEMERIS_KIND,
+        expected_format_version=SOLAR_EPHEMERIS_FORMAT_VERSION,
+    )
+    metadata = packed.metadata
+    if metadata['model_ids'] != ENGINE_MODEL_IDS:
+        raise PackedDataError(
+            'Solar ephemeris was built with different model ids; '
+            'rebuild it with python -m eight_characters.build_ephemeris.'
+        )
+    if metadata.get('series_sha256') != series_data_sha256():
+        raise PackedDataError(
+            'Solar ephemeris was built from different VSOP87D or nutation data; '
+            'rebuild it with python -m eight_characters.build_ephemeris.'
+        )
+    if tuple(metadata['quantities']) != EPHEMERIS_QUANTITIES:
+        raise PackedDataError('Solar ephemeris has an unexpected quantity layout.')
+
+    if sys.byteorder == 'little':
+        coefficients = packed.payload.cast('d')
+    else:
+        coefficients = array('d', bytes(packed.payload))
+        coefficients.byteswap()
+
+    coefficient_counts = tuple(int(count) for count in metadata['coefficient_counts'])
+    segment_count = int(metadata['segment_count'])
+    if len(coefficients) != segment_count * sum(coefficient_counts):
+        raise PackedDataError('Solar ephemeris payload length does not match its segment layout.')
+    return ChebyshevSolarEphemeris(
+        first_jd_tt=float(metadata['first_jd_tt']),
+        segment_days=float(metadata['segment_days']),
+        segment_count=segment_count,
+        coefficient_counts=coefficient_counts,
+        coefficients=coefficients,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_chebyshev_ephemeris() -> ChebyshevSolarEphemeris:
+    return load_solar_ephemeris(SOLAR_EPHEMERIS_PATH)
+
+
+def get_solar_ephemeris(name: str = EPHEMERIS_SERIES) -> SolarEphemeris:
+    if name == EPHEMERIS_SERIES:
+        return SeriesSolarEphemeris()
+    if name == EPHEMERIS_CHEBYSHEV:
+        return get_chebyshev_ephemeris()
+    raise ValueError('Invalid solar ephemeris backend.')
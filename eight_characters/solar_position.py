@@ -1,18 +1,48 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from math import atan2, cos, pi, sin, tan
+from typing import TYPE_CHECKING
 
-from eight_characters.nutation import nutation_arcseconds_seed
+from eight_characters.nutation import IAU2000A_NUTATION_KIND, nutation_arcseconds, nutation_series_sha256
 from eight_characters.obliquity import (
     arcseconds_to_radians,
     mean_obliquity_arcseconds_iau2006,
     true_obliquity_radians,
 )
-from eight_characters.vsop87d import earth_heliocentric_lbr, normalize_degrees
+from eight_characters.time_convert import NANOSECONDS_PER_SECOND, posix_ns_from_datetime_utc
+from eight_characters.vsop87d import (
+    DEG_PER_RAD,
+    PRECISION_REFERENCE,
+    VSOP87D_EARTH_KIND,
+    earth_series_sha256,
+    earth_heliocentric_lbr,
+    earth_heliocentric_longitude_rates_and_radius,
+    normalize_degrees,
+)
+
+if TYPE_CHECKING:
+    from eight_characters.solar_ephemeris import SolarEphemeris
 
 
 J2000_JD = 2451545.0
 SECONDS_PER_DAY = 86400.0
+DAYS_PER_MILLENNIUM = 365250.0
+
+# Integer POSIX time: whole days are added to the epoch exactly, leaving one rounding
+# for the day fraction.
+UNIX_EPOCH_JD = 2440587.5
+NANOSECONDS_PER_DAY = 86_400 * NANOSECONDS_PER_SECOND
+
+ABERRATION_ARCSECONDS = 20.4898
+
+
+def series_data_sha256() -> dict[str, str]:
+    # Payload digests of the data packs behind the apparent-Sun pipeline. Tables derived from
+    # the pipeline record these, so replacing either series makes them stale.
+    return {
+        VSOP87D_EARTH_KIND: earth_series_sha256(),
+        IAU2000A_NUTATION_KIND: nutation_series_sha256(),
+    }
 
 
 @dataclass(frozen=True)
@@ -27,6 +57,7 @@ class SolarPositionResult:
     equation_of_time_minutes: float
     local_mean_solar_time: datetime
     true_solar_time: datetime
+    precision: str = PRECISION_REFERENCE
 
 
 def julian_date_from_datetime_utc(utc_datetime: datetime) -> float:
@@ -56,16 +87,29 @@ def julian_date_from_datetime_utc(utc_datetime: datetime) -> float:
     return jd
 
 
-def compute_apparent_solar_longitude(jd_tt: float) -> tuple[float, float, float, float, float, float]:
+def julian_date_from_posix_ns(posix_ns: int) -> float:
+    days, remainder_ns = divmod(posix_ns, NANOSECONDS_PER_DAY)
+    return UNIX_EPOCH_JD + days + remainder_ns / NANOSECONDS_PER_DAY
+
+
+def julian_date_from_posix_seconds(posix_seconds: int) -> float:
+    days, remainder_seconds = divmod(posix_seconds, 86_400)
+    return UNIX_EPOCH_JD + days + remainder_seconds / SECONDS_PER_DAY
+
+
+def compute_apparent_solar_longitude(
+    jd_tt: float,
+    precision: str = PRECISION_REFERENCE,
+) -> tuple[float, float, float, float, float, float]:
     tau = (jd_tt - J2000_JD) / 365250.0
     t_centuries = (jd_tt - J2000_JD) / 36525.0
 
-    earth_l_deg, earth_b_deg, radius_au = earth_heliocentric_lbr(tau)
+    earth_l_deg, earth_b_deg, radius_au = earth_heliocentric_lbr(tau, precision)
     theta_deg = normalize_degrees(earth_l_deg + 180.0)
     beta_deg = -earth_b_deg
 
-    delta_psi_arcseconds, delta_epsilon_arcseconds = nutation_arcseconds_seed(t_centuries)
-    aberration_deg = (-20.4898 / radius_au) / 3600.0
+    delta_psi_arcseconds, delta_epsilon_arcseconds = nutation_arcseconds(t_centuries)
+    aberration_deg = (-ABERRATION_ARCSECONDS / radius_au) / 3600.0
     lambda_apparent_deg = normalize_degrees(theta_deg + delta_psi_arcseconds / 3600.0 + aberration_deg)
 
     return (
@@ -78,7 +122,46 @@ def compute_apparent_solar_longitude(jd_tt: float) -> tuple[float, float, float,
     )
 
 
-def _equation_of_time_minutes(
+def compute_apparent_solar_longitude_and_rates(jd_tt: float) -> tuple[float, float, float]:
+    # Rates come from the VSOP87D longitude series alone; nutation and aberration
+    # change by less than 5e-5 of the solar rate and are left out of the derivatives.
+    tau = (jd_tt - J2000_JD) / DAYS_PER_MILLENNIUM
+    t_centuries = (jd_tt - J2000_JD) / 36525.0
+
+    earth_l_rad, dl_dtau, d2l_dtau2, radius_au = earth_heliocentric_longitude_rates_and_radius(tau)
+    theta_deg = normalize_degrees(normalize_degrees(earth_l_rad * DEG_PER_RAD) + 180.0)
+
+    delta_psi_arcseconds, _ = nutation_arcseconds(t_centuries)
+    aberration_deg = (-ABERRATION_ARCSECONDS / radius_au) / 3600.0
+    lambda_apparent_deg = normalize_degrees(theta_deg + delta_psi_arcseconds / 3600.0 + aberration_deg)
+
+    rate_deg_per_day = dl_dtau * DEG_PER_RAD / DAYS_PER_MILLENNIUM
+    acceleration_deg_per_day2 = d2l_dtau2 * DEG_PER_RAD / (DAYS_PER_MILLENNIUM ** 2)
+    return lambda_apparent_deg, rate_deg_per_day, acceleration_deg_per_day2
+
+
+def mean_solar_longitude_deg(t_centuries: float) -> float:
+    return normalize_degrees(280.46646 + 36000.76983 * t_centuries + 0.0003032 * (t_centuries ** 2))
+
+
+def equation_of_time_from_right_ascension_deg(
+    alpha_deg: float,
+    delta_psi_arcseconds: float,
+    cos_epsilon: float,
+    radius_au: float,
+    t_centuries: float,
+) -> float:
+    # Arithmetic only, so the NumPy extra applies it to whole columns; wrapping to
+    # [-180, 180] is left to the caller.
+    return (
+        mean_solar_longitude_deg(t_centuries)
+        - alpha_deg
+        + (delta_psi_arcseconds / 3600.0) * cos_epsilon
+        - (ABERRATION_ARCSECONDS / (3600.0 * radius_au))
+    )
+
+
+def equation_of_time_minutes_for_position(
     lambda_apparent_deg: float,
     beta_deg: float,
     radius_au: float,
@@ -97,14 +180,12 @@ def _equation_of_time_minutes(
         alpha += 2.0 * pi
     alpha_deg = alpha * 180.0 / pi
 
-    l0_deg = normalize_degrees(
-        280.46646 + 36000.76983 * t_centuries + 0.0003032 * (t_centuries ** 2)
-    )
-    eot_deg = (
-        l0_deg
-        - alpha_deg
-        + (delta_psi_arcseconds / 3600.0) * cos(epsilon_radians)
-        - (20.4898 / (3600.0 * radius_au))
+    eot_deg = equation_of_time_from_right_ascension_deg(
+        alpha_deg,
+        delta_psi_arcseconds,
+        cos(epsilon_radians),
+        radius_au,
+        t_centuries,
     )
     while eot_deg > 180.0:
         eot_deg -= 360.0
@@ -113,14 +194,38 @@ def _equation_of_time_minutes(
     return eot_deg * 4.0
 
 
+def compute_equation_of_time_minutes(jd_tt: float, precision: str = PRECISION_REFERENCE) -> float:
+    lambda_apparent_deg, beta_deg, radius_au, delta_psi_arcseconds, delta_epsilon_arcseconds, t_centuries = (
+        compute_apparent_solar_longitude(jd_tt, precision)
+    )
+    return equation_of_time_minutes_for_position(
+        lambda_apparent_deg=lambda_apparent_deg,
+        beta_deg=beta_deg,
+        radius_au=radius_au,
+        delta_psi_arcseconds=delta_psi_arcseconds,
+        epsilon_radians=true_obliquity_radians(t_centuries, delta_epsilon_arcseconds),
+        t_centuries=t_centuries,
+    )
+
+
 def compute_solar_position_and_tst(
     utc_datetime: datetime,
     longitude_deg: float,
     tt_minus_utc_seconds: float,
+    precision: str = PRECISION_REFERENCE,
+    ephemeris: 'SolarEphemeris | None' = None,
+    utc_posix_ns: int | None = None,
 ) -> SolarPositionResult:
-    jd_utc = julian_date_from_datetime_utc(utc_datetime)
+    if utc_posix_ns is None:
+        utc_posix_ns = posix_ns_from_datetime_utc(utc_datetime)
+    jd_utc = julian_date_from_posix_ns(utc_posix_ns)
     jd_tt = jd_utc + tt_minus_utc_seconds / SECONDS_PER_DAY
 
+    if ephemeris is None:
+        apparent = compute_apparent_solar_longitude(jd_tt, precision)
+    else:
+        apparent = ephemeris.apparent_position(jd_tt)
+        precision = ephemeris.precision
     (
         lambda_apparent_deg,
         beta_deg,
@@ -128,10 +233,10 @@ def compute_solar_position_and_tst(
         delta_psi_arcseconds,
         delta_epsilon_arcseconds,
         t_centuries,
-    ) = compute_apparent_solar_longitude(jd_tt)
+    ) = apparent
 
     epsilon_radians = true_obliquity_radians(t_centuries, delta_epsilon_arcseconds)
-    equation_of_time_minutes = _equation_of_time_minutes(
+    equation_of_time_minutes = equation_of_time_minutes_for_position(
         lambda_apparent_deg=lambda_apparent_deg,
         beta_deg=beta_deg,
         radius_au=radius_au,
@@ -154,6 +259,7 @@ def compute_solar_position_and_tst(
         equation_of_time_minutes=equation_of_time_minutes,
         local_mean_solar_time=lmst_dt,
         true_solar_time=tst_dt,
+        precision=precision,
     )
 
 
@@ -164,7 +270,7 @@ def mean_obliquity_degrees_for_jd_tt(jd_tt: float) -> float:
 
 def nutation_degrees_for_jd_tt(jd_tt: float) -> tuple[float, float]:
     t_centuries = (jd_tt - J2000_JD) / 36525.0
-    delta_psi_arcseconds, delta_epsilon_arcseconds = nutation_arcseconds_seed(t_centuries)
+    delta_psi_arcseconds, delta_epsilon_arcseconds = nutation_arcseconds(t_centuries)
     return (
         delta_psi_arcseconds / 3600.0,
         delta_epsilon_arcseconds / 3600.0,
@@ -1,45 +1,220 @@
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from math import radians, sin
+from typing import Callable
 
-from eight_characters.root_finding import brentq, find_bracket, normalize_longitude_difference
-from eight_characters.solar_position import compute_apparent_solar_longitude, julian_date_from_datetime_utc
+from eight_characters.caching import BoundedLRUCache, CacheStats
+from eight_characters.root_finding import (
+    EvaluationCounter,
+    brentq,
+    find_bracket,
+    newton_safeguarded,
+    normalize_longitude_difference,
+    symmetric_bracket,
+)
+from eight_characters.sexagenary import gregorian_to_jdn
+from eight_characters.solar_position import (
+    J2000_JD,
+    compute_apparent_solar_longitude,
+    compute_apparent_solar_longitude_and_rates,
+)
+from eight_characters.solar_term_table import (
+    TERMS_PER_YEAR,
+    get_solar_term_table,
+    term_slot_for_longitude,
+)
 
 
-UTC = timezone.utc
-
 JIE_TARGET_LONGITUDES = (315.0, 345.0, 15.0, 45.0, 75.0, 105.0, 135.0, 165.0, 195.0, 225.0, 255.0, 285.0)
 
+MEAN_TERM_SPACING_DAYS = 365.2422 / TERMS_PER_YEAR
+
+SEEDING_ANALYTIC = 'analytic'
+SEEDING_SCAN = 'scan'
+ALLOWED_SEEDING_MODES = (SEEDING_ANALYTIC, SEEDING_SCAN)
+
+METHOD_BRENT = 'brent'
+METHOD_NEWTON = 'newton'
+METHOD_HALLEY = 'halley'
+ALLOWED_SOLVER_METHODS = (METHOD_BRENT, METHOD_NEWTON, METHOD_HALLEY)
+
+MEAN_SOLAR_MOTION_DEG_PER_DAY = 0.9856473
+PREDICTOR_ITERATIONS = 3
+TIGHT_BRACKET_HALF_WIDTH_DAYS = 0.025
+
+# 36 month terms per engine request; roughly a century of distinct years stays resident.
+SOLAR_TERM_CACHE_MAX_SIZE = 4096
+
+_SOLAR_TERM_CACHE: BoundedLRUCache[float] = BoundedLRUCache(SOLAR_TERM_CACHE_MAX_SIZE)
+
 
 def apparent_longitude_at_jd_tt(jd_tt: float) -> float:
     lambda_apparent_deg, _, _, _, _, _ = compute_apparent_solar_longitude(jd_tt)
     return lambda_apparent_deg
 
 
-def _term_root_function(target_longitude_deg: float):
+def _term_root_function(
+    target_longitude_deg: float,
+    longitude_fn: Callable[[float], float] = apparent_longitude_at_jd_tt,
+):
     def f(jd_tt: float) -> float:
-        lam = apparent_longitude_at_jd_tt(jd_tt)
+        lam = longitude_fn(jd_tt)
         return normalize_longitude_difference(lam - target_longitude_deg)
 
     return f
 
 
-def find_solar_term(
+def _term_root_function_with_derivatives(
+    target_longitude_deg: float,
+    longitude_and_rates_fn: Callable[[float], tuple[float, float, float]],
+):
+    def f(jd_tt: float) -> tuple[float, float, float]:
+        lam, rate, acceleration = longitude_and_rates_fn(jd_tt)
+        return normalize_longitude_difference(lam - target_longitude_deg), rate, acceleration
+
+    return f
+
+
+@dataclass(frozen=True)
+class SolarTermSolution:
+    jd_tt: float
+    function_evaluations: int
+    seeding: str
+    method: str = METHOD_BRENT
+
+
+def approximate_apparent_longitude_deg(jd_tt: float) -> float:
+    # Meeus ch. 25 low-accuracy solar longitude (mean longitude plus equation of center),
+    # good to about 0.01 degree across the supported range.
+    t_centuries = (jd_tt - J2000_JD) / 36525.0
+    l0_deg = 280.46646 + 36000.76983 * t_centuries + 0.0003032 * (t_centuries ** 2)
+    m_rad = radians(357.52911 + 35999.05029 * t_centuries - 0.0001537 * (t_centuries ** 2))
+    center_deg = (
+        (1.914602 - 0.004817 * t_centuries - 0.000014 * (t_centuries ** 2)) * sin(m_rad)
+        + (0.019993 - 0.000101 * t_centuries) * sin(2.0 * m_rad)
+        + 0.000289 * sin(3.0 * m_rad)
+    )
+    omega_rad = radians(125.04 - 1934.136 * t_centuries)
+    return (l0_deg + center_deg - 0.00569 - 0.00478 * sin(omega_rad)) % 360.0
+
+
+def predict_solar_term_jd_tt(target_longitude_deg: float, near_jd_tt: float) -> float:
+    jd_tt = near_jd_tt
+    for _ in range(PREDICTOR_ITERATIONS + 1):
+        diff_deg = normalize_longitude_difference(
+            target_longitude_deg - approximate_apparent_longitude_deg(jd_tt)
+        )
+        jd_tt += diff_deg / MEAN_SOLAR_MOTION_DEG_PER_DAY
+    return jd_tt
+
+
+def solve_solar_term_detailed(
     target_longitude_deg: float,
     seed_jd_tt: float,
     tolerance_seconds: float = 0.01,
-) -> float:
+    seeding: str = SEEDING_ANALYTIC,
+    method: str = METHOD_BRENT,
+) -> SolarTermSolution:
+    if seeding not in ALLOWED_SEEDING_MODES:
+        raise ValueError('Invalid seeding mode.')
+    if method not in ALLOWED_SOLVER_METHODS:
+        raise ValueError('Invalid solver method.')
+
+    longitude_fn = EvaluationCounter(apparent_longitude_at_jd_tt)
+    root_fn = _term_root_function(target_longitude_deg, longitude_fn)
+    xtol_days = tolerance_seconds / 86400.0
+
+    if seeding == SEEDING_ANALYTIC:
+        seed_jd_tt = predict_solar_term_jd_tt(target_longitude_deg, seed_jd_tt)
+
+    if method != METHOD_BRENT:
+        longitude_and_rates_fn = EvaluationCounter(compute_apparent_solar_longitude_and_rates)
+        root = newton_safeguarded(
+            _term_root_function_with_derivatives(target_longitude_deg, longitude_and_rates_fn),
+            root_fn,
+            seed_jd_tt,
+            xtol=xtol_days,
+            bracket_half_width=TIGHT_BRACKET_HALF_WIDTH_DAYS,
+            halley=method == METHOD_HALLEY,
+        )
+        evaluations = longitude_fn.count + longitude_and_rates_fn.count
+        return SolarTermSolution(root, evaluations, seeding, method)
+
+    if seeding == SEEDING_ANALYTIC:
+        bracket = symmetric_bracket(root_fn, seed_jd_tt, TIGHT_BRACKET_HALF_WIDTH_DAYS)
+        if bracket is not None:
+            jd_a, jd_b, f_a, f_b = bracket
+            root = brentq(root_fn, jd_a, jd_b, xtol=xtol_days, fa=f_a, fb=f_b)
+            return SolarTermSolution(root, longitude_fn.count, seeding)
+
     jd_a, jd_b = find_bracket(
         target_longitude_deg=target_longitude_deg,
         seed_jd_tt=seed_jd_tt,
-        longitude_fn=apparent_longitude_at_jd_tt,
+        longitude_fn=longitude_fn,
     )
-    xtol_days = tolerance_seconds / 86400.0
-    return brentq(_term_root_function(target_longitude_deg), jd_a, jd_b, xtol=xtol_days)
+    root = brentq(root_fn, jd_a, jd_b, xtol=xtol_days)
+    return SolarTermSolution(root, longitude_fn.count, seeding)
+
+
+def solve_solar_term(
+    target_longitude_deg: float,
+    seed_jd_tt: float,
+    tolerance_seconds: float = 0.01,
+    seeding: str = SEEDING_ANALYTIC,
+    method: str = METHOD_BRENT,
+) -> float:
+    return solve_solar_term_detailed(
+        target_longitude_deg,
+        seed_jd_tt,
+        tolerance_seconds=tolerance_seconds,
+        seeding=seeding,
+        method=method,
+    ).jd_tt
+
+
+def find_solar_term(
+    target_longitude_deg: float,
+    seed_jd_tt: float,
+    tolerance_seconds: float = 0.01,
+    use_table: bool = True,
+    method: str = METHOD_BRENT,
+) -> float:
+    if use_table:
+        table = get_solar_term_table()
+        if tolerance_seconds >= table.tolerance_seconds:
+            table_jd = table.nearest_term_jd_tt(target_longitude_deg, seed_jd_tt)
+            if table_jd is not None:
+                return table_jd
+    return solve_solar_term(target_longitude_deg, seed_jd_tt, tolerance_seconds, method=method)
+
+
+def seed_jd_tt_for_term(year_value: int, target_longitude_deg: float) -> float:
+    slot = term_slot_for_longitude(target_longitude_deg)
+    if slot is None:
+        raise ValueError('Solar-term targets must be multiples of 15 degrees.')
+    # Slot 0 (xiaohan, 285 deg) falls on January 5-6 throughout the supported range.
+    return gregorian_to_jdn(year_value, 1, 5) - 0.5 + slot * MEAN_TERM_SPACING_DAYS
+
+
+def solar_term_jd_tt(year_value: int, target_longitude_deg: float) -> float:
+    return _SOLAR_TERM_CACHE.get_or_compute(
+        (year_value, target_longitude_deg),
+        lambda: find_solar_term(
+            target_longitude_deg,
+            seed_jd_tt_for_term(year_value, target_longitude_deg),
+        ),
+    )
+
+
+def solar_term_cache_stats() -> CacheStats:
+    return _SOLAR_TERM_CACHE.stats()
+
+
+def clear_solar_term_cache() -> None:
+    _SOLAR_TERM_CACHE.clear()
 
 
 def lichun_jd_tt_for_civil_year(civil_year: int) -> float:
-    seed_utc = datetime(civil_year, 2, 4, 0, 0, 0, tzinfo=UTC)
-    seed_jd = julian_date_from_datetime_utc(seed_utc)
-    return find_solar_term(315.0, seed_jd)
+    return solar_term_jd_tt(civil_year, 315.0)
 
 
 def nearest_jie_distance_seconds(birth_jd_tt: float, nearby_term_jd: list[float]) -> float:
@@ -0,0 +1,161 @@
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from eight_characters.embedded_data import ENGINE_MODEL_IDS
+from eight_characters.packed_data import PackedDataError, read_packed_file, write_packed_file
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.solar_position import series_data_sha256
+
+
+SOLAR_TERM_TABLE_KIND = 'solar_terms'
+SOLAR_TERM_TABLE_FORMAT_VERSION = 2
+SOLAR_TERM_TABLE_PATH = Path(__file__).resolve().parent / 'tables' / 'solar_terms.bin'
+
+# One year of padding on each side keeps the engine's neighbouring-year scan in-table.
+TABLE_FIRST_YEAR = MIN_SUPPORTED_YEAR - 1
+TABLE_LAST_YEAR = MAX_SUPPORTED_YEAR + 1
+
+TERMS_PER_YEAR = 24
+TERM_SPACING_DEG = 15.0
+FIRST_TERM_LONGITUDE_DEG = 285.0
+MAX_LOOKUP_DISTANCE_DAYS = 182.0
+
+
+def term_slot_for_longitude(target_longitude_deg: float) -> int | None:
+    offset_deg = (target_longitude_deg - FIRST_TERM_LONGITUDE_DEG) % 360.0
+    slot = int(offset_deg // TERM_SPACING_DEG)
+    if slot * TERM_SPACING_DEG != offset_deg:
+        return None
+    return slot
+
+
+def term_longitude_for_slot(slot: int) -> float:
+    return (FIRST_TERM_LONGITUDE_DEG + slot * TERM_SPACING_DEG) % 360.0
+
+
+@dataclass(frozen=True)
+class SolarTermTable:
+    first_year: int
+    last_year: int
+    tolerance_seconds: float
+    term_jd_tt: array
+
+    def covers_year(self, year_value: int) -> bool:
+        return self.first_year <= year_value <= self.last_year
+
+    def term_jd_tt_for_year(self, year_value: int, target_longitude_deg: float) -> float | None:
+        slot = term_slot_for_longitude(target_longitude_deg)
+        if slot is None or not self.covers_year(year_value):
+            return None
+        return self.term_jd_tt[(year_value - self.first_year) * TERMS_PER_YEAR + slot]
+
+    def nearest_term_jd_tt(self, target_longitude_deg: float, near_jd_tt: float) -> float | None:
+        slot = term_slot_for_longitude(target_longitude_deg)
+        if slot is None:
+            return None
+
+        values = self.term_jd_tt
+        count = len(values)
+        position = bisect_left(values, near_jd_tt)
+        before = position - 1 - ((position - 1 - slot) % TERMS_PER_YEAR)
+        after = before + TERMS_PER_YEAR
+
+        best: float | None = None
+        for index in (before, after):
+            if 0 <= index < count:
+                candidate = values[index]
+                if best is None or abs(candidate - near_jd_tt) < abs(best - near_jd_tt):
+                    best = candidate
+        if best is None or abs(best - near_jd_tt) > MAX_LOOKUP_DISTANCE_DAYS:
+            return None
+        return best
+
+
+def encode_term_values(values: list[float]) -> bytes:
+    packed = array('d', values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def decode_term_values(payload: memoryview) -> array:
+    values = array('d')
+    values.frombytes(bytes(payload))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def write_solar_term_table(
+    target_file: str | Path,
+    first_year: int,
+    last_year: int,
+    tolerance_seconds: float,
+    values: list[float],
+) -> None:
+    expected_count = (last_year - first_year + 1) * TERMS_PER_YEAR
+    if len(values) != expected_count:
+        raise ValueError(f'Expected {expected_count} term instants, got {len(values)}.')
+    write_packed_file(
+        target_file,
+        kind=SOLAR_TERM_TABLE_KIND,
+        format_version=SOLAR_TERM_TABLE_FORMAT_VERSION,
+        metadata={
+            'first_year': first_year,
+            'last_year': last_year,
+            'first_term_longitude_deg': FIRST_TERM_LONGITUDE_DEG,
+            'model_ids': dict(ENGINE_MODEL_IDS),
+            'series_sha256': series_data_sha256(),
+            'terms_per_year': TERMS_PER_YEAR,
+            'time_scale': 'TT',
+            'tolerance_seconds': tolerance_seconds,
+        },
+        payload=encode_term_values(values),
+    )
+
+
+def load_solar_term_table(source_file: str | Path) -> SolarTermTable:
+    packed = read_packed_file(
+        source_file,
+        expected_kind=SOLAR_TERM_TABLE_KIND,
+        expected_format_version=SOLAR_TERM_TABLE_FORMAT_VERSION,
+    )
+    metadata = packed.metadata
+    if metadata['model_ids'] != ENGINE_MODEL_IDS:
+        raise PackedDataError(
+            'Solar-term table was built with different model ids; '
+            'rebuild it with python -m eight_characters.build_terms.'
+        )
+    if metadata.get('series_sha256') != series_data_sha256():
+        raise PackedDataError(
+            'Solar-term table was built from different VSOP87D or nutation data; '
+            'rebuild it with python -m eight_characters.build_terms.'
+        )
+    if metadata['terms_per_year'] != TERMS_PER_YEAR:
+        raise PackedDataError('Solar-term table has an unexpected terms-per-year layout.')
+    if metadata['first_term_longitude_deg'] != FIRST_TERM_LONGITUDE_DEG:
+        raise PackedDataError('Solar-term table has an unexpected first term longitude.')
+
+    first_year = int(metadata['first_year'])
+    last_year = int(metadata['last_year'])
+    values = decode_term_values(packed.payload)
+    if len(values) != (last_year - first_year + 1) * TERMS_PER_YEAR:
+        raise PackedDataError('Solar-term table payload length does not match its year range.')
+    if any(values[i] >= values[i + 1] for i in range(len(values) - 1)):
+        raise PackedDataError('Solar-term table instants are not strictly increasing.')
+
+    return SolarTermTable(
+        first_year=first_year,
+        last_year=last_year,
+        tolerance_seconds=float(metadata['tolerance_seconds']),
+        term_jd_tt=values,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_solar_term_table() -> SolarTermTable:
+    return load_solar_term_table(SOLAR_TERM_TABLE_PATH)
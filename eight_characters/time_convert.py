@@ -1,18 +1,66 @@
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Mapping, Sequence
+from zoneinfo import ZoneInfo
 
 from eight_characters.conventions import ConventionSettings
 from eight_characters.embedded_data import (
-    LEAP_SECOND_METADATA,
+    DELTA_T_SEGMENTS,
+    LEAP_SECOND_THRESHOLDS_POSIX,
+    EngineMetadata,
     evaluate_delta_t_seconds,
-    get_leap_second_offset_seconds,
-    get_tzdb_version,
+    get_engine_metadata,
+    leap_second_offset_for_posix_seconds,
+    refresh_engine_metadata,
 )
-from eight_characters.policy import EnginePolicy
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR, EnginePolicy
+from eight_characters.timezone_index import UNIX_EPOCH_ORDINAL, clear_timezone_index_cache, get_timezone_index
 
 
 UTC = timezone.utc
+UNIX_EPOCH = datetime(1970, 1, 1)
+UNIX_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_SECOND = timedelta(seconds=1)
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+TT_MINUS_TAI_SECONDS = 32.184
+TT_CONVERSION_LEAP_SECONDS = 'leap_seconds'
+TT_CONVERSION_DELTA_T = 'delta_t'
+LEAP_SECOND_ERA_START_POSIX_NS = LEAP_SECOND_THRESHOLDS_POSIX[0] * NANOSECONDS_PER_SECOND
+
+# UTC year starts in integer POSIX nanoseconds across the delta-T segments, so the
+# decimal year of an instant needs one bisection and no datetime arithmetic. One spare
+# year on each side lets evaluate_delta_t_seconds make the range decision, as before.
+DELTA_T_TABLE_FIRST_YEAR = int(DELTA_T_SEGMENTS[0].start_year) - 1
+DELTA_T_TABLE_LAST_YEAR = int(DELTA_T_SEGMENTS[-1].end_year) + 1
+_YEAR_START_POSIX_NS = array(
+    'q',
+    (
+        (date(year_value, 1, 1).toordinal() - UNIX_EPOCH_ORDINAL) * 86_400 * NANOSECONDS_PER_SECOND
+        for year_value in range(DELTA_T_TABLE_FIRST_YEAR, DELTA_T_TABLE_LAST_YEAR + 1)
+    ),
+)
+
+# Per-row outcomes of resolve_local_times; the status column holds indexes into LOCAL_TIME_STATUSES.
+LOCAL_TIME_OK = 'ok'
+LOCAL_TIME_NONEXISTENT = 'nonexistent'
+LOCAL_TIME_AMBIGUOUS = 'ambiguous'
+LOCAL_TIME_INVALID_INPUT = 'invalid_input'
+LOCAL_TIME_UNKNOWN_TIMEZONE = 'unknown_timezone'
+LOCAL_TIME_STATUSES = (
+    LOCAL_TIME_OK,
+    LOCAL_TIME_NONEXISTENT,
+    LOCAL_TIME_AMBIGUOUS,
+    LOCAL_TIME_INVALID_INPUT,
+    LOCAL_TIME_UNKNOWN_TIMEZONE,
+)
+_OK, _NONEXISTENT, _AMBIGUOUS, _INVALID_INPUT, _UNKNOWN_TIMEZONE = range(len(LOCAL_TIME_STATUSES))
+
+# What normalize_birth_input raises for one malformed BirthInput: ValueError from validation,
+# TypeError and AttributeError from wrong-typed fields (a None latitude, an int timestamp).
+BIRTH_INPUT_ERRORS = (ValueError, TypeError, AttributeError)
 
 
 class TimeResolutionError(ValueError):
@@ -47,6 +95,7 @@ class BirthInput:
 @dataclass(frozen=True)
 class NormalizedTimeInput:
     utc_datetime: datetime
+    utc_posix_ns: int
     civil_datetime_local: datetime | None
     timezone_name: str | None
     fold: int | None
@@ -56,13 +105,49 @@ class NormalizedTimeInput:
     tzdb_version: str
 
 
+@dataclass(frozen=True)
+class LocalTimeBatch:
+    # utc_posix_seconds is 0 wherever the status is not LOCAL_TIME_OK.
+    utc_posix_seconds: array
+    status: array
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def status_name(self, row: int) -> str:
+        return LOCAL_TIME_STATUSES[self.status[row]]
+
+    def utc_datetime(self, row: int) -> datetime | None:
+        if self.status[row] != _OK:
+            return None
+        return UNIX_EPOCH_UTC + timedelta(seconds=self.utc_posix_seconds[row])
+
+
 @dataclass(frozen=True)
 class TTConversionResult:
     tt_datetime: datetime
     tt_minus_utc_seconds: float
     delta_t_seconds: float
     conversion_method: str
-    leap_second_metadata: dict[str, str]
+    leap_second_metadata: Mapping[str, str]
+
+
+def posix_ns_from_datetime_utc(utc_datetime: datetime) -> int:
+    # Reads the wall fields as UTC, like julian_date_from_datetime_utc; exact integer arithmetic.
+    seconds = (
+        (utc_datetime.toordinal() - UNIX_EPOCH_ORDINAL) * 86_400
+        + utc_datetime.hour * 3600
+        + utc_datetime.minute * 60
+        + utc_datetime.second
+    )
+    return (seconds * 1_000_000 + utc_datetime.microsecond) * 1000
+
+
+def refresh_timezone_data() -> EngineMetadata:
+    # For tzdata upgraded in place: drop parsed zones and re-read the tzdb version.
+    ZoneInfo.clear_cache()
+    clear_timezone_index_cache()
+    return refresh_engine_metadata()
 
 
 def _parse_utc_timestamp(utc_timestamp: str) -> datetime:
@@ -85,33 +170,16 @@ def _resolve_local_time(
     timezone_name: str,
     fold: int | None,
 ) -> datetime:
-    try:
-        tz = ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError as exc:
-        raise ValueError('Unrecognized timezone identifier.') from exc
-
-    wall = datetime(year, month, day, hour, minute, second)
-    dt0 = wall.replace(tzinfo=tz, fold=0)
-    dt1 = wall.replace(tzinfo=tz, fold=1)
+    index = get_timezone_index(timezone_name)
+    wall_seconds = (datetime(year, month, day, hour, minute, second) - UNIX_EPOCH) // ONE_SECOND
+    candidates = index.utc_candidates(wall_seconds)
 
-    utc0 = dt0.astimezone(UTC)
-    utc1 = dt1.astimezone(UTC)
-
-    rt0 = utc0.astimezone(tz)
-    rt1 = utc1.astimezone(tz)
-
-    def _matches(roundtrip_dt: datetime, expected_fold: int) -> bool:
-        return roundtrip_dt.replace(tzinfo=None) == wall and roundtrip_dt.fold == expected_fold
-
-    m0 = _matches(rt0, 0)
-    m1 = _matches(rt1, 1)
-
-    if not m0 and not m1:
+    if not candidates:
         raise NonexistentTimeError(
             'This local time does not exist due to DST transition. Provide utc_timestamp directly.'
         )
 
-    if m0 and m1 and utc0 != utc1:
+    if len(candidates) > 1:
         if fold is None:
             raise AmbiguousTimeError(
                 'This local time is ambiguous due to DST fall-back. '
@@ -119,18 +187,81 @@ def _resolve_local_time(
             )
         if fold not in (0, 1):
             raise ValueError('fold must be 0 or 1.')
-        return utc0 if fold == 0 else utc1
-
-    if m0:
-        return utc0
-    if m1:
-        return utc1
-
-    raise TimeResolutionError('Internal error: could not resolve local time to UTC.')
-
-
-def normalize_birth_input(value: BirthInput) -> NormalizedTimeInput:
-    policy = EnginePolicy()
+        return UNIX_EPOCH_UTC + timedelta(seconds=candidates[fold])
+
+    return UNIX_EPOCH_UTC + timedelta(seconds=candidates[0])
+
+
+def _per_row(value, count: int, name: str) -> list:
+    if value is None or isinstance(value, (int, str)):
+        return [value] * count
+    if len(value) != count:
+        raise ValueError(f'{name} must be a scalar or have one value per row.')
+    return list(value)
+
+
+def resolve_local_times(
+    wall_times: Sequence[tuple[int, int, int, int, int, int]],
+    timezone_names: str | Sequence[str],
+    folds: int | None | Sequence[int | None] = None,
+) -> LocalTimeBatch:
+    # Rows are grouped by zone and sorted by wall time, so each zone's transitions are
+    # walked once; gaps, folds and bad rows become status codes instead of exceptions.
+    count = len(wall_times)
+    names = _per_row(timezone_names, count, 'timezone_names')
+    fold_values = _per_row(folds, count, 'folds')
+    utc_posix_seconds = array('q', bytes(8 * count))
+    status = array('B', bytes(count))
+
+    groups: dict[str, list[tuple[int, int]]] = {}
+    for row, (wall_time, name) in enumerate(zip(wall_times, names)):
+        # Wrong-typed fields (a str year, a float hour, a short tuple) are invalid rows too.
+        try:
+            year, month, day, hour, minute, second = wall_time
+            if not (
+                MIN_SUPPORTED_YEAR <= year <= MAX_SUPPORTED_YEAR
+                and 0 <= hour < 24
+                and 0 <= minute < 60
+                and 0 <= second < 60
+                and hour.__class__ is minute.__class__ is second.__class__ is int
+            ):
+                status[row] = _INVALID_INPUT
+                continue
+            ordinal = date(year, month, day).toordinal()
+        except (TypeError, ValueError):
+            status[row] = _INVALID_INPUT
+            continue
+        if name.__class__ is not str:
+            status[row] = _UNKNOWN_TIMEZONE
+            continue
+        wall_seconds = (ordinal - UNIX_EPOCH_ORDINAL) * 86_400 + hour * 3600 + minute * 60 + second
+        groups.setdefault(name, []).append((wall_seconds, row))
+
+    for name, rows in groups.items():
+        try:
+            index = get_timezone_index(name)
+        except ValueError:
+            for _, row in rows:
+                status[row] = _UNKNOWN_TIMEZONE
+            continue
+        rows.sort()
+        for (_, row), candidates in zip(rows, index.utc_candidates_sorted(wall for wall, _ in rows)):
+            if len(candidates) == 1:
+                utc_posix_seconds[row] = candidates[0]
+            elif not candidates:
+                status[row] = _NONEXISTENT
+            elif fold_values[row] is None:
+                status[row] = _AMBIGUOUS
+            elif fold_values[row] in (0, 1):
+                utc_posix_seconds[row] = candidates[fold_values[row]]
+            else:
+                status[row] = _INVALID_INPUT
+
+    return LocalTimeBatch(utc_posix_seconds=utc_posix_seconds, status=status)
+
+
+def _validate_location(value: BirthInput) -> bool:
+    # Returns the high-latitude warning.
     value.conventions.validate()
 
     if value.latitude < -90.0 or value.latitude > 90.0:
@@ -138,14 +269,20 @@ def normalize_birth_input(value: BirthInput) -> NormalizedTimeInput:
     if value.longitude < -180.0 or value.longitude > 180.0:
         raise ValueError('Invalid longitude.')
 
-    high_latitude_warning = value.latitude > 66.0 or value.latitude < -66.0
-    tzdb_version = get_tzdb_version()
+    return value.latitude > 66.0 or value.latitude < -66.0
+
+
+def normalize_birth_input(value: BirthInput) -> NormalizedTimeInput:
+    policy = EnginePolicy()
+    high_latitude_warning = _validate_location(value)
+    tzdb_version = get_engine_metadata().tzdb_version
 
     if value.utc_timestamp:
         utc_datetime = _parse_utc_timestamp(value.utc_timestamp)
         policy.validate_year(utc_datetime.year)
         return NormalizedTimeInput(
             utc_datetime=utc_datetime,
+            utc_posix_ns=posix_ns_from_datetime_utc(utc_datetime),
             civil_datetime_local=None,
             timezone_name=None,
             fold=None,
@@ -191,6 +328,7 @@ def normalize_birth_input(value: BirthInput) -> NormalizedTimeInput:
 
     return NormalizedTimeInput(
         utc_datetime=utc_datetime,
+        utc_posix_ns=posix_ns_from_datetime_utc(utc_datetime),
         civil_datetime_local=civil_datetime_local,
         timezone_name=value.timezone_name,
         fold=value.fold,
@@ -201,6 +339,54 @@ def normalize_birth_input(value: BirthInput) -> NormalizedTimeInput:
     )
 
 
+def normalize_birth_inputs(values: Sequence[BirthInput]) -> list[NormalizedTimeInput | Exception]:
+    # normalize_birth_input for many rows, in input order. Local-time rows are resolved by one
+    # resolve_local_times call, so each zone's transitions are walked once for the batch. A row
+    # it does not resolve goes through normalize_birth_input, so a rejected row carries exactly
+    # the exception (one of BIRTH_INPUT_ERRORS) that normalize_birth_input raises for it.
+    results: list[NormalizedTimeInput | Exception | None] = [None] * len(values)
+    local_rows = []
+    wall_times = []
+    for row, value in enumerate(values):
+        if value.utc_timestamp or value.timezone_name is None:
+            try:
+                results[row] = normalize_birth_input(value)
+            except BIRTH_INPUT_ERRORS as exc:
+                results[row] = exc
+        else:
+            local_rows.append(row)
+            wall_times.append((value.year, value.month, value.day, value.hour, value.minute, value.second))
+
+    batch = resolve_local_times(
+        wall_times,
+        [values[row].timezone_name for row in local_rows],
+        [values[row].fold for row in local_rows],
+    )
+    tzdb_version = get_engine_metadata().tzdb_version
+    for batch_row, row in enumerate(local_rows):
+        value = values[row]
+        try:
+            if batch.status[batch_row] != _OK:
+                results[row] = normalize_birth_input(value)
+                continue
+            high_latitude_warning = _validate_location(value)
+            utc_posix_seconds = batch.utc_posix_seconds[batch_row]
+            results[row] = NormalizedTimeInput(
+                utc_datetime=UNIX_EPOCH_UTC + timedelta(seconds=utc_posix_seconds),
+                utc_posix_ns=utc_posix_seconds * NANOSECONDS_PER_SECOND,
+                civil_datetime_local=datetime(value.year, value.month, value.day, value.hour, value.minute, value.second),
+                timezone_name=value.timezone_name,
+                fold=value.fold,
+                longitude=value.longitude,
+                latitude=value.latitude,
+                high_latitude_warning=high_latitude_warning,
+                tzdb_version=tzdb_version,
+            )
+        except BIRTH_INPUT_ERRORS as exc:
+            results[row] = exc
+    return results
+
+
 def decimal_year(utc_datetime: datetime) -> float:
     if utc_datetime.tzinfo is None:
         raise ValueError('utc_datetime must be timezone-aware UTC.')
@@ -213,31 +399,40 @@ def decimal_year(utc_datetime: datetime) -> float:
     return year_value + elapsed_seconds / total_seconds
 
 
-def convert_utc_to_tt(utc_datetime: datetime) -> TTConversionResult:
+def decimal_year_from_posix_ns(posix_ns: int) -> float:
+    # Same arithmetic as decimal_year, so the result is bit-identical for microsecond inputs.
+    index = bisect_right(_YEAR_START_POSIX_NS, posix_ns) - 1
+    if not 0 <= index < len(_YEAR_START_POSIX_NS) - 1:
+        raise ValueError('Decimal year outside supported delta-T segments.')
+    year_start = _YEAR_START_POSIX_NS[index]
+    elapsed_seconds = (posix_ns - year_start) / NANOSECONDS_PER_SECOND
+    total_seconds = (_YEAR_START_POSIX_NS[index + 1] - year_start) // NANOSECONDS_PER_SECOND
+    return (DELTA_T_TABLE_FIRST_YEAR + index) + elapsed_seconds / total_seconds
+
+
+def tt_minus_utc_from_posix_ns(posix_ns: int) -> tuple[float, str]:
+    if posix_ns >= LEAP_SECOND_ERA_START_POSIX_NS:
+        tai_minus_utc = float(leap_second_offset_for_posix_seconds(posix_ns // NANOSECONDS_PER_SECOND))
+        return tai_minus_utc + TT_MINUS_TAI_SECONDS, TT_CONVERSION_LEAP_SECONDS
+    return evaluate_delta_t_seconds(decimal_year_from_posix_ns(posix_ns)), TT_CONVERSION_DELTA_T
+
+
+def tt_minus_utc_seconds_for_posix_ns(posix_ns_values: Iterable[int]) -> array:
+    return array('d', (tt_minus_utc_from_posix_ns(posix_ns)[0] for posix_ns in posix_ns_values))
+
+
+def convert_utc_to_tt(utc_datetime: datetime, utc_posix_ns: int | None = None) -> TTConversionResult:
     if utc_datetime.tzinfo is None:
         raise ValueError('utc_datetime must be timezone-aware UTC.')
     normalized_utc = utc_datetime.astimezone(UTC)
-    threshold = datetime(1972, 1, 1, tzinfo=UTC)
-
-    if normalized_utc >= threshold:
-        tai_minus_utc = float(get_leap_second_offset_seconds(normalized_utc))
-        tt_minus_utc = tai_minus_utc + 32.184
-        tt_datetime = normalized_utc.replace(tzinfo=None) + timedelta(seconds=tt_minus_utc)
-        return TTConversionResult(
-            tt_datetime=tt_datetime,
-            tt_minus_utc_seconds=tt_minus_utc,
-            delta_t_seconds=tt_minus_utc,
-            conversion_method='leap_seconds',
-            leap_second_metadata=LEAP_SECOND_METADATA,
-        )
-
-    decimal_year_value = decimal_year(normalized_utc)
-    delta_t_seconds = evaluate_delta_t_seconds(decimal_year_value)
-    tt_datetime = normalized_utc.replace(tzinfo=None) + timedelta(seconds=delta_t_seconds)
+    if utc_posix_ns is None:
+        utc_posix_ns = posix_ns_from_datetime_utc(normalized_utc)
+    # Before 1972 delta-T is the whole TT-UTC difference; afterwards TAI-UTC is exact.
+    tt_minus_utc, conversion_method = tt_minus_utc_from_posix_ns(utc_posix_ns)
     return TTConversionResult(
-        tt_datetime=tt_datetime,
-        tt_minus_utc_seconds=delta_t_seconds,
-        delta_t_seconds=delta_t_seconds,
-        conversion_method='delta_t',
-        leap_second_metadata=LEAP_SECOND_METADATA,
+        tt_datetime=normalized_utc.replace(tzinfo=None) + timedelta(seconds=tt_minus_utc),
+        tt_minus_utc_seconds=tt_minus_utc,
+        delta_t_seconds=tt_minus_utc,
+        conversion_method=conversion_method,
+        leap_second_metadata=get_engine_metadata().leap_second_table,
     )
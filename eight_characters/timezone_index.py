@@ -0,0 +1,241 @@
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_right
+from calendar import isleap, monthrange
+from dataclasses import dataclass
+from datetime import date
+from importlib import resources
+from typing import BinaryIO, Iterable, Iterator
+from zoneinfo import TZPATH, ZoneInfo, ZoneInfoNotFoundError
+
+from eight_characters.caching import BoundedLRUCache, CacheStats
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+
+
+TIMEZONE_INDEX_CACHE_MAX_SIZE = 1024
+# Footer (POSIX TZ string) rules are expanded into explicit transitions through this year.
+TIMEZONE_INDEX_LAST_YEAR = MAX_SUPPORTED_YEAR + 1
+
+UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+SECONDS_PER_DAY = 86_400
+DEFAULT_RULE_SECONDS = 2 * 3600
+
+TZIF_MAGIC = b'TZif'
+TZIF_HEADER = struct.Struct('>4s1s15x6l')
+
+TZ_STRING_PATTERN = re.compile(
+    r'(?P<std><[A-Za-z0-9+-]+>|[^<0-9:.+-]+)'
+    r'(?:(?P<stdoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)'
+    r'(?:(?P<dst><[A-Za-z0-9+-]+>|[^<0-9:.+-]+)(?P<dstoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)?)?)?',
+    re.ASCII,
+)
+TZ_CLOCK_PATTERN = re.compile(r'(?P<sign>[+-])?(?P<h>\d{1,3})(?::(?P<m>\d{2})(?::(?P<s>\d{2}))?)?', re.ASCII)
+TZ_MONTH_RULE_PATTERN = re.compile(r'M(\d{1,2})\.(\d)\.(\d)', re.ASCII)
+
+
+class TimezoneDataError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TimezoneIndex:
+    # offsets[i] is the UTC offset in force from transitions_utc[i - 1] up to transitions_utc[i];
+    # wall_starts[i] is the earliest wall-clock second whose meaning transition i changes.
+    key: str
+    transitions_utc: array
+    offsets: array
+    wall_starts: array
+
+    def utc_candidates(self, wall_seconds: int) -> tuple[int, ...]:
+        return self._period_candidates(bisect_right(self.wall_starts, wall_seconds), wall_seconds)
+
+    def utc_candidates_sorted(self, wall_seconds_values: Iterable[int]) -> Iterator[tuple[int, ...]]:
+        # utc_candidates for ascending wall times: the transition cursor only moves forward.
+        wall_starts = self.wall_starts
+        transition_count = len(wall_starts)
+        index = 0
+        for wall_seconds in wall_seconds_values:
+            while index < transition_count and wall_starts[index] <= wall_seconds:
+                index += 1
+            yield self._period_candidates(index, wall_seconds)
+
+    def _period_candidates(self, index: int, wall_seconds: int) -> tuple[int, ...]:
+        # UTC seconds that display as this wall-clock second, ascending: none in a gap, two
+        # in a fold. Only the periods either side of the last transition at or before the
+        # wall time can contain it, and both only when that transition sets clocks back.
+        transitions_utc = self.transitions_utc
+        offsets = self.offsets
+        candidates = []
+        for period in (index - 1, index) if index else (index,):
+            utc_seconds = wall_seconds - offsets[period]
+            if period and utc_seconds < transitions_utc[period - 1]:
+                continue
+            if period < len(transitions_utc) and utc_seconds >= transitions_utc[period]:
+                continue
+            candidates.append(utc_seconds)
+        return tuple(candidates)
+
+    def utc_offset_seconds(self, utc_seconds: int) -> int:
+        return self.offsets[bisect_right(self.transitions_utc, utc_seconds)]
+
+
+def _clock_seconds(value: str, max_hours: int) -> int:
+    match = TZ_CLOCK_PATTERN.fullmatch(value)
+    if match is None or int(match.group('h')) > max_hours:
+        raise TimezoneDataError(f'Invalid TZ string time: {value}')
+    total = int(match.group('h')) * 3600 + int(match.group('m') or 0) * 60 + int(match.group('s') or 0)
+    return -total if match.group('sign') == '-' else total
+
+
+def _rule_day_seconds(rule: str) -> tuple[str, tuple[int, ...], int]:
+    day_rule, _, clock = rule.partition('/')
+    seconds = _clock_seconds(clock, 167) if clock else DEFAULT_RULE_SECONDS
+    if day_rule.startswith('M'):
+        match = TZ_MONTH_RULE_PATTERN.fullmatch(day_rule)
+        if match is None:
+            raise TimezoneDataError(f'Invalid TZ string rule: {rule}')
+        return 'M', tuple(int(part) for part in match.groups()), seconds
+    if day_rule.startswith('J'):
+        return 'J', (int(day_rule[1:]),), seconds
+    return 'N', (int(day_rule),), seconds
+
+
+def _rule_wall_seconds(rule: tuple[str, tuple[int, ...], int], year: int) -> int:
+    # Seconds since the epoch on the wall clock in force just before the rule fires.
+    kind, fields, seconds = rule
+    if kind == 'M':
+        month, week, weekday = fields
+        first_weekday, days_in_month = monthrange(year, month)
+        day = (weekday - (first_weekday + 1)) % 7 + 1 + (week - 1) * 7
+        if day > days_in_month:
+            day -= 7
+        ordinal = date(year, month, day).toordinal()
+    elif kind == 'J':
+        # Julian day 1..365 never counts February 29.
+        day_of_year = fields[0]
+        ordinal = date(year, 1, 1).toordinal() + day_of_year - 1 + (isleap(year) and day_of_year >= 60)
+    else:
+        ordinal = date(year, 1, 1).toordinal() + fields[0]
+    return (ordinal - UNIX_EPOCH_ORDINAL) * SECONDS_PER_DAY + seconds
+
+
+def _footer_transitions(tz_string: str, after_utc: int | None, last_year: int) -> list[tuple[int, int]]:
+    offset_part, _, rules_part = tz_string.partition(',')
+    match = TZ_STRING_PATTERN.fullmatch(offset_part)
+    if match is None:
+        raise TimezoneDataError(f'Invalid TZ string: {tz_string}')
+    # POSIX offsets are west-positive.
+    std_offset = -_clock_seconds(match.group('stdoff'), 24) if match.group('stdoff') else 0
+    if match.group('dst') is None:
+        return [] if after_utc is not None else [(-(2 ** 63), std_offset)]
+    dst_offset = -_clock_seconds(match.group('dstoff'), 24) if match.group('dstoff') else std_offset + 3600
+    start_rule, _, end_rule = rules_part.partition(',')
+    if not end_rule:
+        raise TimezoneDataError(f'TZ string is missing a transition rule: {tz_string}')
+    start = _rule_day_seconds(start_rule)
+    end = _rule_day_seconds(end_rule)
+
+    first_year = MIN_SUPPORTED_YEAR - 1 if after_utc is None else date.fromordinal(
+        UNIX_EPOCH_ORDINAL + after_utc // SECONDS_PER_DAY
+    ).year
+    events = []
+    for year in range(first_year, last_year + 1):
+        # Daylight time starts by the standard clock and ends by the daylight clock.
+        events.append((_rule_wall_seconds(start, year) - std_offset, dst_offset))
+        events.append((_rule_wall_seconds(end, year) - dst_offset, std_offset))
+    events.sort()
+    return [event for event in events if after_utc is None or event[0] > after_utc]
+
+
+def _read_tzif(stream: BinaryIO) -> tuple[list[int], list[int], list[int], list[int], str]:
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = TZIF_HEADER.unpack(
+        stream.read(TZIF_HEADER.size)
+    )
+    if magic != TZIF_MAGIC:
+        raise TimezoneDataError('Not a TZif file.')
+    time_size, time_format = 4, 'l'
+    if version != b'\x00':
+        # Version 2+ repeats the data with 64-bit times after the version 1 block.
+        stream.seek(timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt, os.SEEK_CUR)
+        magic, _, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = TZIF_HEADER.unpack(
+            stream.read(TZIF_HEADER.size)
+        )
+        time_size, time_format = 8, 'q'
+    transitions = list(struct.unpack(f'>{timecnt}{time_format}', stream.read(timecnt * time_size)))
+    type_indexes = list(stream.read(timecnt))
+    utc_offsets = []
+    is_dst = []
+    for _ in range(typecnt):
+        utc_offset, dst_flag, _abbreviation = struct.unpack('>lbB', stream.read(6))
+        utc_offsets.append(utc_offset)
+        is_dst.append(dst_flag)
+    tz_string = ''
+    if time_size == 8:
+        stream.seek(charcnt + leapcnt * 12 + isstdcnt + isutcnt, os.SEEK_CUR)
+        tz_string = stream.read().strip(b'\n').split(b'\n', 1)[0].decode('ascii')
+    return transitions, type_indexes, utc_offsets, is_dst, tz_string
+
+
+def _open_tzif(key: str) -> BinaryIO:
+    # Same search order as zoneinfo: TZPATH first, then the tzdata package.
+    for root in TZPATH:
+        candidate = os.path.join(root, key)
+        if os.path.isfile(candidate):
+            return open(candidate, 'rb')
+    components = key.split('/')
+    try:
+        return resources.files('.'.join(['tzdata.zoneinfo', *components[:-1]])).joinpath(components[-1]).open('rb')
+    except (ImportError, FileNotFoundError, UnicodeEncodeError) as exc:
+        raise ZoneInfoNotFoundError(f'No time zone found with key {key}') from exc
+
+
+def build_timezone_index(key: str, stream: BinaryIO, last_year: int = TIMEZONE_INDEX_LAST_YEAR) -> TimezoneIndex:
+    transitions, type_indexes, utc_offsets, is_dst, tz_string = _read_tzif(stream)
+    if not utc_offsets:
+        raise TimezoneDataError(f'{key}: TZif file has no local time types.')
+    # Before the first transition zoneinfo uses the first standard-time type.
+    before_offset = next((offset for offset, dst in zip(utc_offsets, is_dst) if not dst), utc_offsets[0])
+    offsets = [before_offset] + [utc_offsets[index] for index in type_indexes]
+    if tz_string:
+        footer = _footer_transitions(tz_string, transitions[-1] if transitions else None, last_year)
+        if footer and footer[0][0] == -(2 ** 63):
+            offsets[-1] = footer[0][1]
+        else:
+            transitions.extend(event[0] for event in footer)
+            offsets.extend(event[1] for event in footer)
+    wall_starts = [
+        transition + min(offsets[index], offsets[index + 1]) for index, transition in enumerate(transitions)
+    ]
+    return TimezoneIndex(
+        key=key,
+        transitions_utc=array('q', transitions),
+        offsets=array('q', offsets),
+        wall_starts=array('q', wall_starts),
+    )
+
+
+def _load_timezone_index(key: str) -> TimezoneIndex:
+    try:
+        # Validates the key exactly as the rest of the engine does.
+        ZoneInfo(key)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise ValueError('Unrecognized timezone identifier.') from exc
+    with _open_tzif(key) as stream:
+        return build_timezone_index(key, stream)
+
+
+_TIMEZONE_INDEX_CACHE: BoundedLRUCache[TimezoneIndex] = BoundedLRUCache(TIMEZONE_INDEX_CACHE_MAX_SIZE)
+
+
+def get_timezone_index(key: str) -> TimezoneIndex:
+    return _TIMEZONE_INDEX_CACHE.get_or_compute(key, lambda: _load_timezone_index(key))
+
+
+def timezone_index_cache_stats() -> CacheStats:
+    return _TIMEZONE_INDEX_CACHE.stats()
+
+
+def clear_timezone_index_cache() -> None:
+    _TIMEZONE_INDEX_CACHE.clear()
@@ -1,98 +1,258 @@
+import sys
+from array import array
 from dataclasses import dataclass
-from math import cos, pi
+from functools import lru_cache
+from math import cos, pi, sin
+from pathlib import Path
+from typing import Sequence
+
+from eight_characters.packed_data import (
+    PackedDataError,
+    map_packed_file,
+    read_packed_payload_sha256,
+    write_packed_file,
+)
 
 
 DEG_PER_RAD = 180.0 / pi
 
+VSOP87D_EARTH_KIND = 'vsop87d_earth'
+VSOP87D_EARTH_FORMAT_VERSION = 1
+VSOP87D_EARTH_PATH = Path(__file__).resolve().parent / 'tables' / 'vsop87d_earth.bin'
+VSOP_VARIABLES = ('L', 'B', 'R')
+VSOP_TERM_WIDTH = 3
+ARCSECONDS_PER_RAD = 648000.0 / pi
+
+PRECISION_FAST = 'fast'
+PRECISION_STANDARD = 'standard'
+PRECISION_REFERENCE = 'reference'
+ALLOWED_PRECISION_TIERS = (PRECISION_FAST, PRECISION_STANDARD, PRECISION_REFERENCE)
+
+# Truncation bounds hold for |tau| up to 0.11 millennia, i.e. 1890-2110.
+TRUNCATION_TAU_LIMIT = 0.11
+
+# Per power of tau: a flat float64 run of (amplitude, phase, frequency) triples.
+SeriesCoefficients = tuple[Sequence[float], ...]
+
 
 @dataclass(frozen=True)
-class VsopTerm:
-    amplitude: float
-    phase: float
-    frequency: float
-
-
-# Seed subset organized in VSOP87D form. The evaluator is full-series capable.
-# Coefficient expansion to full published table is a data-pack task.
-L_SERIES: tuple[tuple[VsopTerm, ...], ...] = (
-    (
-        VsopTerm(1.75347045673, 0.0, 0.0),
-        VsopTerm(0.03341656456, 4.66925680417, 6283.0758499914),
-        VsopTerm(0.00034894275, 4.62610241759, 12566.1516999828),
-        VsopTerm(0.00003417571, 2.82886579606, 3.523118349),
-        VsopTerm(0.00003497056, 2.74411800971, 5753.3848848968),
-        VsopTerm(0.00003135899, 3.62767041756, 77713.7714681205),
-    ),
-    (
-        VsopTerm(6283.31966747491, 0.0, 0.0),
-        VsopTerm(0.00206058863, 2.67823455584, 6283.0758499914),
-        VsopTerm(0.0000430343, 2.63512650414, 12566.1516999828),
-        VsopTerm(0.00000425264, 1.59046980729, 3.523118349),
-    ),
-    (
-        VsopTerm(0.0005291887, 0.0, 0.0),
-        VsopTerm(0.00008719837, 1.07209665242, 6283.0758499914),
-        VsopTerm(0.00000309125, 0.86728818832, 12566.1516999828),
-    ),
-    (
-        VsopTerm(0.00000289226, 5.84384198723, 6283.0758499914),
-        VsopTerm(0.00000034955, 0.0, 0.0),
-    ),
-    (
-        VsopTerm(0.00000114084, 3.14159265359, 0.0),
-    ),
-    (
-        VsopTerm(0.00000000878, 3.14159265359, 0.0),
-    ),
-)
+class EarthSeries:
+    longitude: SeriesCoefficients
+    latitude: SeriesCoefficients
+    radius: SeriesCoefficients
 
-B_SERIES: tuple[tuple[VsopTerm, ...], ...] = (
-    (
-        VsopTerm(0.0000027962, 3.19870156017, 84334.6615813083),
-        VsopTerm(0.00000101643, 5.42248619256, 5507.5532386674),
-        VsopTerm(0.00000080445, 3.88013204458, 5223.6939198022),
-    ),
-    (
-        VsopTerm(0.0000000903, 3.8972906189, 5507.5532386674),
-        VsopTerm(0.00000006177, 1.73038850355, 5223.6939198022),
-    ),
-)
+    def term_counts(self) -> dict[str, list[int]]:
+        return {
+            variable: [len(coefficients) // VSOP_TERM_WIDTH for coefficients in series]
+            for variable, series in zip(VSOP_VARIABLES, (self.longitude, self.latitude, self.radius))
+        }
+
+
+def write_earth_series(
+    target_file: str | Path,
+    series_by_variable: dict[str, list[list[tuple[float, float, float]]]],
+    source: str,
+) -> None:
+    values = array('d')
+    term_counts: dict[str, list[int]] = {}
+    for variable in VSOP_VARIABLES:
+        term_counts[variable] = []
+        for terms in series_by_variable[variable]:
+            term_counts[variable].append(len(terms))
+            for term in terms:
+                values.extend(term)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    write_packed_file(
+        target_file,
+        kind=VSOP87D_EARTH_KIND,
+        format_version=VSOP87D_EARTH_FORMAT_VERSION,
+        metadata={
+            'byte_order': 'little',
+            'layout': 'amplitude_phase_frequency_float64',
+            'ordering': 'amplitude_desc',
+            'source': source,
+            'term_counts': term_counts,
+            'time_argument': 'julian_millennia_tdb_from_j2000',
+        },
+        payload=values.tobytes(),
+    )
 
-R_SERIES: tuple[tuple[VsopTerm, ...], ...] = (
-    (
-        VsopTerm(1.00013988799, 0.0, 0.0),
-        VsopTerm(0.01670699626, 3.09846350771, 6283.0758499914),
-        VsopTerm(0.00013956024, 3.0552460962, 12566.1516999828),
-        VsopTerm(0.0000308372, 5.19846674381, 77713.7714681205),
-    ),
-    (
-        VsopTerm(0.00103018608, 1.10748968172, 6283.0758499914),
-        VsopTerm(0.00001721238, 1.06442301418, 12566.1516999828),
-    ),
-    (
-        VsopTerm(0.00004359385, 5.78455133738, 6283.0758499914),
-    ),
-)
+
+def load_earth_series(source_file: str | Path) -> EarthSeries:
+    packed = map_packed_file(
+        source_file,
+        expected_kind=VSOP87D_EARTH_KIND,
+        expected_format_version=VSOP87D_EARTH_FORMAT_VERSION,
+    )
+    term_counts = packed.metadata['term_counts']
+    if sorted(term_counts) != sorted(VSOP_VARIABLES):
+        raise PackedDataError('VSOP87D data pack must contain the L, B and R variables.')
+
+    if sys.byteorder == 'little':
+        values: Sequence[float] = packed.payload.cast('d')
+    else:
+        swapped = array('d', bytes(packed.payload))
+        swapped.byteswap()
+        values = memoryview(swapped)
+
+    expected_length = VSOP_TERM_WIDTH * sum(sum(counts) for counts in term_counts.values())
+    if len(values) != expected_length:
+        raise PackedDataError('VSOP87D payload length does not match its term counts.')
+
+    offset = 0
+    series: list[SeriesCoefficients] = []
+    for variable in VSOP_VARIABLES:
+        powers = []
+        for count in term_counts[variable]:
+            end = offset + VSOP_TERM_WIDTH * count
+            powers.append(values[offset:end])
+            offset = end
+        series.append(tuple(powers))
+    return EarthSeries(longitude=series[0], latitude=series[1], radius=series[2])
+
+
+@dataclass(frozen=True)
+class PrecisionTier:
+    name: str
+    max_angle_error_arcseconds: float
+    max_radius_error_au: float
+
+
+PRECISION_TIERS = {
+    PRECISION_FAST: PrecisionTier(PRECISION_FAST, 1.0, 1e-5),
+    PRECISION_STANDARD: PrecisionTier(PRECISION_STANDARD, 0.1, 1e-6),
+    PRECISION_REFERENCE: PrecisionTier(PRECISION_REFERENCE, 0.0, 0.0),
+}
+
+
+@dataclass(frozen=True)
+class TruncationBounds:
+    longitude_arcseconds: float
+    latitude_arcseconds: float
+    radius_au: float
+
+
+@lru_cache(maxsize=1)
+def _full_earth_series() -> EarthSeries:
+    return load_earth_series(VSOP87D_EARTH_PATH)
+
+
+@lru_cache(maxsize=1)
+def earth_series_sha256() -> str:
+    return read_packed_payload_sha256(VSOP87D_EARTH_PATH)
+
+
+def _precision_tier(precision: str) -> PrecisionTier:
+    if precision not in PRECISION_TIERS:
+        raise ValueError('Invalid precision tier.')
+    return PRECISION_TIERS[precision]
+
+
+def _truncate_series(series: SeriesCoefficients, budget: float) -> tuple[SeriesCoefficients, float]:
+    # Blocks are amplitude-sorted, so dropping the globally smallest |A| * tau_max**p terms
+    # always removes a suffix of each block; the dropped sum bounds the truncation error.
+    candidates = sorted(
+        (abs(coefficients[index]) * TRUNCATION_TAU_LIMIT ** power, power, -index)
+        for power, coefficients in enumerate(series)
+        for index in range(0, len(coefficients), VSOP_TERM_WIDTH)
+    )
+    keep = [len(coefficients) for coefficients in series]
+    dropped = 0.0
+    for contribution, power, negative_index in candidates:
+        if dropped + contribution > budget:
+            break
+        dropped += contribution
+        keep[power] = min(keep[power], -negative_index)
+    return tuple(coefficients[:length] for coefficients, length in zip(series, keep)), dropped
+
+
+@lru_cache(maxsize=len(ALLOWED_PRECISION_TIERS))
+def _truncated_earth_series(precision: str) -> tuple[EarthSeries, TruncationBounds]:
+    tier = _precision_tier(precision)
+    full = _full_earth_series()
+    if precision == PRECISION_REFERENCE:
+        return full, TruncationBounds(0.0, 0.0, 0.0)
+
+    angle_budget_rad = tier.max_angle_error_arcseconds / ARCSECONDS_PER_RAD
+    longitude, longitude_bound = _truncate_series(full.longitude, angle_budget_rad)
+    latitude, latitude_bound = _truncate_series(full.latitude, angle_budget_rad)
+    radius, radius_bound = _truncate_series(full.radius, tier.max_radius_error_au)
+    return (
+        EarthSeries(longitude=longitude, latitude=latitude, radius=radius),
+        TruncationBounds(
+            longitude_arcseconds=longitude_bound * ARCSECONDS_PER_RAD,
+            latitude_arcseconds=latitude_bound * ARCSECONDS_PER_RAD,
+            radius_au=radius_bound,
+        ),
+    )
+
+
+def get_earth_series(precision: str = PRECISION_REFERENCE) -> EarthSeries:
+    return _truncated_earth_series(precision)[0]
+
+
+def truncation_error_bounds(precision: str) -> TruncationBounds:
+    return _truncated_earth_series(precision)[1]
 
 
 def normalize_degrees(value: float) -> float:
     return value % 360.0
 
 
-def _evaluate_series(series: tuple[tuple[VsopTerm, ...], ...], tau: float) -> float:
+def _evaluate_series(series: SeriesCoefficients, tau: float) -> float:
     total = 0.0
-    for power, terms in enumerate(series):
+    for power, coefficients in enumerate(series):
         partial = 0.0
-        for term in terms:
-            partial += term.amplitude * cos(term.phase + term.frequency * tau)
+        values = iter(coefficients)
+        for amplitude, phase, frequency in zip(values, values, values):
+            partial += amplitude * cos(phase + frequency * tau)
         total += partial * (tau ** power)
     return total
 
 
-def earth_heliocentric_lbr(tau: float) -> tuple[float, float, float]:
-    l_rad = _evaluate_series(L_SERIES, tau)
-    b_rad = _evaluate_series(B_SERIES, tau)
-    r_au = _evaluate_series(R_SERIES, tau)
+def _evaluate_series_with_derivatives(series: SeriesCoefficients, tau: float) -> tuple[float, float, float]:
+    # Term-by-term derivatives of tau**p * A * cos(B + C * tau) with respect to tau.
+    total = 0.0
+    first = 0.0
+    second = 0.0
+    for power, coefficients in enumerate(series):
+        s0 = 0.0
+        s1 = 0.0
+        s2 = 0.0
+        values = iter(coefficients)
+        for amplitude, phase, frequency in zip(values, values, values):
+            argument = phase + frequency * tau
+            cos_value = amplitude * cos(argument)
+            s0 += cos_value
+            s1 += amplitude * frequency * sin(argument)
+            s2 += cos_value * frequency * frequency
+        tau_p = tau ** power
+        total += s0 * tau_p
+        first -= s1 * tau_p
+        second -= s2 * tau_p
+        if power >= 1:
+            tau_p1 = tau ** (power - 1)
+            first += power * s0 * tau_p1
+            second -= 2.0 * power * s1 * tau_p1
+        if power >= 2:
+            second += power * (power - 1) * s0 * tau ** (power - 2)
+    return total, first, second
+
+
+def earth_heliocentric_longitude_rates_and_radius(tau: float) -> tuple[float, float, float, float]:
+    # (L, dL/dtau, d2L/dtau2, R) from one pass over the L terms and one over the R terms;
+    # the B series is not evaluated.
+    earth = get_earth_series()
+    l_rad, dl_dtau, d2l_dtau2 = _evaluate_series_with_derivatives(earth.longitude, tau)
+    return l_rad, dl_dtau, d2l_dtau2, _evaluate_series(earth.radius, tau)
+
+
+def earth_heliocentric_lbr(tau: float, precision: str = PRECISION_REFERENCE) -> tuple[float, float, float]:
+    series = get_earth_series(precision)
+    l_rad = _evaluate_series(series.longitude, tau)
+    b_rad = _evaluate_series(series.latitude, tau)
+    r_au = _evaluate_series(series.radius, tau)
 
     l_deg = normalize_degrees(l_rad * DEG_PER_RAD)
     b_deg = b_rad * DEG_PER_RAD
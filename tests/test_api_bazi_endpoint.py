@@ -32,6 +32,26 @@ class TestApiBaziEndpoint(unittest.TestCase):
         self.assertEqual(pillars['day']['stem']['chinese'] + pillars['day']['branch']['chinese'], '己丑')
         self.assertEqual(pillars['hour']['stem']['chinese'] + pillars['hour']['branch']['chinese'], '壬申')
 
+    def test_sections_query_limits_response(self) -> None:
+        body = {
+            'date': '1988-02-04',
+            'time': '16:30:00',
+            'location': {'timezone': 'Asia/Shanghai', 'longitude': 104.066, 'latitude': 30.658},
+        }
+        full = self.client.post('/api/bazi', json=body).json()
+        self.assertEqual(set(full), {'solar_time', 'four_pillars', 'flags', 'engine'})
+        response = self.client.post('/api/bazi', params={'sections': 'four_pillars'}, json=body)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'four_pillars': full['four_pillars']})
+        response = self.client.post('/api/bazi', params={'sections': 'four_pillars,solar_time,engine'}, json=body)
+        self.assertEqual(response.json(), {key: full[key] for key in ('four_pillars', 'solar_time', 'engine')})
+        for aliases in ('pillars,intermediate', 'pillars,solar_time'):
+            response = self.client.post('/api/bazi', params={'sections': aliases}, json=body)
+            self.assertEqual(set(response.json()), {'four_pillars', 'solar_time'})
+        for invalid in ('meta', 'four_pillars,chart', ','):
+            response = self.client.post('/api/bazi', params={'sections': invalid}, json=body)
+            self.assertEqual(response.status_code, 400, invalid)
+
     def test_zi_convention_changes_day_hour_at_23(self) -> None:
         base_request = {
             'date': '2024-06-01',
@@ -0,0 +1,41 @@
+import json
+import unittest
+
+from fastapi.testclient import TestClient
+
+from eight_characters.main import app
+
+
+class TestApiCalendarDaysEndpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = TestClient(app)
+
+    def test_streams_one_line_per_day(self) -> None:
+        response = self.client.get('/api/calendar/days', params={'start': '1988-02-01', 'end': '1989-02-10'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['content-type'].startswith('application/x-ndjson'))
+        lines = response.text.splitlines()
+        self.assertEqual(len(lines), 376)
+        rows = [json.loads(line) for line in lines]
+        for line, row in zip(lines, rows):
+            self.assertEqual(line, json.dumps(row, ensure_ascii=False, sort_keys=True, separators=(',', ':')))
+        canonical = rows[3]
+        self.assertEqual(canonical['date'], '1988-02-04')
+        self.assertEqual(canonical['jdn'], 2447196)
+        self.assertEqual(canonical['cycle_index'], 25)
+        self.assertEqual(canonical['stem']['chinese'] + canonical['branch']['chinese'], '己丑')
+        self.assertEqual(rows[-1]['date'], '1989-02-10')
+
+    def test_invalid_input_returns_400(self) -> None:
+        for params in (
+            {'start': '1988-02-10', 'end': '1988-02-01'},
+            {'start': '1988/02/01', 'end': '1988-02-10'},
+            {'start': '2100-12-01', 'end': '2101-01-01'},
+        ):
+            response = self.client.get('/api/calendar/days', params=params)
+            self.assertEqual(response.status_code, 400, params)
+
+
+if __name__ == '__main__':
+    unittest.main()
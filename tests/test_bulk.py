@@ -0,0 +1,310 @@
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from eight_characters.bulk import (
+    _record_lines,
+    compute_engine_json_lines,
+    main,
+    merge_shard_outputs,
+    parse_shard,
+    read_checkpoint,
+    read_records,
+    run_bulk,
+    run_pipeline,
+    shard_hash,
+)
+from eight_characters.engine import compute_engine_payload
+from eight_characters.output import dumps_deterministic
+from eight_characters.time_convert import BirthInput
+
+
+def _births() -> list[BirthInput]:
+    births = []
+    for index in range(40):
+        births.append(
+            BirthInput(
+                year=2090 - index * 3,
+                month=index % 12 + 1,
+                day=index % 28 + 1,
+                hour=index % 24,
+                minute=index,
+                second=0,
+                timezone_name=('Asia/Shanghai', 'Europe/Helsinki', 'America/New_York')[index % 3],
+                longitude=(116.4074, 24.9384, -74.006)[index % 3],
+                latitude=(39.9042, 60.1699, 40.7128)[index % 3],
+            )
+        )
+    # A DST gap and an out-of-range year become error lines in place.
+    births.insert(5, BirthInput(year=2021, month=3, day=14, hour=2, minute=30, second=0,
+                                timezone_name='America/New_York', longitude=-74.006, latitude=40.7128))
+    births.insert(17, BirthInput(utc_timestamp='1930-01-01T00:00:00Z', longitude=0.0, latitude=0.0))
+    return births
+
+
+class TestBulkRunner(unittest.TestCase):
+    def test_lines_match_serial_engine_in_input_order(self) -> None:
+        births = _births()
+        lines = compute_engine_json_lines(births, workers=1, chunk_rows=7)
+        self.assertEqual(len(lines), len(births))
+        for birth, line in zip(births, lines):
+            try:
+                expected = dumps_deterministic(compute_engine_payload(birth))
+            except ValueError as exc:
+                expected = dumps_deterministic({'error': {'type': type(exc).__name__, 'message': str(exc)}})
+            self.assertEqual(line, expected)
+        self.assertIn('NonexistentTimeError', lines[5])
+
+    def test_output_is_identical_for_any_worker_count(self) -> None:
+        births = _births()
+        serial = compute_engine_json_lines(births, workers=1)
+        self.assertEqual(compute_engine_json_lines(births, workers=2, chunk_rows=5), serial)
+
+    def test_wrong_typed_record_does_not_abort_its_chunk(self) -> None:
+        births = _births()[:4]
+        births.insert(2, BirthInput(year='1988', month=2, day=4, hour=16, minute=30, second=0,
+                                    timezone_name='Asia/Shanghai', longitude=104.066, latitude=None))
+        lines = compute_engine_json_lines(births, workers=1)
+        self.assertEqual(json.loads(lines[2])['error']['type'], 'TypeError')
+        self.assertEqual(lines[:2] + lines[3:], compute_engine_json_lines(births[:2] + births[3:], workers=1))
+
+    def test_invalid_precision_is_rejected_up_front(self) -> None:
+        with self.assertRaises(ValueError):
+            compute_engine_json_lines([], precision='exact', workers=2)
+
+
+class _LagCheckingOutput(io.StringIO):
+    def __init__(self, counter: dict) -> None:
+        super().__init__()
+        self.counter = counter
+        self.max_lag = 0
+
+    def write(self, text: str) -> int:
+        self.counter['written'] += text.count('\n')
+        self.max_lag = max(self.max_lag, self.counter['read'] - self.counter['written'])
+        return super().write(text)
+
+
+class TestBulkPipeline(unittest.TestCase):
+    def test_pipeline_bounds_read_ahead(self) -> None:
+        counter = {'read': 0, 'written': 0}
+
+        def records():
+            for index in range(120):
+                counter['read'] += 1
+                yield json.dumps({'utc_timestamp': f'1988-02-{index % 28 + 1:02d}T08:30:00Z', 'longitude': 104.066})
+
+        output = _LagCheckingOutput(counter)
+        written = run_pipeline(records(), output, workers=1, chunk_rows=2, queue_chunks=1)
+        self.assertEqual(written, 120)
+        self.assertEqual(len(output.getvalue().splitlines()), 120)
+        # Two bounded queues of one chunk each, plus the chunks held by each stage.
+        self.assertLessEqual(output.max_lag, 12)
+
+    def test_writer_failure_stops_reading_input(self) -> None:
+        class _FailingOutput(io.StringIO):
+            def write(self, text: str) -> int:
+                if self.tell() and text:
+                    raise OSError('disk full')
+                return super().write(text)
+
+        for workers in (1, 2):
+            counter = {'read': 0}
+
+            def records():
+                for index in range(2000):
+                    counter['read'] += 1
+                    yield json.dumps({'utc_timestamp': f'1988-02-{index % 28 + 1:02d}T08:30:00Z', 'longitude': 104.066})
+
+            with self.assertRaisesRegex(OSError, 'disk full'):
+                run_pipeline(records(), _FailingOutput(), workers=workers, chunk_rows=2, queue_chunks=1)
+            # The second chunk fails; only the chunks already queued or in flight are read after it.
+            self.assertLessEqual(counter['read'], 30, workers)
+
+    def test_ndjson_and_csv_records_match_bulk_lines(self) -> None:
+        births = _births()[:6]
+        expected = compute_engine_json_lines(births, workers=1)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / 'births.csv'
+            columns = ('year', 'month', 'day', 'hour', 'minute', 'second', 'timezone_name', 'longitude',
+                       'latitude', 'utc_timestamp', 'zi_convention')
+            rows = [','.join(columns)]
+            for birth in births:
+                rows.append(','.join('' if getattr(birth, name, None) is None else str(getattr(birth, name))
+                                     for name in columns[:-1]) + ',split_midnight')
+            csv_path.write_text('\n'.join(rows) + '\n', encoding='utf-8')
+            output_path = Path(tmp_dir) / 'out.ndjson'
+            self.assertEqual(main([str(csv_path), '--output', str(output_path), '--workers', '1']), 0)
+            self.assertEqual(output_path.read_text(encoding='utf-8').splitlines(), expected)
+
+        ndjson = '\n'.join(
+            json.dumps({'year': birth.year, 'month': birth.month, 'day': birth.day, 'hour': birth.hour,
+                        'minute': birth.minute, 'second': birth.second, 'timezone_name': birth.timezone_name,
+                        'longitude': birth.longitude, 'latitude': birth.latitude, 'conventions': {}})
+            for birth in births
+        )
+        output = io.StringIO()
+        run_pipeline(read_records(io.StringIO(ndjson + '\n\n'), 'ndjson'), output, workers=2, chunk_rows=4)
+        self.assertEqual(output.getvalue().splitlines(), expected)
+
+    def test_bad_records_become_error_lines(self) -> None:
+        output = io.StringIO()
+        run_pipeline(iter(['not json', '[1]', '{"year": "abc"}', '{"colour": "red"}']), output, workers=1)
+        errors = [json.loads(line)['error'] for line in output.getvalue().splitlines()]
+        self.assertEqual([error['type'] for error in errors], ['JSONDecodeError', 'ValueError', 'ValueError', 'ValueError'])
+        self.assertEqual(errors[3]['message'], 'Unknown field: colour')
+
+
+def _ndjson_records(count: int) -> list[str]:
+    return [
+        json.dumps({'utc_timestamp': f'{1950 + index % 150}-0{index % 9 + 1}-1{index % 10}T0{index % 10}:30:00Z',
+                    'longitude': (index * 7) % 360 - 180.0, 'latitude': 30.0})
+        for index in range(count)
+    ]
+
+
+class TestBulkShardsAndCheckpoints(unittest.TestCase):
+    def test_shards_partition_by_canonical_input(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_shard('3/3')
+        with self.assertRaises(ValueError):
+            parse_shard('1')
+        shards = [parse_shard(f'{index}/3') for index in range(3)]
+        for record in _ndjson_records(60):
+            self.assertEqual(sum(shard.owns(record) for shard in shards), 1)
+        # Field order, whitespace and CSV string spellings do not move a record.
+        self.assertEqual(
+            shard_hash('{"longitude": 104.066, "utc_timestamp": "1988-02-04T08:30:00Z"}'),
+            shard_hash({'utc_timestamp': '1988-02-04T08:30:00Z', 'longitude': '104.066', 'latitude': ''}),
+        )
+
+    def test_processes_as_nodes_merge_to_unsharded_output(self) -> None:
+        records = _ndjson_records(90) + ['not json']
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = Path(tmp_dir) / 'births.ndjson'
+            input_path.write_text('\n'.join(records) + '\n', encoding='utf-8')
+            shard_paths = [str(Path(tmp_dir) / f'shard-{index}.ndjson') for index in range(3)]
+            nodes = [
+                subprocess.Popen(
+                    [sys.executable, '-m', 'eight_characters.bulk', str(input_path), '--output', shard_path,
+                     '--shard', f'{index}/3', '--workers', '1', '--chunk-rows', '8'],
+                    stderr=subprocess.DEVNULL,
+                )
+                for index, shard_path in enumerate(shard_paths)
+            ]
+            self.assertEqual([node.wait() for node in nodes], [0, 0, 0])
+            merged_path = Path(tmp_dir) / 'merged.ndjson'
+            self.assertEqual(main(['--merge', *shard_paths, '--output', str(merged_path)]), 0)
+            serial = io.StringIO()
+            run_pipeline(iter(records), serial, workers=1)
+            self.assertEqual(merged_path.read_text(encoding='utf-8'), serial.getvalue())
+
+            with open(shard_paths[0], encoding='utf-8') as first, open(shard_paths[2], encoding='utf-8') as last:
+                with self.assertRaises(ValueError):
+                    merge_shard_outputs([first, last], io.StringIO())
+
+    def test_merge_rejects_short_shards(self) -> None:
+        records = _ndjson_records(30)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = Path(tmp_dir) / 'births.ndjson'
+            input_path.write_text('\n'.join(records) + '\n', encoding='utf-8')
+            shard_paths = [Path(tmp_dir) / f'shard-{index}.ndjson' for index in range(2)]
+            for index, shard_path in enumerate(shard_paths):
+                run_bulk(str(input_path), str(shard_path), 'ndjson', workers=1, shard=f'{index}/2')
+            shard_lines = [path.read_text(encoding='utf-8').splitlines(keepends=True) for path in shard_paths]
+            self.assertEqual(sum(len(lines) - 1 for lines in shard_lines), 30)
+
+            def merge(last_shard_lines: list[str]) -> None:
+                shard_paths[1].write_text(''.join(last_shard_lines), encoding='utf-8')
+                with open(shard_paths[0], encoding='utf-8') as first, open(shard_paths[1], encoding='utf-8') as last:
+                    merge_shard_outputs([first, last], io.StringIO())
+
+            merge(shard_lines[1])
+            with self.assertRaisesRegex(ValueError, 'no shard trailer'):
+                merge(shard_lines[1][:-1])
+            for short in (
+                shard_lines[1][:-1] + [shard_lines[1][-1][:-5]],
+                shard_lines[1][:-2] + shard_lines[1][-1:],
+            ):
+                with self.assertRaises(ValueError):
+                    merge(short)
+
+    def test_csv_rows_with_extra_columns_shard(self) -> None:
+        # DictReader keeps the surplus cells of a long row under a None key.
+        self.assertEqual(shard_hash({'year': '1990', None: ['x']}), shard_hash({None: ['x'], 'year': '1990'}))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = Path(tmp_dir) / 'births.csv'
+            input_path.write_text(
+                'utc_timestamp,longitude\n1988-02-04T08:30:00Z,104.066\n1990-06-01T00:00:00Z,0.0,extra\n'
+                '2001-09-09T12:00:00Z,-74.006\n',
+                encoding='utf-8',
+            )
+            shard_paths = [str(Path(tmp_dir) / f'shard-{index}.ndjson') for index in range(2)]
+            for index, shard_path in enumerate(shard_paths):
+                run_bulk(str(input_path), shard_path, 'csv', workers=1, shard=f'{index}/2')
+            merged = io.StringIO()
+            sources = [open(path, encoding='utf-8') for path in shard_paths]
+            try:
+                self.assertEqual(merge_shard_outputs(sources, merged), 3)
+            finally:
+                for source in sources:
+                    source.close()
+            self.assertEqual(json.loads(merged.getvalue().splitlines()[1])['error']['message'], 'Unknown field: None')
+
+    def test_resume_continues_from_checkpoint(self) -> None:
+        records = _ndjson_records(50)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = Path(tmp_dir) / 'births.ndjson'
+            input_path.write_text('\n'.join(records) + '\n', encoding='utf-8')
+            output = Path(tmp_dir) / 'out.ndjson'
+            checkpoint = str(Path(tmp_dir) / 'run.checkpoint')
+
+            # A run that dies on its sixth chunk, followed by a torn write past its checkpoint.
+            calls = []
+
+            def failing_record_lines(records: list, precision: str) -> list[str]:
+                calls.append(len(records))
+                if len(calls) == 6:
+                    raise RuntimeError('worker lost')
+                return _record_lines(records, precision)
+
+            with patch('eight_characters.bulk._record_lines', failing_record_lines):
+                with self.assertRaisesRegex(RuntimeError, 'worker lost'):
+                    run_bulk(str(input_path), str(output), 'ndjson', workers=1, chunk_rows=4,
+                             shard='1/2', checkpoint_path=checkpoint, checkpoint_records=8)
+            saved = read_checkpoint(checkpoint)
+            self.assertGreater(saved.next_record, 0)
+            self.assertLess(saved.next_record, 50)
+            self.assertEqual(saved.input_bytes, input_path.stat().st_size)
+            with open(output, 'a', encoding='utf-8') as handle:
+                handle.write('{"record":99,"res')
+
+            written = run_bulk(str(input_path), str(output), 'ndjson', workers=1, chunk_rows=4,
+                               shard='1/2', checkpoint_path=checkpoint, checkpoint_records=8, resume=True)
+            fresh = Path(tmp_dir) / 'fresh.ndjson'
+            self.assertEqual(run_bulk(str(input_path), str(fresh), 'ndjson', workers=1, shard='1/2'), written)
+            self.assertEqual(output.read_text(encoding='utf-8'), fresh.read_text(encoding='utf-8'))
+            self.assertEqual(read_checkpoint(checkpoint).next_record, 50)
+            with self.assertRaisesRegex(ValueError, 'shard or precision'):
+                run_bulk(str(input_path), str(output), 'ndjson', workers=1, shard='0/2',
+                         checkpoint_path=checkpoint, resume=True)
+
+            other_input = Path(tmp_dir) / 'other.ndjson'
+            other_input.write_text('\n'.join(records[:23]) + '\n', encoding='utf-8')
+            with self.assertRaisesRegex(ValueError, 'different input file'):
+                run_bulk(str(other_input), str(output), 'ndjson', workers=1, shard='1/2',
+                         checkpoint_path=checkpoint, resume=True)
+            # Same size, different bytes.
+            other_input.write_bytes(input_path.read_bytes().replace(b'"latitude": 30.0', b'"latitude": 31.0', 1))
+            with self.assertRaisesRegex(ValueError, 'different input file'):
+                run_bulk(str(other_input), str(output), 'ndjson', workers=1, shard='1/2',
+                         checkpoint_path=checkpoint, resume=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
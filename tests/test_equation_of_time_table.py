@@ -0,0 +1,108 @@
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from eight_characters.build_eot import build_equation_of_time_table
+from eight_characters.equation_of_time_table import (
+    EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES,
+    EquationOfTimeRangeError,
+    get_equation_of_time_table,
+    load_equation_of_time_table,
+    true_solar_time_from_table,
+)
+from eight_characters.output import _rounded
+from eight_characters.packed_data import PackedDataError
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.sexagenary import gregorian_to_jdn
+from eight_characters.solar_position import compute_equation_of_time_minutes, compute_solar_position_and_tst
+from eight_characters.solar_term_table import SOLAR_TERM_TABLE_PATH
+
+
+UTC = timezone.utc
+
+# Output rounds the equation of time to two decimals of a minute.
+OUTPUT_HALF_STEP_MINUTES = 0.005
+
+
+class TestEquationOfTimeTable(unittest.TestCase):
+    def test_table_covers_supported_range(self) -> None:
+        table = get_equation_of_time_table()
+        self.assertTrue(table.covers(gregorian_to_jdn(MIN_SUPPORTED_YEAR, 1, 1) - 0.5))
+        self.assertTrue(table.covers(gregorian_to_jdn(MAX_SUPPORTED_YEAR, 12, 31) + 0.499))
+        with self.assertRaises(EquationOfTimeRangeError):
+            table.equation_of_time_minutes(table.first_jd_tt)
+        with self.assertRaises(EquationOfTimeRangeError):
+            table.equation_of_time_minutes(table.last_jd_tt + 10.0)
+
+    def test_interpolation_matches_direct_pipeline_at_output_rounding(self) -> None:
+        table = get_equation_of_time_table()
+        rng = random.Random(20240204)
+        for _ in range(300):
+            jd_tt = rng.uniform(table.first_jd_tt + 1.0, table.last_jd_tt - 1.0)
+            interpolated = table.equation_of_time_minutes(jd_tt)
+            direct = compute_equation_of_time_minutes(jd_tt)
+            self.assertLessEqual(abs(interpolated - direct), EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES)
+            distance_to_rounding_edge = abs((direct * 100.0) % 1.0 - 0.5) / 100.0
+            if distance_to_rounding_edge > EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES:
+                self.assertEqual(_rounded(interpolated, 2), _rounded(direct, 2))
+        self.assertLess(EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES, OUTPUT_HALF_STEP_MINUTES)
+
+    def test_true_solar_time_matches_full_pipeline(self) -> None:
+        utc_datetime = datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC)
+        full = compute_solar_position_and_tst(utc_datetime, 104.066, 56.2)
+        lmst_dt, tst_dt, equation_of_time_minutes = true_solar_time_from_table(utc_datetime, 104.066, 56.2)
+        self.assertEqual(lmst_dt, full.local_mean_solar_time)
+        self.assertLess(abs(tst_dt - full.true_solar_time), timedelta(milliseconds=1))
+        self.assertAlmostEqual(
+            equation_of_time_minutes,
+            full.equation_of_time_minutes,
+            delta=EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES,
+        )
+
+    def test_rejects_other_kinds(self) -> None:
+        with self.assertRaises(PackedDataError):
+            load_equation_of_time_table(SOLAR_TERM_TABLE_PATH)
+
+
+class TestEquationOfTimeTableBuild(unittest.TestCase):
+    def test_build_roundtrip(self) -> None:
+        shipped = get_equation_of_time_table()
+        first_jd_tt = shipped.first_jd_tt + 1000.0
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'equation_of_time.bin'
+            max_error = build_equation_of_time_table(
+                str(target),
+                first_jd_tt=first_jd_tt,
+                last_jd_tt=first_jd_tt + 6.0,
+                workers=1,
+            )
+            table = load_equation_of_time_table(target)
+            self.assertEqual(len(table.values), 7)
+            self.assertLessEqual(max_error, EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES)
+            self.assertEqual(table.equation_of_time_minutes(first_jd_tt + 2.25), shipped.equation_of_time_minutes(first_jd_tt + 2.25))
+
+    def test_model_id_mismatch_is_rejected(self) -> None:
+        first_jd_tt = get_equation_of_time_table().first_jd_tt
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'equation_of_time.bin'
+            with patch.dict('eight_characters.equation_of_time_table.ENGINE_MODEL_IDS', {'nutation_model': 'IAU_1980'}):
+                build_equation_of_time_table(str(target), first_jd_tt=first_jd_tt, last_jd_tt=first_jd_tt + 4.0, workers=1)
+            with self.assertRaises(PackedDataError):
+                load_equation_of_time_table(target)
+
+    def test_series_data_mismatch_is_rejected(self) -> None:
+        first_jd_tt = get_equation_of_time_table().first_jd_tt
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'equation_of_time.bin'
+            older_series = {'vsop87d_earth': '0' * 64, 'iau2000a_nutation': '0' * 64}
+            with patch('eight_characters.equation_of_time_table.series_data_sha256', return_value=older_series):
+                build_equation_of_time_table(str(target), first_jd_tt=first_jd_tt, last_jd_tt=first_jd_tt + 4.0, workers=1)
+            with self.assertRaisesRegex(PackedDataError, 'VSOP87D or nutation'):
+                load_equation_of_time_table(target)
+
+
+if __name__ == '__main__':
+    unittest.main()
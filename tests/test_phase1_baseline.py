@@ -1,6 +1,8 @@
+import ast
 import unittest
 from copy import deepcopy
 from datetime import datetime
+from pathlib import Path
 
 from eight_characters.architecture import MODULE_CONTRACTS, validate_module_contracts
 from eight_characters.conventions import (
@@ -8,6 +10,7 @@ from eight_characters.conventions import (
     all_supported_convention_combinations,
 )
 from eight_characters.policy import (
+    FORBIDDEN_CALCULATION_DEPENDENCIES,
     EnginePolicy,
     decision_ids,
     route_time_conversion,
@@ -50,6 +53,19 @@ class TestPhase1Policy(unittest.TestCase):
             policy.validate_dependency_policy(['fastapi', 'scipy'])
         policy.validate_dependency_policy(['fastapi', 'jinja2'])
 
+    def test_core_modules_do_not_import_forbidden_dependencies(self) -> None:
+        # Optional accelerators live in eight_characters/extras, outside the core package modules.
+        package_dir = Path(__file__).resolve().parent.parent / 'eight_characters'
+        for module_path in sorted(package_dir.glob('*.py')):
+            tree = ast.parse(module_path.read_text(encoding='utf-8'))
+            imported = set()
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    imported.update(alias.name.split('.')[0] for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.module:
+                    imported.add(node.module.split('.')[0])
+            self.assertFalse(imported & set(FORBIDDEN_CALCULATION_DEPENDENCIES), module_path.name)
+
     def test_conversion_routing(self) -> None:
         self.assertEqual(
             route_time_conversion(datetime(1972, 1, 1)),
@@ -90,6 +106,34 @@ class TestPhase1Architecture(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_module_contracts(bad_graph)
 
+    def test_contracts_match_module_imports(self) -> None:
+        # Imports under `if TYPE_CHECKING:` are annotation-only and do not count as dependencies.
+        package_dir = Path(__file__).resolve().parent.parent / 'eight_characters'
+        for module_name, contract in MODULE_CONTRACTS.items():
+            module_path = package_dir / f'{module_name}.py'
+            if not module_path.exists():
+                continue
+            tree = ast.parse(module_path.read_text(encoding='utf-8'))
+            type_checking_nodes = set()
+            for node in ast.walk(tree):
+                if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == 'TYPE_CHECKING':
+                    type_checking_nodes.update(ast.walk(node))
+            imported = set()
+            for node in ast.walk(tree):
+                if node in type_checking_nodes:
+                    continue
+                if isinstance(node, ast.Import):
+                    names = [alias.name for alias in node.names]
+                elif isinstance(node, ast.ImportFrom) and node.module:
+                    names = [node.module]
+                else:
+                    continue
+                for name in names:
+                    parts = name.split('.')
+                    if parts[0] == 'eight_characters' and len(parts) > 1:
+                        imported.add(parts[1])
+            self.assertEqual(imported, set(contract.dependencies), module_name)
+
     def test_unknown_dependency_raises(self) -> None:
         bad_graph = deepcopy(MODULE_CONTRACTS)
         bad_graph['engine'] = bad_graph['engine'].__class__(
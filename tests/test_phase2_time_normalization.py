@@ -1,19 +1,34 @@
 import unittest
-from datetime import datetime, timezone
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from eight_characters.conventions import ConventionSettings
 from eight_characters.embedded_data import (
     DELTA_T_SEGMENTS,
+    LEAP_SECOND_OFFSETS,
     evaluate_delta_t_seconds,
     get_leap_second_offset_seconds,
 )
 from eight_characters.time_convert import (
+    LOCAL_TIME_AMBIGUOUS,
+    LOCAL_TIME_INVALID_INPUT,
+    LOCAL_TIME_NONEXISTENT,
+    LOCAL_TIME_OK,
+    LOCAL_TIME_UNKNOWN_TIMEZONE,
     AmbiguousTimeError,
     BirthInput,
     NonexistentTimeError,
+    _resolve_local_time,
     convert_utc_to_tt,
     decimal_year,
+    decimal_year_from_posix_ns,
     normalize_birth_input,
+    normalize_birth_inputs,
+    posix_ns_from_datetime_utc,
+    resolve_local_times,
+    tt_minus_utc_from_posix_ns,
+    tt_minus_utc_seconds_for_posix_ns,
 )
 
 
@@ -47,6 +62,7 @@ class TestInputAndTimeResolution(unittest.TestCase):
             )
         )
         self.assertEqual(normalized.utc_datetime, datetime(1988, 2, 4, 8, 30, tzinfo=UTC))
+        self.assertEqual(normalized.utc_posix_ns, int(normalized.utc_datetime.timestamp()) * 1_000_000_000)
         self.assertIsNone(normalized.civil_datetime_local)
 
     def test_high_latitude_warning(self) -> None:
@@ -127,6 +143,109 @@ class TestInputAndTimeResolution(unittest.TestCase):
             )
         )
         self.assertNotEqual(first.utc_datetime, second.utc_datetime)
+        self.assertEqual(second.utc_posix_ns - first.utc_posix_ns, 3600 * 1_000_000_000)
+
+
+class TestBatchLocalTimeResolution(unittest.TestCase):
+    def test_status_codes_and_row_order(self) -> None:
+        rows = [
+            ((2023, 11, 5, 1, 30, 0), 'America/New_York', 1),
+            ((2023, 3, 12, 2, 30, 0), 'America/New_York', None),
+            ((1988, 2, 4, 16, 30, 0), 'Asia/Shanghai', None),
+            ((2023, 11, 5, 1, 30, 0), 'America/New_York', None),
+            ((2023, 11, 5, 1, 30, 0), 'America/New_York', 0),
+            ((2023, 2, 30, 0, 0, 0), 'UTC', None),
+            ((1900, 1, 1, 0, 0, 0), 'UTC', None),
+            ((2023, 11, 5, 1, 30, 0), 'America/New_York', 2),
+            ((2000, 1, 1, 0, 0, 0), 'Mars/Olympus_Mons', None),
+        ]
+        batch = resolve_local_times(
+            [wall for wall, _, _ in rows],
+            [name for _, name, _ in rows],
+            [fold for _, _, fold in rows],
+        )
+        self.assertEqual(
+            [batch.status_name(row) for row in range(len(batch))],
+            [
+                LOCAL_TIME_OK,
+                LOCAL_TIME_NONEXISTENT,
+                LOCAL_TIME_OK,
+                LOCAL_TIME_AMBIGUOUS,
+                LOCAL_TIME_OK,
+                LOCAL_TIME_INVALID_INPUT,
+                LOCAL_TIME_INVALID_INPUT,
+                LOCAL_TIME_INVALID_INPUT,
+                LOCAL_TIME_UNKNOWN_TIMEZONE,
+            ],
+        )
+        for row in (0, 2, 4):
+            wall, name, fold = rows[row]
+            self.assertEqual(batch.utc_datetime(row), _resolve_local_time(*wall, name, fold))
+        self.assertIsNone(batch.utc_datetime(1))
+        self.assertEqual(batch.utc_posix_seconds[0] - batch.utc_posix_seconds[4], 3600)
+
+    def test_matches_single_resolution_for_a_zone_year(self) -> None:
+        walls = [(2024, month, day, hour, 30, 0) for month in (3, 10, 11) for day in range(1, 29) for hour in range(24)]
+        batch = resolve_local_times(walls, 'America/New_York', 0)
+        for row, wall in enumerate(walls):
+            try:
+                expected = _resolve_local_time(*wall, 'America/New_York', 0)
+            except NonexistentTimeError:
+                expected = None
+            self.assertEqual(batch.utc_datetime(row), expected, wall)
+
+    def test_per_row_arguments_must_match_length(self) -> None:
+        with self.assertRaises(ValueError):
+            resolve_local_times([(2000, 1, 1, 0, 0, 0)], ['UTC', 'UTC'])
+
+    def test_batch_normalization_matches_single_rows(self) -> None:
+        local = BirthInput(year=2023, month=11, day=5, hour=1, minute=30, second=0, timezone_name='America/New_York',
+                           longitude=-74.006, latitude=40.7128, fold=1)
+        values = [
+            local,
+            replace(local, month=6, fold=None),
+            replace(local, fold=None),
+            replace(local, fold=2),
+            replace(local, month=3, day=12, hour=2),
+            replace(local, month=3, day=12, hour=2, latitude=95.0),
+            replace(local, timezone_name='Mars/Olympus_Mons'),
+            replace(local, timezone_name=None),
+            replace(local, year='2023'),
+            replace(local, year=1900),
+            replace(local, latitude=70.0, month=2, day=30),
+            BirthInput(utc_timestamp='1988-02-04T08:30:00Z', longitude=104.066, latitude=30.658),
+        ]
+        # Only the five local rows the batch rejects after validation reach the per-row resolver,
+        # to raise their exact error.
+        with patch('eight_characters.time_convert._resolve_local_time', wraps=_resolve_local_time) as single:
+            batch = normalize_birth_inputs(values)
+        self.assertEqual(single.call_count, 5)
+        for value, result in zip(values, batch):
+            try:
+                expected = normalize_birth_input(value)
+            except (ValueError, TypeError) as exc:
+                self.assertIs(type(result), type(exc), value)
+                self.assertEqual(str(result), str(exc))
+            else:
+                self.assertEqual(result, expected)
+
+    def test_wrong_typed_rows_become_status_codes(self) -> None:
+        rows = [
+            ((2000, 1, 1, 0, 0, 0), None),
+            ((2000, 1, 1, 0, 0, 0), ''),
+            ((2000, 1, 1, 0, 0, 0), ['UTC']),
+            (('1990', 1, 1, 0, 0, 0), 'UTC'),
+            ((2000, 1, 1, 12.5, 0, 0), 'UTC'),
+            ((2000, 1, 1, 0, 0), 'UTC'),
+            (None, 'UTC'),
+            ((2000, 1, 1, 0, 0, 0), 'UTC'),
+        ]
+        batch = resolve_local_times([wall for wall, _ in rows], [name for _, name in rows])
+        self.assertEqual(
+            [batch.status_name(row) for row in range(len(batch))],
+            [LOCAL_TIME_UNKNOWN_TIMEZONE] * 3 + [LOCAL_TIME_INVALID_INPUT] * 4 + [LOCAL_TIME_OK],
+        )
+        self.assertEqual(batch.utc_datetime(7), datetime(2000, 1, 1, tzinfo=UTC))
 
 
 class TestTTConversion(unittest.TestCase):
@@ -145,6 +264,22 @@ class TestTTConversion(unittest.TestCase):
         self.assertEqual(result.conversion_method, 'delta_t')
         self.assertAlmostEqual(result.delta_t_seconds, 29.07, places=1)
 
+    def test_integer_time_lookup_matches_datetime_path(self) -> None:
+        instants = [datetime(1949, 1, 1, tzinfo=UTC) + timedelta(days=day, microseconds=day * 7919) for day in range(0, 55_000, 37)]
+        for year_value in (1949, 1960, 1961, 1971, 1972, 1986, 2005, 2050, 2100):
+            start = datetime(year_value, 1, 1, tzinfo=UTC)
+            instants.extend((start, start - timedelta(microseconds=1)))
+        for threshold, _ in LEAP_SECOND_OFFSETS:
+            instants.extend((threshold, threshold - timedelta(microseconds=1)))
+        for utc_datetime in instants:
+            posix_ns = posix_ns_from_datetime_utc(utc_datetime)
+            result = convert_utc_to_tt(utc_datetime)
+            self.assertEqual(tt_minus_utc_from_posix_ns(posix_ns), (result.tt_minus_utc_seconds, result.conversion_method))
+            if result.conversion_method == 'delta_t':
+                self.assertEqual(decimal_year_from_posix_ns(posix_ns), decimal_year(utc_datetime))
+        column = tt_minus_utc_seconds_for_posix_ns([posix_ns_from_datetime_utc(value) for value in instants[:3]])
+        self.assertEqual(list(column), [convert_utc_to_tt(value).tt_minus_utc_seconds for value in instants[:3]])
+
 
 if __name__ == '__main__':
     unittest.main()
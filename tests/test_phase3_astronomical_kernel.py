@@ -1,14 +1,39 @@
 import unittest
 from datetime import datetime, timezone
+from math import cos
 
+from eight_characters.nutation import (
+    IAU2000A_NUTATION_PATH,
+    clear_nutation_cache,
+    get_nutation_plan,
+    load_nutation_series,
+    nutation_arcseconds,
+    nutation_arcseconds_iau2000a,
+    nutation_cache_stats,
+)
 from eight_characters.obliquity import mean_obliquity_arcseconds_iau2006
+from eight_characters.packed_data import PackedDataError
 from eight_characters.solar_position import (
     J2000_JD,
     compute_apparent_solar_longitude,
     compute_solar_position_and_tst,
     julian_date_from_datetime_utc,
+    julian_date_from_posix_ns,
+    julian_date_from_posix_seconds,
+)
+from eight_characters.solar_term_table import SOLAR_TERM_TABLE_PATH
+from eight_characters.time_convert import posix_ns_from_datetime_utc
+from eight_characters.vsop87d import (
+    ALLOWED_PRECISION_TIERS,
+    PRECISION_TIERS,
+    VSOP87D_EARTH_PATH,
+    _evaluate_series,
+    _evaluate_series_with_derivatives,
+    earth_heliocentric_lbr,
+    get_earth_series,
+    load_earth_series,
+    truncation_error_bounds,
 )
-from eight_characters.vsop87d import earth_heliocentric_lbr
 
 
 UTC = timezone.utc
@@ -23,6 +48,74 @@ class TestVsop87dEvaluator(unittest.TestCase):
         self.assertLess(r_au, 1.1)
         self.assertLess(abs(b_deg), 1.0)
 
+    def test_matches_per_term_power_sum_exactly(self) -> None:
+        # The packed layout keeps the per-term evaluator's summation order, so results are bit-identical.
+        earth = get_earth_series()
+        for series in (earth.longitude, earth.latitude, earth.radius):
+            for tau in (-0.05, 0.0, 0.0263, 0.1):
+                expected = 0.0
+                for power, coefficients in enumerate(series):
+                    partial = 0.0
+                    for index in range(0, len(coefficients), 3):
+                        amplitude, phase, frequency = coefficients[index:index + 3]
+                        partial += amplitude * cos(phase + frequency * tau)
+                    expected += partial * (tau ** power)
+                self.assertEqual(_evaluate_series(series, tau), expected)
+                self.assertEqual(_evaluate_series_with_derivatives(series, tau)[0], expected)
+
+    def test_full_series_data_pack(self) -> None:
+        earth = load_earth_series(VSOP87D_EARTH_PATH)
+        self.assertEqual(
+            earth.term_counts(),
+            {
+                'L': [559, 341, 142, 22, 11, 5],
+                'B': [184, 99, 49, 11, 5],
+                'R': [526, 292, 139, 27, 10, 3],
+            },
+        )
+        self.assertAlmostEqual(earth.longitude[0][0], 1.75347045673, places=14)
+        for series in (earth.longitude, earth.latitude, earth.radius):
+            for coefficients in series:
+                amplitudes = [abs(value) for value in coefficients[::3]]
+                self.assertEqual(amplitudes, sorted(amplitudes, reverse=True))
+
+    def test_data_pack_rejects_other_kinds(self) -> None:
+        with self.assertRaises(PackedDataError):
+            load_earth_series(SOLAR_TERM_TABLE_PATH)
+
+    def test_full_series_reference_position(self) -> None:
+        # Meeus example 25.b epoch (1992-10-13.0 TD), full VSOP87D without the FK5 correction.
+        l_deg, b_deg, r_au = earth_heliocentric_lbr((2448908.5 - 2451545.0) / 365250.0)
+        self.assertAlmostEqual(l_deg, 19.907297242, places=8)
+        self.assertAlmostEqual(b_deg, -0.000206646, places=8)
+        self.assertAlmostEqual(r_au, 0.997608520, places=8)
+
+    def test_precision_tiers_respect_documented_bounds(self) -> None:
+        for precision in ALLOWED_PRECISION_TIERS:
+            tier = PRECISION_TIERS[precision]
+            bounds = truncation_error_bounds(precision)
+            self.assertLessEqual(bounds.longitude_arcseconds, tier.max_angle_error_arcseconds)
+            self.assertLessEqual(bounds.latitude_arcseconds, tier.max_angle_error_arcseconds)
+            self.assertLessEqual(bounds.radius_au, tier.max_radius_error_au)
+
+            for step in range(61):
+                tau = -0.052 + 0.154 * step / 60.0
+                reference = earth_heliocentric_lbr(tau)
+                l_deg, b_deg, r_au = earth_heliocentric_lbr(tau, precision)
+                l_error_arcseconds = abs((l_deg - reference[0] + 180.0) % 360.0 - 180.0) * 3600.0
+                self.assertLessEqual(l_error_arcseconds, bounds.longitude_arcseconds + 1e-6)
+                self.assertLessEqual(abs(b_deg - reference[1]) * 3600.0, bounds.latitude_arcseconds + 1e-6)
+                self.assertLessEqual(abs(r_au - reference[2]), bounds.radius_au + 1e-12)
+
+    def test_truncated_tiers_are_smaller(self) -> None:
+        fast = sum(sum(counts) for counts in get_earth_series('fast').term_counts().values())
+        standard = sum(sum(counts) for counts in get_earth_series('standard').term_counts().values())
+        reference = sum(sum(counts) for counts in get_earth_series('reference').term_counts().values())
+        self.assertLess(fast, standard)
+        self.assertLess(standard, reference)
+        with self.assertRaises(ValueError):
+            earth_heliocentric_lbr(0.0, 'exact')
+
 
 class TestObliquityModel(unittest.TestCase):
     def test_iau2006_mean_obliquity_at_j2000(self) -> None:
@@ -35,6 +128,23 @@ class TestSolarPositionKernel(unittest.TestCase):
         jd = julian_date_from_datetime_utc(datetime(2000, 1, 1, 12, 0, 0, tzinfo=UTC))
         self.assertAlmostEqual(jd, J2000_JD, places=6)
 
+    def test_julian_date_from_posix_time(self) -> None:
+        self.assertEqual(julian_date_from_posix_seconds(946_728_000), J2000_JD)
+        self.assertEqual(julian_date_from_posix_ns(946_728_000 * 1_000_000_000), J2000_JD)
+        for utc_datetime in (
+            datetime(1900, 3, 1, 0, 0, 0),
+            datetime(1949, 12, 31, 23, 59, 59, tzinfo=UTC),
+            datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC),
+            datetime(2100, 12, 31, 12, 0, 1, 500_000),
+        ):
+            posix_ns = posix_ns_from_datetime_utc(utc_datetime)
+            self.assertAlmostEqual(
+                julian_date_from_posix_ns(posix_ns),
+                julian_date_from_datetime_utc(utc_datetime),
+                delta=1e-9,
+            )
+        self.assertEqual(julian_date_from_posix_seconds(-1), julian_date_from_posix_ns(-1_000_000_000))
+
     def test_apparent_longitude_is_normalized(self) -> None:
         (
             lambda_apparent_deg,
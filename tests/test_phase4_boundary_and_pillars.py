@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 from eight_characters.conventions import (
     DAY_BOUNDARY_BASIS_CIVIL,
@@ -9,10 +9,20 @@ from eight_characters.conventions import (
     ZI_CONVENTION_SPLIT_MIDNIGHT,
     ZI_CONVENTION_WHOLE_ZI_23,
     ConventionSettings,
+    all_supported_convention_combinations,
+)
+from eight_characters.root_finding import (
+    EvaluationCounter,
+    brentq,
+    find_bracket,
+    newton_safeguarded,
+    symmetric_bracket,
 )
-from eight_characters.root_finding import brentq, find_bracket
 from eight_characters.sexagenary import (
+    PILLARS,
+    Pillar,
     day_pillar,
+    day_pillar_range,
     gregorian_to_jdn,
     hour_branch_index,
     hour_pillar,
@@ -39,6 +49,34 @@ class TestRootFinding(unittest.TestCase):
         root = brentq(lambda x: x - 2.0, 0.0, 5.0, xtol=1e-12)
         self.assertAlmostEqual(root, 2.0, places=9)
 
+    def test_symmetric_bracket_reuses_endpoint_values(self) -> None:
+        counted = EvaluationCounter(lambda x: x - 2.0)
+        bracket = symmetric_bracket(counted, 2.1, 0.5)
+        self.assertIsNotNone(bracket)
+        xa, xb, fa, fb = bracket
+        root = brentq(counted, xa, xb, xtol=1e-12, fa=fa, fb=fb)
+        self.assertAlmostEqual(root, 2.0, places=9)
+        self.assertEqual(counted.count, 3)
+        self.assertIsNone(symmetric_bracket(counted, 5.0, 0.5))
+
+    def test_newton_and_halley_converge(self) -> None:
+        def cubic(x: float) -> float:
+            return x ** 3 - 2.0
+
+        def cubic_with_derivatives(x: float) -> tuple[float, float, float]:
+            return x ** 3 - 2.0, 3.0 * x * x, 6.0 * x
+
+        for halley in (False, True):
+            root = newton_safeguarded(cubic_with_derivatives, cubic, 1.5, xtol=1e-12, bracket_half_width=0.5, halley=halley)
+            self.assertAlmostEqual(root, 2.0 ** (1.0 / 3.0), places=10)
+
+    def test_newton_falls_back_to_brent(self) -> None:
+        def flat_start(x: float) -> tuple[float, float, float]:
+            return x - 2.0, 0.0 if x == 1.9 else 1.0, 0.0
+
+        root = newton_safeguarded(flat_start, lambda x: x - 2.0, 1.9, xtol=1e-12, bracket_half_width=0.5)
+        self.assertAlmostEqual(root, 2.0, places=9)
+
 
 class TestBoundaryDistance(unittest.TestCase):
     def test_nearest_distance_seconds(self) -> None:
@@ -65,6 +103,51 @@ class TestYearAndMonthPillars(unittest.TestCase):
         pillar = month_pillar(lambda_apparent_deg=320.0, year_stem_idx=3)
         pillar.validate_polarity()
 
+    def test_month_branch_boundaries_are_inclusive(self) -> None:
+        self.assertEqual(month_branch_index_from_longitude(14.999999), 3)
+        self.assertEqual(month_branch_index_from_longitude(15.0), 4)
+        self.assertEqual(month_branch_index_from_longitude(345.0), 3)
+        self.assertEqual(month_branch_index_from_longitude(-16.0), 2)
+
+    def test_pillars_are_interned(self) -> None:
+        self.assertEqual(len(PILLARS), 60)
+        self.assertEqual(len(set(PILLARS)), 60)
+        for index, pillar in enumerate(PILLARS):
+            self.assertEqual(pillar.cycle_index, index)
+            self.assertEqual(pillar, Pillar(stem_idx=index % 10, branch_idx=index % 12))
+        self.assertIs(year_pillar(civil_year=1984, birth_jd_tt=1.0, lichun_jd_tt=0.0)[0], PILLARS[0])
+        self.assertIs(month_pillar(lambda_apparent_deg=320.0, year_stem_idx=3), month_pillar(320.0, 8))
+        civil_dt = datetime(2024, 2, 4, 13, 0, 0)
+        self.assertIs(
+            hour_pillar(day_stem_idx=5, civil_dt_local=civil_dt, tst_dt=civil_dt, conventions=ConventionSettings()),
+            hour_pillar(day_stem_idx=0, civil_dt_local=civil_dt, tst_dt=civil_dt, conventions=ConventionSettings()),
+        )
+
+
+class TestDayPillarRange(unittest.TestCase):
+    def test_range_matches_day_pillar(self) -> None:
+        conv = ConventionSettings(day_boundary_basis=DAY_BOUNDARY_BASIS_CIVIL)
+        start = date(1987, 11, 20)
+        day_range = day_pillar_range(start, date(1988, 3, 1))
+        self.assertEqual(len(day_range), 103)
+        self.assertEqual(day_range.cycle_indexes.typecode, 'B')
+        for row in range(len(day_range)):
+            noon = datetime.combine(start + timedelta(days=row), datetime.min.time()).replace(hour=12)
+            expected = day_pillar(noon, noon, conv)
+            self.assertEqual(day_range.jdn(row), expected.jdn)
+            self.assertIs(day_range.pillar(row), expected.pillar)
+            # Every convention maps a birth at noon on a date to that date's pillar.
+            for conventions in all_supported_convention_combinations():
+                self.assertIs(day_pillar(noon, noon, conventions).pillar, day_range.pillar(row))
+        self.assertEqual(day_range.jdn(-1), gregorian_to_jdn(1988, 3, 1))
+
+    def test_range_validation(self) -> None:
+        self.assertEqual(len(day_pillar_range(date(2000, 1, 1), date(2000, 1, 1))), 1)
+        with self.assertRaises(ValueError):
+            day_pillar_range(date(2000, 1, 2), date(2000, 1, 1))
+        with self.assertRaises(ValueError):
+            day_pillar_range(date(1948, 12, 31), date(1949, 1, 1))
+
 
 class TestDayAndHourPillars(unittest.TestCase):
     def test_jdn_anchor_dates(self) -> None:
@@ -114,6 +197,9 @@ class TestDayAndHourPillars(unittest.TestCase):
         self.assertEqual(hour_branch_index(1), 1)
         self.assertEqual(hour_branch_index(2), 1)
         self.assertEqual(hour_branch_index(21), 11)
+        for hour_value in (-1, 24):
+            with self.assertRaises(ValueError):
+                hour_branch_index(hour_value)
 
     def test_hour_pillar_uses_selected_basis(self) -> None:
         conv = ConventionSettings(
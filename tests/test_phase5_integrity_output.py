@@ -1,12 +1,17 @@
 import json
 import unittest
+from dataclasses import FrozenInstanceError, replace
+from unittest.mock import patch
 
 from eight_characters import __version__
 from eight_characters.conventions import ConventionSettings
-from eight_characters.engine import compute_engine_json, compute_engine_payload
-from eight_characters.integrity import model_uncertainty_seconds_for_year
+from eight_characters.embedded_data import ENGINE_MODEL_IDS, LEAP_SECOND_METADATA, get_engine_metadata
+from eight_characters.engine import compute_engine_json, compute_engine_payload, compute_engine_payloads
+from eight_characters.integrity import build_alternative_zi_convention, model_uncertainty_seconds_for_year
 from eight_characters.output import dumps_deterministic
-from eight_characters.time_convert import BirthInput
+from eight_characters.sexagenary import day_pillar, year_pillar
+from eight_characters.solar_position import compute_solar_position_and_tst
+from eight_characters.time_convert import BirthInput, refresh_timezone_data
 
 
 class TestIntegrityAndOutputContract(unittest.TestCase):
@@ -83,6 +88,191 @@ class TestIntegrityAndOutputContract(unittest.TestCase):
         self.assertEqual(parsed['engine']['version'], __version__)
         self.assertIn('tt_julian_date', parsed['intermediate'])
 
+    def test_payload_engine_section_comes_from_metadata_snapshot(self) -> None:
+        metadata = get_engine_metadata()
+        self.assertEqual(metadata.version, __version__)
+        self.assertEqual(dict(metadata.model_ids), ENGINE_MODEL_IDS)
+        self.assertEqual(dict(metadata.leap_second_table), LEAP_SECOND_METADATA)
+        with self.assertRaises(FrozenInstanceError):
+            metadata.tzdb_version = 'other'
+        with self.assertRaises(TypeError):
+            metadata.model_ids['nutation_model'] = 'IAU_1980'
+
+        with patch('eight_characters.embedded_data.get_tzdb_version', side_effect=AssertionError('per-request lookup')):
+            payload = compute_engine_payload(
+                BirthInput(utc_timestamp='1988-02-04T08:30:00Z', longitude=104.066, latitude=30.658)
+            )
+        self.assertEqual(payload['engine'], metadata.engine_section(payload['engine']['vsop87_precision']))
+
+    def test_refresh_hook_rereads_tzdb_version(self) -> None:
+        try:
+            with patch('eight_characters.embedded_data.get_tzdb_version', return_value='2099.9'):
+                self.assertEqual(refresh_timezone_data().tzdb_version, '2099.9')
+            payload = compute_engine_payload(
+                BirthInput(utc_timestamp='1988-02-04T08:30:00Z', longitude=104.066, latitude=30.658)
+            )
+            self.assertEqual(payload['engine']['tzdb_version'], '2099.9')
+        finally:
+            refresh_timezone_data()
+        self.assertNotEqual(get_engine_metadata().tzdb_version, '2099.9')
+
+    def test_auto_precision_upgrades_near_boundaries(self) -> None:
+        far_from_boundaries = BirthInput(
+            year=1965,
+            month=6,
+            day=21,
+            hour=12,
+            minute=0,
+            second=0,
+            timezone_name='Europe/Helsinki',
+            longitude=24.9,
+            latitude=60.2,
+        )
+        near_lichun = BirthInput(
+            year=1988,
+            month=2,
+            day=4,
+            hour=22,
+            minute=43,
+            second=0,
+            timezone_name='Asia/Shanghai',
+            longitude=104.066,
+            latitude=30.658,
+        )
+        self.assertEqual(compute_engine_payload(far_from_boundaries)['engine']['vsop87_precision'], 'fast')
+        self.assertEqual(compute_engine_payload(near_lichun)['engine']['vsop87_precision'], 'reference')
+
+    def test_explicit_precision_tier(self) -> None:
+        value = BirthInput(
+            year=1988,
+            month=2,
+            day=4,
+            hour=16,
+            minute=30,
+            second=0,
+            timezone_name='Asia/Shanghai',
+            longitude=104.066,
+            latitude=30.658,
+        )
+        fast = compute_engine_payload(value, precision='fast')
+        reference = compute_engine_payload(value, precision='reference')
+        self.assertEqual(fast['engine']['vsop87_precision'], 'fast')
+        self.assertEqual(reference['engine']['vsop87_precision'], 'reference')
+        self.assertAlmostEqual(
+            fast['intermediate']['solar_longitude_deg'],
+            reference['intermediate']['solar_longitude_deg'],
+            delta=1.0 / 3600.0,
+        )
+        with self.assertRaises(ValueError):
+            compute_engine_payload(value, precision='exact')
+
+
+class TestEngineSections(unittest.TestCase):
+    value = BirthInput(year=2024, month=6, day=1, hour=23, minute=30, second=0, timezone_name='Asia/Shanghai',
+                       longitude=116.4074, latitude=39.9042, birth_time_uncertainty_seconds=120.0)
+
+    def test_sections_match_full_payload(self) -> None:
+        full = compute_engine_payload(self.value)
+        for sections in ({'pillars'}, {'pillars', 'flags'}, {'intermediate', 'engine'}, {'input', 'meta'}):
+            payload = compute_engine_payload(self.value, sections=sections)
+            self.assertEqual(set(payload), sections)
+            for section in sections:
+                self.assertEqual(payload[section], full[section])
+            json.loads(compute_engine_json(self.value, sections=sections))
+
+    def test_pillars_only_skips_diagnostics(self) -> None:
+        alternative = patch('eight_characters.engine.build_alternative_zi_convention', wraps=build_alternative_zi_convention)
+        boundary = patch('eight_characters.engine.hour_boundary_distance_seconds', return_value=3600.0)
+        with alternative as alternative_mock, boundary as boundary_mock:
+            compute_engine_payload(self.value, sections={'pillars'})
+            alternative_mock.assert_not_called()
+            # Only the auto-precision guard measures the hour boundary.
+            self.assertEqual(boundary_mock.call_count, 1)
+            compute_engine_payload(self.value, sections={'flags'})
+            alternative_mock.assert_called_once()
+
+    def test_sections_skip_unneeded_solar_and_pillar_work(self) -> None:
+        # Half an hour from Lichun 2024, so auto precision upgrades to the reference tier.
+        near_lichun = BirthInput(utc_timestamp='2024-02-04T08:27:00Z', longitude=116.4074, latitude=39.9042)
+        for value in (self.value, near_lichun):
+            full = compute_engine_payload(value)
+            solar = patch('eight_characters.engine.compute_solar_position_and_tst', wraps=compute_solar_position_and_tst)
+            year = patch('eight_characters.engine.year_pillar', wraps=year_pillar)
+            day = patch('eight_characters.engine.day_pillar', wraps=day_pillar)
+            for sections, solar_calls, year_calls, day_calls in (
+                ({'input'}, 0, 0, 0),
+                ({'meta'}, 0, 1, 0),
+                ({'engine'}, 1, 0, 0),
+                ({'intermediate'}, 1 if value is self.value else 2, 0, 1),
+            ):
+                with solar as solar_mock, year as year_mock, day as day_mock:
+                    payload = compute_engine_payload(value, sections=sections)
+                self.assertEqual(payload, {section: full[section] for section in sections})
+                self.assertEqual((solar_mock.call_count, year_mock.call_count, day_mock.call_count),
+                                 (solar_calls, year_calls, day_calls), sections)
+        self.assertEqual(full['engine']['vsop87_precision'], 'reference')
+
+    def test_invalid_sections(self) -> None:
+        with self.assertRaises(ValueError):
+            compute_engine_payload(self.value, sections={'pillars', 'chart'})
+        with self.assertRaises(ValueError):
+            compute_engine_payload(self.value, sections=())
+        with self.assertRaises(ValueError):
+            compute_engine_payloads([self.value], sections={'chart'})
+
+
+class TestEngineBatch(unittest.TestCase):
+    def test_batch_matches_single_payloads_in_input_order(self) -> None:
+        values = [
+            BirthInput(year=2024, month=6, day=1, hour=23, minute=30, second=0, timezone_name='Asia/Shanghai',
+                       longitude=116.4074, latitude=39.9042),
+            BirthInput(year=1988, month=2, day=4, hour=16, minute=30, second=0, timezone_name='Asia/Shanghai',
+                       longitude=104.066, latitude=30.658),
+            BirthInput(year=2021, month=3, day=14, hour=2, minute=30, second=0, timezone_name='America/New_York',
+                       longitude=-74.006, latitude=40.7128),
+            BirthInput(utc_timestamp='1988-02-04T08:30:00Z', longitude=104.066, latitude=30.658),
+            BirthInput(year=1988, month=7, day=4, hour=9, minute=0, second=0, timezone_name='Europe/Helsinki',
+                       longitude=24.9384, latitude=60.1699, birth_time_uncertainty_seconds=600.0),
+            BirthInput(year=1940, month=1, day=1, hour=0, minute=0, second=0, timezone_name='Asia/Shanghai',
+                       longitude=116.4074, latitude=39.9042),
+        ]
+        payloads = compute_engine_payloads(iter(values))
+        self.assertEqual(len(payloads), len(values))
+        for value, payload in zip(values, payloads):
+            try:
+                expected = compute_engine_payload(value)
+            except ValueError as exc:
+                self.assertEqual(payload, {'error': {'type': type(exc).__name__, 'message': str(exc)}})
+            else:
+                self.assertEqual(dumps_deterministic(payload), dumps_deterministic(expected))
+        self.assertEqual(payloads[2]['error']['type'], 'NonexistentTimeError')
+        self.assertEqual(compute_engine_payloads(values[:2], sections={'pillars'}), [
+            {'pillars': payload['pillars']} for payload in compute_engine_payloads(values[:2])
+        ])
+        self.assertEqual(payloads[5]['error']['message'], 'Date out of supported range (1949-2100).')
+
+    def test_batch_turns_wrong_typed_fields_into_errors(self) -> None:
+        valid = BirthInput(year=1988, month=2, day=4, hour=16, minute=30, second=0, timezone_name='Asia/Shanghai',
+                           longitude=104.066, latitude=30.658)
+        values = [
+            replace(valid, latitude=None),
+            replace(valid, year='1988'),
+            replace(valid, timezone_name=8),
+            valid,
+            BirthInput(utc_timestamp=19880204, longitude=104.066, latitude=30.658),
+        ]
+        payloads = compute_engine_payloads(values)
+        self.assertEqual(
+            [payload.get('error', {}).get('type') for payload in payloads],
+            ['TypeError', 'TypeError', 'TypeError', None, 'AttributeError'],
+        )
+        self.assertEqual(dumps_deterministic(payloads[3]), dumps_deterministic(compute_engine_payload(valid)))
+
+    def test_batch_rejects_invalid_precision(self) -> None:
+        with self.assertRaises(ValueError):
+            compute_engine_payloads([], precision='exact')
+        self.assertEqual(compute_engine_payloads([]), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 from pathlib import Path
 
@@ -24,6 +25,13 @@ class TestVerificationHarness(unittest.TestCase):
             )
         )
         fixture_path = Path('tests') / 'fixtures' / 'phase5-regression-1988-02-04.json'
+        # The committed fixture must already match; only the engine section (package and
+        # tzdb versions) depends on the installed environment.
+        committed = json.loads(fixture_path.read_text(encoding='utf-8'))
+        computed = json.loads(payload_json)
+        committed.pop('engine')
+        computed.pop('engine')
+        self.assertEqual(committed, computed)
         self.assertTrue(fixture_roundtrip_matches(str(fixture_path), payload_json))
 
 
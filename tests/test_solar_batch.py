@@ -0,0 +1,131 @@
+import importlib.util
+import unittest
+from array import array
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from eight_characters.equation_of_time_table import EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES
+from eight_characters.solar_batch import (
+    SOLAR_POSITION_COLUMNS,
+    compute_solar_position_columns,
+    compute_true_solar_time_columns,
+    julian_dates_tt_from_posix_ns,
+)
+from eight_characters.solar_ephemeris import EPHEMERIS_CHEBYSHEV, get_solar_ephemeris
+from eight_characters.time_convert import convert_utc_to_tt
+from eight_characters.solar_position import (
+    equation_of_time_minutes_for_position,
+    compute_solar_position_and_tst,
+    julian_date_from_datetime_utc,
+    julian_date_from_posix_ns,
+)
+
+
+UTC = timezone.utc
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+JD_TT_VALUES = array('d', (2433000.5 + index * 173.37 for index in range(40)))
+LONGITUDES = [index * 9.0 - 180.0 for index in range(40)]
+
+
+class TestSolarPositionColumns(unittest.TestCase):
+    def test_matches_single_instant_pipeline(self) -> None:
+        utc_datetime = datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC)
+        single = compute_solar_position_and_tst(utc_datetime, 104.066, 56.2)
+        columns = compute_solar_position_columns([single.jd_tt], 104.066, 56.2)
+
+        self.assertEqual(len(columns), 1)
+        self.assertEqual(columns.lambda_apparent_deg[0], single.lambda_apparent_deg)
+        self.assertEqual(columns.epsilon_radians[0], single.epsilon_radians)
+        self.assertEqual(columns.equation_of_time_minutes[0], single.equation_of_time_minutes)
+        self.assertAlmostEqual(
+            columns.true_solar_jd[0],
+            julian_date_from_datetime_utc(single.true_solar_time),
+            delta=1e-9,  # float64 JD resolution is about 40 microseconds
+        )
+
+    def test_posix_ns_column_matches_single_instant_pipeline(self) -> None:
+        utc_datetime = datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC)
+        single = compute_solar_position_and_tst(utc_datetime, 104.066, 56.2)
+        posix_ns = int(utc_datetime.timestamp()) * 1_000_000_000
+        jd_tt_column = julian_dates_tt_from_posix_ns([posix_ns, posix_ns + 1], 56.2)
+        self.assertEqual(jd_tt_column[0], single.jd_tt)
+        self.assertEqual(jd_tt_column[1], julian_date_from_posix_ns(posix_ns + 1) + 56.2 / 86400.0)
+        with self.assertRaises(ValueError):
+            julian_dates_tt_from_posix_ns(iter([posix_ns]), [56.2, 56.2])
+
+    def test_posix_ns_column_defaults_to_engine_tt_minus_utc(self) -> None:
+        utc_datetime = datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC)
+        tt_minus_utc = convert_utc_to_tt(utc_datetime).tt_minus_utc_seconds
+        single = compute_solar_position_and_tst(utc_datetime, 104.066, tt_minus_utc)
+        jd_tt_column = julian_dates_tt_from_posix_ns([int(utc_datetime.timestamp()) * 1_000_000_000])
+        self.assertEqual(jd_tt_column[0], single.jd_tt)
+
+    def test_columns_are_float64_arrays(self) -> None:
+        columns = compute_solar_position_columns(JD_TT_VALUES, LONGITUDES, 60.0, precision='fast')
+        self.assertEqual(tuple(columns.columns()), SOLAR_POSITION_COLUMNS)
+        for name, column in columns.columns().items():
+            self.assertIsInstance(column, array, name)
+            self.assertEqual(column.typecode, 'd', name)
+            self.assertEqual(len(column), len(JD_TT_VALUES), name)
+        self.assertEqual(columns.precision, 'fast')
+
+    def test_per_instant_inputs_must_match_length(self) -> None:
+        with self.assertRaises(ValueError):
+            compute_solar_position_columns(JD_TT_VALUES, LONGITUDES[:-1])
+
+    def test_accepts_ephemeris_backend(self) -> None:
+        ephemeris = get_solar_ephemeris(EPHEMERIS_CHEBYSHEV)
+        fitted = compute_solar_position_columns(JD_TT_VALUES, LONGITUDES, ephemeris=ephemeris)
+        direct = compute_solar_position_columns(JD_TT_VALUES, LONGITUDES)
+        self.assertEqual(fitted.precision, EPHEMERIS_CHEBYSHEV)
+        for fitted_value, direct_value in zip(fitted.equation_of_time_minutes, direct.equation_of_time_minutes):
+            self.assertAlmostEqual(fitted_value, direct_value, delta=1e-6)
+
+    def test_true_solar_time_columns_skip_the_series(self) -> None:
+        direct = compute_solar_position_columns(JD_TT_VALUES, LONGITUDES, 60.0)
+        with patch('eight_characters.solar_position.earth_heliocentric_lbr', side_effect=AssertionError('VSOP87D')):
+            tabled = compute_true_solar_time_columns(JD_TT_VALUES, LONGITUDES, 60.0)
+        self.assertEqual(len(tabled), len(JD_TT_VALUES))
+        self.assertEqual(tabled.local_mean_solar_jd, direct.local_mean_solar_jd)
+        for tabled_value, direct_value in zip(tabled.equation_of_time_minutes, direct.equation_of_time_minutes):
+            self.assertAlmostEqual(tabled_value, direct_value, delta=EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES)
+        for tabled_value, direct_value in zip(tabled.true_solar_jd, direct.true_solar_jd):
+            self.assertAlmostEqual(tabled_value, direct_value, delta=EQUATION_OF_TIME_TABLE_MAX_ERROR_MINUTES / 1440.0 + 1e-9)
+
+
+@unittest.skipUnless(HAS_NUMPY, 'numpy is not installed')
+class TestNumpySolarPositionColumns(unittest.TestCase):
+    def test_matches_pure_python_columns(self) -> None:
+        from eight_characters.extras.numpy_solar import compute_solar_position_columns as numpy_columns
+
+        for precision in ('fast', 'reference'):
+            expected = compute_solar_position_columns(JD_TT_VALUES, LONGITUDES, 60.0, precision=precision)
+            actual = numpy_columns(JD_TT_VALUES, LONGITUDES, 60.0, precision=precision)
+            self.assertEqual(actual.precision, precision)
+            for name in SOLAR_POSITION_COLUMNS:
+                for actual_value, expected_value in zip(getattr(actual, name), getattr(expected, name)):
+                    self.assertAlmostEqual(actual_value, expected_value, delta=1e-8, msg=name)
+
+    def test_equation_of_time_matches_scalar_formula(self) -> None:
+        import numpy as np
+
+        from eight_characters.extras.numpy_solar import equation_of_time_minutes
+
+        # Longitudes on both sides of 0/360 exercise the right-ascension and EoT wrapping.
+        rows = [
+            (lambda_deg, beta_deg, 0.983 + index * 1e-4, -17.2 + index * 0.3, 0.40909 + index * 1e-6, t_centuries)
+            for index, (lambda_deg, beta_deg, t_centuries) in enumerate(
+                (lambda_deg, beta_deg, t_centuries)
+                for lambda_deg in (0.0, 0.004, 89.9, 180.0, 270.1, 359.996)
+                for beta_deg in (-0.0002, 0.0, 0.0002)
+                for t_centuries in (-0.5, 0.0, 0.99)
+            )
+        ]
+        actual = equation_of_time_minutes(*(np.array(column) for column in zip(*rows)))
+        for actual_value, row in zip(actual, rows):
+            self.assertAlmostEqual(actual_value, equation_of_time_minutes_for_position(*row), delta=1e-11)
+
+
+if __name__ == '__main__':
+    unittest.main()
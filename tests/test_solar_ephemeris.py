@@ -0,0 +1,123 @@
+import random
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from eight_characters.build_ephemeris import build_solar_ephemeris
+from eight_characters.packed_data import PackedDataError
+from eight_characters.solar_ephemeris import (
+    EPHEMERIS_CHEBYSHEV,
+    EPHEMERIS_ERROR_BOUNDS,
+    EPHEMERIS_QUANTITIES,
+    EPHEMERIS_SERIES,
+    EphemerisRangeError,
+    get_chebyshev_ephemeris,
+    get_solar_ephemeris,
+    load_solar_ephemeris,
+)
+from eight_characters.solar_position import compute_apparent_solar_longitude, compute_solar_position_and_tst
+
+
+UTC = timezone.utc
+
+
+def _deviations(fitted: tuple, direct: tuple) -> list[float]:
+    errors = [abs((fitted[0] - direct[0] + 180.0) % 360.0 - 180.0)]
+    errors.extend(abs(fitted[index] - direct[index]) for index in range(1, len(EPHEMERIS_QUANTITIES)))
+    return errors
+
+
+class TestChebyshevEphemeris(unittest.TestCase):
+    def test_matches_series_pipeline_within_bounds(self) -> None:
+        ephemeris = get_chebyshev_ephemeris()
+        rng = random.Random(20240204)
+        for _ in range(60):
+            jd_tt = rng.uniform(ephemeris.first_jd_tt, ephemeris.last_jd_tt)
+            errors = _deviations(ephemeris.apparent_position(jd_tt), compute_apparent_solar_longitude(jd_tt))
+            for quantity, error in zip(EPHEMERIS_QUANTITIES, errors):
+                self.assertLessEqual(error, EPHEMERIS_ERROR_BOUNDS[quantity], quantity)
+
+    def test_longitude_wraps_at_vernal_equinox(self) -> None:
+        ephemeris = get_chebyshev_ephemeris()
+        equinox_jd_tt = 2451623.81  # 2000-03-20, apparent longitude crosses 0 degrees
+        for offset_days in (-0.5, -0.01, 0.01, 0.5):
+            jd_tt = equinox_jd_tt + offset_days
+            fitted = ephemeris.apparent_position(jd_tt)
+            self.assertGreaterEqual(fitted[0], 0.0)
+            self.assertLess(fitted[0], 360.0)
+            self.assertLessEqual(
+                _deviations(fitted, compute_apparent_solar_longitude(jd_tt))[0],
+                EPHEMERIS_ERROR_BOUNDS['lambda_apparent_deg'],
+            )
+
+    def test_out_of_range_is_rejected(self) -> None:
+        ephemeris = get_chebyshev_ephemeris()
+        with self.assertRaises(EphemerisRangeError):
+            ephemeris.apparent_position(ephemeris.first_jd_tt - 1.0)
+        with self.assertRaises(EphemerisRangeError):
+            ephemeris.apparent_position(ephemeris.last_jd_tt + 1.0)
+
+    def test_backend_selection(self) -> None:
+        self.assertEqual(get_solar_ephemeris().name, EPHEMERIS_SERIES)
+        self.assertEqual(get_solar_ephemeris(EPHEMERIS_CHEBYSHEV).name, EPHEMERIS_CHEBYSHEV)
+        with self.assertRaises(ValueError):
+            get_solar_ephemeris('de440')
+
+    def test_solar_position_accepts_ephemeris_backend(self) -> None:
+        utc_datetime = datetime(1988, 2, 4, 8, 30, 0, tzinfo=UTC)
+        direct = compute_solar_position_and_tst(utc_datetime, 104.066, 56.2)
+        fitted = compute_solar_position_and_tst(
+            utc_datetime,
+            104.066,
+            56.2,
+            ephemeris=get_solar_ephemeris(EPHEMERIS_CHEBYSHEV),
+        )
+        self.assertEqual(fitted.precision, EPHEMERIS_CHEBYSHEV)
+        self.assertAlmostEqual(fitted.lambda_apparent_deg, direct.lambda_apparent_deg, delta=1e-7)
+        self.assertAlmostEqual(fitted.equation_of_time_minutes, direct.equation_of_time_minutes, delta=1e-6)
+
+
+class TestChebyshevEphemerisBuild(unittest.TestCase):
+    def test_build_roundtrip(self) -> None:
+        shipped = get_chebyshev_ephemeris()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'ephemeris.bin'
+            first_jd_tt = shipped.first_jd_tt + 100 * shipped.segment_days
+            max_errors = build_solar_ephemeris(
+                str(target),
+                first_jd_tt=first_jd_tt,
+                last_jd_tt=first_jd_tt + 2 * shipped.segment_days,
+                workers=1,
+            )
+            ephemeris = load_solar_ephemeris(target)
+            self.assertEqual(ephemeris.segment_count, 2)
+            for quantity in EPHEMERIS_QUANTITIES:
+                self.assertLessEqual(max_errors[quantity], EPHEMERIS_ERROR_BOUNDS[quantity])
+            jd_tt = first_jd_tt + 5.25
+            self.assertEqual(ephemeris.apparent_position(jd_tt), shipped.apparent_position(jd_tt))
+
+    def test_model_id_mismatch_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'ephemeris.bin'
+            first_jd_tt = get_chebyshev_ephemeris().first_jd_tt
+            other_models = {'nutation_model': 'IAU_1980'}
+            with patch.dict('eight_characters.solar_ephemeris.ENGINE_MODEL_IDS', other_models):
+                build_solar_ephemeris(str(target), first_jd_tt=first_jd_tt, last_jd_tt=first_jd_tt + 1.0, workers=1)
+            with self.assertRaises(PackedDataError):
+                load_solar_ephemeris(target)
+
+    def test_series_data_mismatch_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'ephemeris.bin'
+            first_jd_tt = get_chebyshev_ephemeris().first_jd_tt
+            older_series = {'vsop87d_earth': '0' * 64, 'iau2000a_nutation': '0' * 64}
+            with patch('eight_characters.solar_ephemeris.series_data_sha256', return_value=older_series):
+                build_solar_ephemeris(str(target), first_jd_tt=first_jd_tt, last_jd_tt=first_jd_tt + 1.0, workers=1)
+            with self.assertRaisesRegex(PackedDataError, 'VSOP87D or nutation'):
+                load_solar_ephemeris(target)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from eight_characters.caching import BoundedLRUCache
+from eight_characters.build_terms import build_solar_term_table, check_solar_term_table
+from eight_characters.packed_data import PackedDataError
+
+from eight_characters.policy import MAX_SUPPORTED_YEAR, MIN_SUPPORTED_YEAR
+from eight_characters.solar_term_solver import (
+    METHOD_BRENT,
+    METHOD_HALLEY,
+    METHOD_NEWTON,
+    SEEDING_ANALYTIC,
+    SEEDING_SCAN,
+    clear_solar_term_cache,
+    find_solar_term,
+    lichun_jd_tt_for_civil_year,
+    predict_solar_term_jd_tt,
+    seed_jd_tt_for_term,
+    solar_term_cache_stats,
+    solar_term_jd_tt,
+    solve_solar_term,
+    solve_solar_term_detailed,
+)
+from eight_characters.solar_position import (
+    compute_apparent_solar_longitude,
+    compute_apparent_solar_longitude_and_rates,
+)
+from eight_characters.solar_term_table import (
+    TERMS_PER_YEAR,
+    SOLAR_TERM_TABLE_PATH,
+    get_solar_term_table,
+    load_solar_term_table,
+    term_longitude_for_slot,
+    term_slot_for_longitude,
+)
+
+
+class TestSolarTermTable(unittest.TestCase):
+    def test_table_covers_supported_range_with_padding(self) -> None:
+        table = get_solar_term_table()
+        self.assertLessEqual(table.first_year, MIN_SUPPORTED_YEAR - 1)
+        self.assertGreaterEqual(table.last_year, MAX_SUPPORTED_YEAR + 1)
+        self.assertEqual(
+            len(table.term_jd_tt),
+            (table.last_year - table.first_year + 1) * TERMS_PER_YEAR,
+        )
+
+    def test_slot_mapping_roundtrip(self) -> None:
+        for slot in range(TERMS_PER_YEAR):
+            self.assertEqual(term_slot_for_longitude(term_longitude_for_slot(slot)), slot)
+        self.assertEqual(term_slot_for_longitude(285.0), 0)
+        self.assertEqual(term_slot_for_longitude(315.0), 2)
+        self.assertIsNone(term_slot_for_longitude(316.0))
+
+    def test_table_matches_live_solver(self) -> None:
+        table = get_solar_term_table()
+        for year_value in (1949, 1972, 1988, 2024, 2100):
+            for target in (285.0, 315.0, 45.0, 165.0, 270.0):
+                table_jd = table.term_jd_tt_for_year(year_value, target)
+                live_jd = solve_solar_term(target, table_jd + 2.0, tolerance_seconds=0.001)
+                self.assertLess(abs(table_jd - live_jd) * 86400.0, 0.01)
+
+    def test_nearest_lookup_by_seed(self) -> None:
+        table = get_solar_term_table()
+        lichun_2024 = table.term_jd_tt_for_year(2024, 315.0)
+        self.assertEqual(table.nearest_term_jd_tt(315.0, lichun_2024 - 100.0), lichun_2024)
+        self.assertEqual(table.nearest_term_jd_tt(315.0, lichun_2024 + 100.0), lichun_2024)
+        self.assertIsNone(table.nearest_term_jd_tt(316.0, lichun_2024))
+
+    def test_lookup_outside_coverage_returns_none(self) -> None:
+        table = get_solar_term_table()
+        first_jd = table.term_jd_tt[0]
+        self.assertIsNone(table.nearest_term_jd_tt(285.0, first_jd - 365.0))
+        self.assertIsNone(table.term_jd_tt_for_year(table.first_year - 1, 285.0))
+
+    def test_find_solar_term_prefers_table(self) -> None:
+        table = get_solar_term_table()
+        lichun_1988 = table.term_jd_tt_for_year(1988, 315.0)
+        self.assertEqual(lichun_jd_tt_for_civil_year(1988), lichun_1988)
+        self.assertEqual(find_solar_term(315.0, lichun_1988 - 1.0), lichun_1988)
+        live_jd = find_solar_term(315.0, lichun_1988 - 1.0, use_table=False)
+        self.assertLess(abs(live_jd - lichun_1988) * 86400.0, 0.02)
+
+
+class TestSolarTermTableBuild(unittest.TestCase):
+    def test_build_and_check_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'terms.bin'
+            build_solar_term_table(str(target), first_year=1988, last_year=1989, workers=1)
+            table = load_solar_term_table(target)
+            self.assertEqual((table.first_year, table.last_year), (1988, 1989))
+            shipped = get_solar_term_table()
+            self.assertLess(
+                abs(table.term_jd_tt_for_year(1988, 315.0) - shipped.term_jd_tt_for_year(1988, 315.0)) * 86400.0,
+                0.01,
+            )
+            self.assertLess(check_solar_term_table(str(target), workers=1), 0.01)
+
+    def test_corrupt_payload_is_rejected(self) -> None:
+        raw = bytearray(SOLAR_TERM_TABLE_PATH.read_bytes())
+        raw[-1] ^= 0xFF
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'terms.bin'
+            target.write_bytes(bytes(raw))
+            with self.assertRaises(PackedDataError):
+                load_solar_term_table(target)
+
+    def test_model_id_mismatch_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'terms.bin'
+            other_models = {'vsop87_series': 'VSOP87D_truncated'}
+            with patch.dict('eight_characters.solar_term_table.ENGINE_MODEL_IDS', other_models):
+                build_solar_term_table(str(target), first_year=2000, last_year=2000, workers=1)
+            with self.assertRaises(PackedDataError):
+                load_solar_term_table(target)
+
+    def test_series_data_mismatch_is_rejected(self) -> None:
+        # A replaced VSOP87D pack leaves the model ids unchanged but must still invalidate the table.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / 'terms.bin'
+            older_series = {'vsop87d_earth': '0' * 64, 'iau2000a_nutation': '0' * 64}
+            with patch('eight_characters.solar_term_table.series_data_sha256', return_value=older_series):
+                build_solar_term_table(str(target), first_year=2000, last_year=2000, workers=1)
+            with self.assertRaisesRegex(PackedDataError, 'VSOP87D or nutation'):
+                load_solar_term_table(target)
+
+
+class TestSolarTermCache(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_solar_term_cache()
+
+    def tearDown(self) -> None:
+        clear_solar_term_cache()
+
+    def test_repeat_year_is_a_cache_hit(self) -> None:
+        first = solar_term_jd_tt(1988, 315.0)
+        second = lichun_jd_tt_for_civil_year(1988)
+        self.assertEqual(first, second)
+        stats = solar_term_cache_stats()
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.size, 1)
+
+    def test_seed_lands_near_every_term(self) -> None:
+        table = get_solar_term_table()
+        for slot in range(TERMS_PER_YEAR):
+            target = term_longitude_for_slot(slot)
+            for year_value in (1949, 2024, 2100):
+                seed = seed_jd_tt_for_term(year_value, target)
+                self.assertLess(abs(seed - table.term_jd_tt_for_year(year_value, target)), 4.0)
+        with self.assertRaises(ValueError):
+            seed_jd_tt_for_term(2024, 316.0)
+
+
+class TestAnalyticSeeding(unittest.TestCase):
+    def test_predictor_lands_within_minutes(self) -> None:
+        table = get_solar_term_table()
+        for year_value in range(1949, 2101, 13):
+            for slot in range(TERMS_PER_YEAR):
+                target = term_longitude_for_slot(slot)
+                expected = table.term_jd_tt_for_year(year_value, target)
+                predicted = predict_solar_term_jd_tt(target, seed_jd_tt_for_term(year_value, target))
+                self.assertLess(abs(predicted - expected) * 1440.0, 20.0)
+
+    def test_analytic_seeding_at_least_halves_evaluations(self) -> None:
+        scan_total = 0
+        analytic_total = 0
+        for year_value in (1950, 1988, 2024, 2099):
+            for target in (285.0, 315.0, 15.0, 105.0, 195.0):
+                seed = seed_jd_tt_for_term(year_value, target)
+                scan = solve_solar_term_detailed(target, seed, seeding=SEEDING_SCAN)
+                analytic = solve_solar_term_detailed(target, seed, seeding=SEEDING_ANALYTIC)
+                self.assertLess(abs(scan.jd_tt - analytic.jd_tt) * 86400.0, 0.02)
+                scan_total += scan.function_evaluations
+                analytic_total += analytic.function_evaluations
+        self.assertLessEqual(2 * analytic_total, scan_total)
+
+    def test_invalid_seeding_mode_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            solve_solar_term_detailed(315.0, 2447196.0, seeding='guess')
+        with self.assertRaises(ValueError):
+            solve_solar_term_detailed(315.0, 2447196.0, method='secant')
+
+
+class TestDerivativeSolvers(unittest.TestCase):
+    def test_longitude_and_rates_single_pass_matches_full_pipeline(self) -> None:
+        step_days = 0.01
+        for jd_tt in (2433282.5, 2447196.3, 2460345.7, 2488069.5):
+            lam, rate, acceleration = compute_apparent_solar_longitude_and_rates(jd_tt)
+            self.assertAlmostEqual(lam, compute_apparent_solar_longitude(jd_tt)[0], places=9)
+            before = compute_apparent_solar_longitude_and_rates(jd_tt - step_days)
+            after = compute_apparent_solar_longitude_and_rates(jd_tt + step_days)
+            central_rate = ((after[0] - before[0] + 180.0) % 360.0 - 180.0) / (2.0 * step_days)
+            self.assertAlmostEqual(rate, central_rate, delta=1e-4 * rate)
+            self.assertAlmostEqual(acceleration, (after[1] - before[1]) / (2.0 * step_days), delta=1e-6)
+
+    def test_newton_and_halley_match_brent(self) -> None:
+        for year_value in (1949, 1988, 2050, 2100):
+            for target in (285.0, 315.0, 75.0, 255.0):
+                seed = seed_jd_tt_for_term(year_value, target)
+                brent = solve_solar_term_detailed(target, seed, tolerance_seconds=0.001, method=METHOD_BRENT)
+                for method in (METHOD_NEWTON, METHOD_HALLEY):
+                    result = solve_solar_term_detailed(target, seed, tolerance_seconds=0.001, method=method)
+                    self.assertEqual(result.method, method)
+                    self.assertLess(abs(result.jd_tt - brent.jd_tt) * 86400.0, 0.002)
+                    self.assertLessEqual(result.function_evaluations, brent.function_evaluations)
+
+    def test_find_solar_term_selects_method(self) -> None:
+        table = get_solar_term_table()
+        expected = table.term_jd_tt_for_year(2024, 315.0)
+        live = find_solar_term(315.0, expected - 1.0, use_table=False, method=METHOD_NEWTON)
+        self.assertLess(abs(live - expected) * 86400.0, 0.01)
+
+
+class TestBoundedLRUCache(unittest.TestCase):
+    def test_eviction_order_and_counters(self) -> None:
+        cache: BoundedLRUCache[int] = BoundedLRUCache(max_size=2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: 99)
+        cache.get_or_compute('c', lambda: 3)
+        self.assertEqual(cache.get_or_compute('a', lambda: 99), 1)
+        self.assertEqual(cache.get_or_compute('b', lambda: 20), 20)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 4, 2))
+        self.assertEqual(stats.size, 2)
+
+    def test_concurrent_access_keeps_counters_consistent(self) -> None:
+        cache: BoundedLRUCache[int] = BoundedLRUCache(max_size=8)
+
+        def worker(key: int) -> int:
+            return cache.get_or_compute(key % 16, lambda: key % 16)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(worker, range(2000)))
+        self.assertEqual(results, [key % 16 for key in range(2000)])
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 2000)
+        self.assertLessEqual(stats.size, 8)
+
+    def test_rejects_non_positive_size(self) -> None:
+        with self.assertRaises(ValueError):
+            BoundedLRUCache(max_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from eight_characters.time_convert import (
+    AmbiguousTimeError,
+    NonexistentTimeError,
+    _resolve_local_time,
+)
+from eight_characters.timezone_index import (
+    clear_timezone_index_cache,
+    get_timezone_index,
+    timezone_index_cache_stats,
+)
+
+
+UTC = timezone.utc
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+# Northern and southern DST, negative DST (Dublin), 30-minute DST (Lord Howe),
+# sub-minute LMT offsets (Shanghai) and a skipped calendar day (Apia).
+ZONES = (
+    'America/New_York',
+    'America/Sao_Paulo',
+    'Europe/Dublin',
+    'Australia/Lord_Howe',
+    'Asia/Shanghai',
+    'Pacific/Apia',
+)
+
+
+def _zoneinfo_round_trip(wall: datetime, key: str, fold: int | None) -> datetime | str:
+    tz = ZoneInfo(key)
+    utc0 = wall.replace(tzinfo=tz, fold=0).astimezone(UTC)
+    utc1 = wall.replace(tzinfo=tz, fold=1).astimezone(UTC)
+    round0 = utc0.astimezone(tz)
+    round1 = utc1.astimezone(tz)
+    matches0 = round0.replace(tzinfo=None) == wall and round0.fold == 0
+    matches1 = round1.replace(tzinfo=None) == wall and round1.fold == 1
+    if not matches0 and not matches1:
+        return 'nonexistent'
+    if matches0 and matches1 and utc0 != utc1:
+        if fold is None:
+            return 'ambiguous'
+        return utc0 if fold == 0 else utc1
+    return utc0 if matches0 else utc1
+
+
+def _indexed(wall: datetime, key: str, fold: int | None) -> datetime | str:
+    try:
+        return _resolve_local_time(wall.year, wall.month, wall.day, wall.hour, wall.minute, wall.second, key, fold)
+    except NonexistentTimeError:
+        return 'nonexistent'
+    except AmbiguousTimeError:
+        return 'ambiguous'
+
+
+class TestTimezoneIndex(unittest.TestCase):
+    def test_matches_zoneinfo_round_trip_around_every_transition(self) -> None:
+        for key in ZONES:
+            index = get_timezone_index(key)
+            for transition, before, after in zip(index.transitions_utc, index.offsets, index.offsets[1:]):
+                for wall_seconds in (transition + before, transition + after):
+                    for delta in (-3601, -1, 0, 1, 1799, 3599, 3600):
+                        wall = UNIX_EPOCH + timedelta(seconds=wall_seconds + delta)
+                        if not 1900 <= wall.year <= 2100:
+                            continue
+                        for fold in (None, 0, 1):
+                            self.assertEqual(
+                                _indexed(wall, key, fold),
+                                _zoneinfo_round_trip(wall, key, fold),
+                                f'{key} {wall} fold={fold}',
+                            )
+
+    def test_footer_rules_cover_supported_range(self) -> None:
+        index = get_timezone_index('America/New_York')
+        last_transition = UNIX_EPOCH + timedelta(seconds=index.transitions_utc[-1])
+        self.assertEqual(last_transition.year, 2101)
+        with self.assertRaises(NonexistentTimeError):
+            _resolve_local_time(2099, 3, 8, 2, 30, 0, 'America/New_York', None)
+        first = _resolve_local_time(2099, 11, 1, 1, 30, 0, 'America/New_York', 0)
+        second = _resolve_local_time(2099, 11, 1, 1, 30, 0, 'America/New_York', 1)
+        self.assertEqual(second - first, timedelta(hours=1))
+
+    def test_unknown_zone_and_cache(self) -> None:
+        clear_timezone_index_cache()
+        with self.assertRaises(ValueError):
+            get_timezone_index('Mars/Olympus_Mons')
+        get_timezone_index('Asia/Shanghai')
+        get_timezone_index('Asia/Shanghai')
+        stats = timezone_index_cache_stats()
+        self.assertEqual((stats.hits, stats.size), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()